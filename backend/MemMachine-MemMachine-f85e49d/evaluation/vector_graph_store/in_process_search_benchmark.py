@@ -0,0 +1,130 @@
+"""
+Benchmark in-process exact similarity search on the Neo4j vector graph store.
+
+Loads nodes with random embeddings into Neo4j, then runs the same exact
+similarity searches in Neo4j and against the in-process embedding cache, and
+prints the latency of each, the initial cache load time and the overlap of
+the results.
+
+Usage:
+    python in_process_search_benchmark.py \\
+        --uri bolt://localhost:7687 --username neo4j --password password \\
+        --nodes 5000 --dimensions 1536
+
+Use a dedicated database: all of its data is deleted before loading.
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+import numpy as np
+from neo4j import AsyncGraphDatabase
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.vector_graph_store.data_types import Node, NodeProjection
+from memmachine.common.vector_graph_store.neo4j_vector_graph_store import (
+    Neo4jVectorGraphStore,
+    Neo4jVectorGraphStoreParams,
+)
+
+
+async def run_queries(store, query_embeddings, limit):
+    start = time.perf_counter()
+    results = [
+        await store.search_similar_nodes(
+            collection="Derivative",
+            embedding_name="embedding",
+            query_embedding=query_embedding.tolist(),
+            limit=limit,
+            projection=NodeProjection(include_embeddings=False),
+        )
+        for query_embedding in query_embeddings
+    ]
+    return results, (time.perf_counter() - start) / len(query_embeddings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--username", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--max-bytes", type=int, default=64 * 1024 * 1024)
+    args = parser.parse_args()
+
+    driver = AsyncGraphDatabase.driver(
+        args.uri,
+        auth=(args.username, args.password),
+    )
+    store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(driver=driver, force_exact_similarity_search=True),
+    )
+    in_process_store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=driver,
+            force_exact_similarity_search=True,
+            in_process_similarity_search_max_bytes=args.max_bytes,
+        ),
+    )
+    await store.delete_all_data()
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(args.nodes, args.dimensions)).astype(np.float32)
+    query_embeddings = rng.normal(size=(args.queries, args.dimensions)).astype(
+        np.float32
+    )
+
+    nodes = [
+        Node(
+            uid=str(uuid4()),
+            properties={"content": f"Derivative content {i}"},
+            embeddings={"embedding": (embedding.tolist(), SimilarityMetric.COSINE)},
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+    for batch_start in range(0, args.nodes, 500):
+        await store.add_nodes(
+            collection="Derivative",
+            nodes=nodes[batch_start : batch_start + 500],
+        )
+
+    start = time.perf_counter()
+    await in_process_store.search_similar_nodes(
+        collection="Derivative",
+        embedding_name="embedding",
+        query_embedding=query_embeddings[0].tolist(),
+        limit=args.limit,
+    )
+    load_ms = (time.perf_counter() - start) * 1000
+
+    neo4j_results, neo4j_latency = await run_queries(
+        store, query_embeddings, args.limit
+    )
+    in_process_results, in_process_latency = await run_queries(
+        in_process_store, query_embeddings, args.limit
+    )
+
+    overlaps = [
+        len({node.uid for node in neo4j_result} & {node.uid for node in result})
+        for neo4j_result, result in zip(neo4j_results, in_process_results, strict=True)
+    ]
+
+    print(f"exact search over {args.nodes} nodes with {args.dimensions} dimensions")
+    print(f"neo4j       {neo4j_latency * 1000:8.2f} ms per query")
+    print(
+        f"in process  {in_process_latency * 1000:8.2f} ms per query   "
+        f"initial load {load_ms:8.2f} ms"
+    )
+    print(f"minimum top-{args.limit} overlap {min(overlaps)}")
+
+    await store.delete_all_data()
+    await driver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
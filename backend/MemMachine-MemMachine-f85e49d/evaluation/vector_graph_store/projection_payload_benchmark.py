@@ -0,0 +1,138 @@
+"""
+Benchmark node projection on the Neo4j vector graph store.
+
+Loads nodes with embeddings into Neo4j, then fetches the same results as
+full nodes, as nodes without embeddings and as UIDs only, and prints the
+estimated result payload, the decode time and the similarity search latency
+of each. The payload is estimated from the decoded record values, since the
+driver does not expose wire byte counts.
+
+Usage:
+    python projection_payload_benchmark.py \\
+        --uri bolt://localhost:7687 --username neo4j --password password \\
+        --nodes 200 --dimensions 1536
+
+Use a dedicated database: all of its data is deleted before loading.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from neo4j import AsyncGraphDatabase
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.vector_graph_store.data_types import Node, NodeProjection
+from memmachine.common.vector_graph_store.neo4j_vector_graph_store import (
+    Neo4jVectorGraphStore,
+    Neo4jVectorGraphStoreParams,
+)
+
+PROJECTIONS = {
+    "full node": None,
+    "no embeddings": NodeProjection(include_embeddings=False),
+    "uid only": NodeProjection(property_names=(), include_embeddings=False),
+}
+
+
+def estimated_packstream_size(value) -> int:
+    """Estimate the Bolt PackStream encoding size of a decoded value."""
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, int | float):
+        return 9
+    if isinstance(value, str):
+        return 5 + len(value.encode())
+    if isinstance(value, list | tuple):
+        return 5 + sum(estimated_packstream_size(item) for item in value)
+    if isinstance(value, datetime):
+        return 20
+    return 5 + sum(
+        estimated_packstream_size(key) + estimated_packstream_size(item)
+        for key, item in value.items()
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--username", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = AsyncGraphDatabase.driver(
+        args.uri,
+        auth=(args.username, args.password),
+    )
+    store = Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(driver=driver, force_exact_similarity_search=True),
+    )
+    await store.delete_all_data()
+
+    nodes = [
+        Node(
+            uid=str(uuid4()),
+            properties={
+                "content": f"Derivative content {i}",
+                "timestamp": datetime.now(tz=UTC),
+            },
+            embeddings={
+                "embedding": (
+                    [float(i % 7 + 1)]
+                    + [0.001 * (j % 13) for j in range(1, args.dimensions)],
+                    SimilarityMetric.COSINE,
+                ),
+            },
+        )
+        for i in range(args.nodes)
+    ]
+    await store.add_nodes(collection="Derivative", nodes=nodes)
+
+    sanitized_collection = Neo4jVectorGraphStore._sanitize_name("Derivative")  # noqa: SLF001
+    for name, projection in PROJECTIONS.items():
+        expression, query_values = Neo4jVectorGraphStore._build_node_projection(  # noqa: SLF001
+            "n",
+            "node_projection_params",
+            projection,
+        )
+        records, _, _ = await driver.execute_query(
+            f"MATCH (n:{sanitized_collection}) RETURN {expression} AS node LIMIT $limit",
+            limit=args.limit,
+            node_projection_params=query_values,
+        )
+        values = [record["node"] for record in records]
+        payload_bytes = sum(estimated_packstream_size(value) for value in values)
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            Neo4jVectorGraphStore._nodes_from_neo4j_nodes(values)  # noqa: SLF001
+        decode_ms = (time.perf_counter() - start) / args.repeats * 1000
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            await store.search_similar_nodes(
+                collection="Derivative",
+                embedding_name="embedding",
+                query_embedding=nodes[0].embeddings["embedding"][0],
+                limit=args.limit,
+                projection=projection,
+            )
+        search_ms = (time.perf_counter() - start) / args.repeats * 1000
+
+        print(
+            f"{name:<16} ~{payload_bytes:>9} bytes per {len(values)} results   "
+            f"decode {decode_ms:7.3f} ms   search {search_ms:8.3f} ms"
+        )
+
+    await store.delete_all_data()
+    await driver.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
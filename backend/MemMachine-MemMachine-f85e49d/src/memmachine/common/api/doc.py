@@ -144,6 +144,12 @@ class SpecDoc:
     The zero-based page number to retrieve. Use this for pagination.
     """
 
+    CURSOR = """
+    The cursor returned as next_cursor with the previous page of episodic
+    memories. When set, the episodic memories after that cursor are returned
+    and page_num must not be set. Cursor pagination stays fast on deep pages of large projects.
+    """
+
     MEMORY_TYPE_SINGLE = """
     The specific memory type to list (e.g., Episodic or Semantic).
     """
@@ -209,6 +215,9 @@ class Examples:
     MEMORY_TYPE_SINGLE: ClassVar[list[str]] = ["episodic", "semantic"]
     PAGE_SIZE: ClassVar[list[int]] = [50, 100]
     PAGE_NUM: ClassVar[list[int]] = [0, 1, 5, 10]
+    CURSOR: ClassVar[list[str]] = [
+        "eyJjcmVhdGVkX2F0IjoiMjAyNi0wMS0wMVQwMDowMDowMFoiLCJ1aWQiOiI0MiJ9",
+    ]
     EPISODIC_ID: ClassVar[list[str]] = ["123", "345"]
     EPISODIC_IDS: ClassVar[list[list[str]]] = [["123", "345"], ["23"]]
     SEMANTIC_ID: ClassVar[list[str]] = ["12", "23"]
@@ -329,7 +338,9 @@ class RouterDoc:
     List memories within a project.
 
     System returns a paginated list of memories stored in the project.
-    The page_size and page_num fields control pagination.
+    The page_size and page_num fields control pagination. Episodic memories
+    can instead be paged with the cursor field, passing the next_cursor
+    returned with the previous page, which is null on the last page.
 
     The filter field allows for filtering based on metadata key-value pairs.
     The type field allows specifying which memory type to list.
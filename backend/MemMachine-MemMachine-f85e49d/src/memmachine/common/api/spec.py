@@ -376,13 +376,21 @@ class ListMemoriesSpec(_WithOrgAndProj):
         ),
     ]
     page_num: Annotated[
-        int,
+        int | None,
         Field(
             default=0,
             description=SpecDoc.PAGE_NUM,
             examples=Examples.PAGE_NUM,
         ),
     ]
+    cursor: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description=SpecDoc.CURSOR,
+            examples=Examples.CURSOR,
+        ),
+    ]
     filter: Annotated[
         str,
         Field(
@@ -400,6 +408,17 @@ class ListMemoriesSpec(_WithOrgAndProj):
         ),
     ]
 
+    @model_validator(mode="after")
+    def validate_pagination(self) -> Self:
+        """Ensure page_num is not given along with a cursor."""
+        if (
+            self.cursor is not None
+            and self.page_num is not None
+            and "page_num" in self.model_fields_set
+        ):
+            raise ValueError("Cannot specify both cursor and page_num")
+        return self
+
 
 class DeleteEpisodicMemorySpec(_WithOrgAndProj):
     """Specification model for deleting episodic memories."""
@@ -17,7 +17,10 @@ from memmachine.common.configuration.episodic_config import (
 )
 from memmachine.common.configuration.language_model_conf import LanguageModelsConf
 from memmachine.common.configuration.log_conf import LogConf
-from memmachine.common.configuration.mixin_confs import YamlSerializableMixin
+from memmachine.common.configuration.mixin_confs import (
+    MetricsFactoryIdMixin,
+    YamlSerializableMixin,
+)
 from memmachine.common.configuration.reranker_conf import RerankersConf
 from memmachine.common.errors import (
     DefaultEmbedderNotConfiguredError,
@@ -35,13 +38,26 @@ YamlValue = dict[str, "YamlValue"] | list["YamlValue"] | str | int | float | boo
 logger = logging.getLogger(__name__)
 
 
-class SessionManagerConf(YamlSerializableMixin):
+class SessionManagerConf(MetricsFactoryIdMixin, YamlSerializableMixin):
     """Configuration for the session database connection."""
 
     database: str = Field(
         default="",
         description="The database ID to use for session manager",
     )
+    warm_up_sessions: int = Field(
+        default=0,
+        description=(
+            "Number of most recently active sessions whose episodic memory "
+            "is loaded on startup (0 disables warm-up)"
+        ),
+        ge=0,
+    )
+    warm_up_concurrency: int = Field(
+        default=8,
+        description="Maximum number of sessions loaded concurrently during warm-up",
+        gt=0,
+    )
 
 
 class EpisodeStoreConf(YamlSerializableMixin):
@@ -55,6 +71,79 @@ class EpisodeStoreConf(YamlSerializableMixin):
         default=True,
         description="Whether to use a in memory cache for counting messages per session.",
     )
+    metadata_gin_index: bool = Field(
+        default=False,
+        description=(
+            "Whether to index episode metadata with a GIN index on PostgreSQL, "
+            "used by equality and IN filters on metadata fields"
+        ),
+    )
+    indexed_metadata_keys: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Metadata keys to index with expression indexes on PostgreSQL, "
+            "for keys that are also filtered by range"
+        ),
+    )
+
+
+class LongTermMemoryIngestionConf(YamlSerializableMixin):
+    """Configuration for adding episodes to episodic long-term memory."""
+
+    write_behind: bool = Field(
+        default=False,
+        description=(
+            "Whether episodes are added to long-term memory in the background "
+            "through an outbox table, instead of before add_episodes returns"
+        ),
+    )
+    workers: int = Field(
+        default=2,
+        description="Number of background workers draining the outbox",
+        gt=0,
+    )
+    batch_size: int = Field(
+        default=32,
+        description="Maximum number of outbox entries claimed by a worker at once",
+        gt=0,
+    )
+    max_attempts: int = Field(
+        default=5,
+        description=(
+            "Number of attempts before an outbox entry is no longer retried "
+            "(the episode stays searchable from the episode store)"
+        ),
+        gt=0,
+    )
+    retry_backoff_sec: float = Field(
+        default=1.0,
+        description="Base delay before retrying a failed entry, doubled per attempt",
+        gt=0.0,
+    )
+    poll_interval_sec: float = Field(
+        default=5.0,
+        description=(
+            "Interval between outbox scans for entries that were not "
+            "scheduled on arrival, such as entries added before a restart"
+        ),
+        gt=0.0,
+    )
+    lease_sec: float = Field(
+        default=300.0,
+        description=(
+            "Time after which an entry claimed by a worker that did not "
+            "finish it can be claimed again"
+        ),
+        gt=0.0,
+    )
+    dead_letter_retention_sec: float = Field(
+        default=604800.0,
+        description=(
+            "Time after which an entry that ran out of attempts is deleted "
+            "from the outbox"
+        ),
+        gt=0.0,
+    )
 
 
 class SemanticMemoryConf(YamlSerializableMixin):
@@ -72,6 +161,27 @@ class SemanticMemoryConf(YamlSerializableMixin):
         ...,
         description="The embedding model to use for semantic memory",
     )
+    ingestion_message_batch_size: int = Field(
+        default=1,
+        description=(
+            "Number of messages sent to the language model in a single "
+            "feature extraction call during ingestion"
+        ),
+        gt=0,
+    )
+    ingestion_sweep_interval_sec: float = Field(
+        default=60.0,
+        description=(
+            "Interval between fallback scans for feature sets with "
+            "un-ingested messages that were not scheduled on arrival"
+        ),
+        gt=0.0,
+    )
+    max_concurrent_ingestion_sets: int = Field(
+        default=4,
+        description="Maximum number of feature sets ingested concurrently",
+        gt=0,
+    )
 
 
 def _read_txt(filename: str) -> str:
@@ -238,6 +348,9 @@ class Configuration(BaseModel):
     session_manager: SessionManagerConf
     resources: ResourcesConf
     episode_store: EpisodeStoreConf
+    long_term_memory_ingestion: LongTermMemoryIngestionConf = (
+        LongTermMemoryIngestionConf()
+    )
     server: ServerConf = ServerConf()
 
     def check_reranker(self, reranker_name: str) -> None:
@@ -277,6 +390,9 @@ class Configuration(BaseModel):
             "session_manager": self.session_manager.to_yaml_dict(),
             "resources": self.resources.to_yaml_dict(),
             "episode_store": self.episode_store.to_yaml_dict(),
+            "long_term_memory_ingestion": (
+                self.long_term_memory_ingestion.to_yaml_dict()
+            ),
             "server": self.server.to_yaml_dict(),
         }
         return yaml.safe_dump(data, sort_keys=True)
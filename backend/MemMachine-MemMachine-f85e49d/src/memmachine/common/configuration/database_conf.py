@@ -24,6 +24,15 @@ class Neo4jConf(YamlSerializableMixin):
         default=False,
         description="Whether to force exact similarity search",
     )
+    in_process_similarity_search_max_bytes: int = Field(
+        default=0,
+        description=(
+            "Memory budget in bytes for embeddings cached in process "
+            "to serve exact similarity search; only safe when a single "
+            "process writes to the graph (0 disables it)"
+        ),
+        ge=0,
+    )
 
     @field_validator("password", mode="before")
     @classmethod
@@ -13,7 +13,54 @@ from memmachine.common.configuration.mixin_confs import (
 from memmachine.common.data_types import SimilarityMetric
 
 
-class AmazonBedrockEmbedderConf(YamlSerializableMixin):
+class EmbedderCacheConf(MetricsFactoryIdMixin):
+    """Configuration for caching the embeddings produced by an embedder."""
+
+    max_size: int = Field(
+        default=10_000,
+        description="Maximum number of embeddings kept in the in-process LRU cache.",
+        gt=0,
+    )
+    disk_path: str | None = Field(
+        default=None,
+        description="Path to a SQLite file used as an on-disk cache tier (optional).",
+    )
+
+
+class EmbedderBatchingConf(MetricsFactoryIdMixin):
+    """Configuration for coalescing concurrent calls to an embedder."""
+
+    max_wait_seconds: float = Field(
+        default=0.005,
+        description="Maximum time to wait for more calls before sending a batch.",
+        ge=0.0,
+    )
+    max_batch_size: int = Field(
+        default=256,
+        description="Maximum number of inputs sent in one batch.",
+        gt=0,
+    )
+    max_batch_tokens: int = Field(
+        default=100_000,
+        description="Maximum estimated number of tokens sent in one batch.",
+        gt=0,
+    )
+
+
+class EmbedderWrapperConfMixin(YamlSerializableMixin):
+    """Mixin for embedder configurations that may enable caching or batching."""
+
+    cache: EmbedderCacheConf | None = Field(
+        default=None,
+        description="Embedding cache configuration; caching is disabled if not set.",
+    )
+    batching: EmbedderBatchingConf | None = Field(
+        default=None,
+        description="Call coalescing configuration; batching is disabled if not set.",
+    )
+
+
+class AmazonBedrockEmbedderConf(EmbedderWrapperConfMixin):
     """Configuration for AmazonBedrockEmbedder."""
 
     region: str = Field(
@@ -47,7 +94,7 @@ class AmazonBedrockEmbedderConf(YamlSerializableMixin):
     )
 
 
-class OpenAIEmbedderConf(MetricsFactoryIdMixin, YamlSerializableMixin):
+class OpenAIEmbedderConf(MetricsFactoryIdMixin, EmbedderWrapperConfMixin):
     """Configuration for OpenAI embedding models."""
 
     model: str = Field(
@@ -85,7 +132,9 @@ class OpenAIEmbedderConf(MetricsFactoryIdMixin, YamlSerializableMixin):
         return v
 
 
-class SentenceTransformerEmbedderConfig(MetricsFactoryIdMixin, YamlSerializableMixin):
+class SentenceTransformerEmbedderConfig(
+    MetricsFactoryIdMixin, EmbedderWrapperConfMixin
+):
     """Configuration for sentence-transformer based embedders."""
 
     model: str = Field(
@@ -128,6 +177,26 @@ class EmbeddersConf(BaseModel):
         """Return the Amazon Bedrock embedder config for the given name."""
         return self.amazon_bedrock[name]
 
+    def _get_embedder_wrapper_conf(self, name: str) -> EmbedderWrapperConfMixin | None:
+        """Return the provider config for the given name, if any."""
+        if name in self.amazon_bedrock:
+            return self.amazon_bedrock[name]
+        if name in self.openai:
+            return self.openai[name]
+        if name in self.sentence_transformer:
+            return self.sentence_transformer[name]
+        return None
+
+    def get_embedder_cache_conf(self, name: str) -> EmbedderCacheConf | None:
+        """Return the embedding cache config for the given name, if any."""
+        conf = self._get_embedder_wrapper_conf(name)
+        return conf.cache if conf is not None else None
+
+    def get_embedder_batching_conf(self, name: str) -> EmbedderBatchingConf | None:
+        """Return the call coalescing config for the given name, if any."""
+        conf = self._get_embedder_wrapper_conf(name)
+        return conf.batching if conf is not None else None
+
     def contains_embedder(self, embedder_id: str) -> bool:
         """Return if the embedder id is known."""
         return (
@@ -0,0 +1,346 @@
+"""Embedder decorator that coalesces concurrent embed calls into batches."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+from .embedder import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingEmbedderParams(BaseModel):
+    """
+    Parameters for BatchingEmbedder.
+
+    Attributes:
+        embedder (Embedder):
+            The embedder to send coalesced batches to.
+        max_wait_seconds (float):
+            Maximum time to wait for more calls
+            after the first call of a batch arrives
+            (default: 0.005).
+        max_batch_size (int):
+            Maximum number of inputs in a batch
+            (default: 256).
+        max_batch_tokens (int):
+            Maximum estimated number of tokens in a batch
+            (default: 100,000).
+        metrics_factory (MetricsFactory | None):
+            An instance of MetricsFactory for collecting usage metrics
+            (default: None).
+        user_metrics_labels (dict[str, str]):
+            Labels to attach to the collected metrics
+            (default: {}).
+
+    """
+
+    embedder: InstanceOf[Embedder] = Field(
+        ...,
+        description="The embedder to send coalesced batches to",
+    )
+    max_wait_seconds: float = Field(
+        0.005,
+        description=(
+            "Maximum time to wait for more calls "
+            "after the first call of a batch arrives"
+        ),
+        ge=0.0,
+    )
+    max_batch_size: int = Field(
+        256,
+        description="Maximum number of inputs in a batch",
+        gt=0,
+    )
+    max_batch_tokens: int = Field(
+        100_000,
+        description="Maximum estimated number of tokens in a batch",
+        gt=0,
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        None,
+        description="An instance of MetricsFactory for collecting usage metrics",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics",
+    )
+
+
+class BatchingEmbedder(Embedder):
+    """
+    Embedder that coalesces concurrent calls to another embedder.
+
+    Calls arriving within a short window are sent to the underlying embedder
+    as one request, and the results are scattered back to each caller.
+    If a coalesced request fails, each call in it is retried on its own
+    so that only the calls that actually fail receive the error.
+    """
+
+    class _EmbedMode(Enum):
+        INGEST = "ingest"
+        SEARCH = "search"
+
+    @dataclass
+    class _PendingCall:
+        inputs: list[Any]
+        max_attempts: int
+        num_tokens: int
+        future: asyncio.Future[list[list[float]]]
+
+    def __init__(self, params: BatchingEmbedderParams) -> None:
+        """Initialize the batching embedder with configuration parameters."""
+        super().__init__()
+
+        self._embedder = params.embedder
+        self._max_wait_seconds = params.max_wait_seconds
+        self._max_batch_size = params.max_batch_size
+        self._max_batch_tokens = params.max_batch_tokens
+
+        self._pending_calls: dict[
+            BatchingEmbedder._EmbedMode, list[BatchingEmbedder._PendingCall]
+        ] = {mode: [] for mode in BatchingEmbedder._EmbedMode}
+        self._flush_handles: dict[
+            BatchingEmbedder._EmbedMode, asyncio.TimerHandle | None
+        ] = dict.fromkeys(BatchingEmbedder._EmbedMode)
+
+        self._background_tasks: set[asyncio.Task] = set()
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._batches_counter = metrics_factory.get_counter(
+                "embedder_batching_batches",
+                "Number of coalesced requests sent to the underlying embedder",
+                label_names=label_names,
+            )
+            self._calls_per_batch_summary = metrics_factory.get_summary(
+                "embedder_batching_calls_per_batch",
+                "Number of embed calls coalesced into each request",
+                label_names=label_names,
+            )
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed the provided inputs as part of a coalesced batch."""
+        return await self._embed(
+            inputs,
+            max_attempts,
+            BatchingEmbedder._EmbedMode.INGEST,
+        )
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed search queries as part of a coalesced batch."""
+        return await self._embed(
+            queries,
+            max_attempts,
+            BatchingEmbedder._EmbedMode.SEARCH,
+        )
+
+    async def _embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int,
+        mode: "BatchingEmbedder._EmbedMode",
+    ) -> list[list[float]]:
+        """Enqueue a call and wait for its share of the batch results."""
+        if not inputs:
+            return []
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be a positive integer")
+
+        loop = asyncio.get_running_loop()
+
+        pending_call = BatchingEmbedder._PendingCall(
+            inputs=list(inputs),
+            max_attempts=max_attempts,
+            num_tokens=sum(
+                BatchingEmbedder._estimate_num_tokens(item) for item in inputs
+            ),
+            future=loop.create_future(),
+        )
+
+        pending_calls = self._pending_calls[mode]
+        pending_calls.append(pending_call)
+
+        if (
+            sum(len(call.inputs) for call in pending_calls) >= self._max_batch_size
+            or sum(call.num_tokens for call in pending_calls) >= self._max_batch_tokens
+        ):
+            self._flush(mode)
+        elif self._flush_handles[mode] is None:
+            self._flush_handles[mode] = loop.call_later(
+                self._max_wait_seconds,
+                self._flush,
+                mode,
+            )
+
+        return await pending_call.future
+
+    def _flush(self, mode: "BatchingEmbedder._EmbedMode") -> None:
+        """Send all pending calls for the mode to the underlying embedder."""
+        flush_handle = self._flush_handles[mode]
+        if flush_handle is not None:
+            flush_handle.cancel()
+            self._flush_handles[mode] = None
+
+        pending_calls = self._pending_calls[mode]
+        self._pending_calls[mode] = []
+
+        for batch in self._split_into_batches(pending_calls):
+            task = asyncio.create_task(self._embed_batch(batch, mode))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    def _split_into_batches(
+        self,
+        pending_calls: list["BatchingEmbedder._PendingCall"],
+    ) -> list[list["BatchingEmbedder._PendingCall"]]:
+        """Group calls into batches within the size and token limits."""
+        batches: list[list[BatchingEmbedder._PendingCall]] = []
+        batch: list[BatchingEmbedder._PendingCall] = []
+        batch_size = 0
+        batch_tokens = 0
+
+        for pending_call in pending_calls:
+            # A single call that exceeds the limits is sent on its own.
+            if batch and (
+                batch_size + len(pending_call.inputs) > self._max_batch_size
+                or batch_tokens + pending_call.num_tokens > self._max_batch_tokens
+            ):
+                batches.append(batch)
+                batch = []
+                batch_size = 0
+                batch_tokens = 0
+
+            batch.append(pending_call)
+            batch_size += len(pending_call.inputs)
+            batch_tokens += pending_call.num_tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    async def _embed_batch(
+        self,
+        batch: list["BatchingEmbedder._PendingCall"],
+        mode: "BatchingEmbedder._EmbedMode",
+    ) -> None:
+        """Embed a batch and scatter the results to the waiting callers."""
+        batch = [
+            pending_call for pending_call in batch if not pending_call.future.done()
+        ]
+        if not batch:
+            return
+
+        if self._collect_metrics:
+            self._batches_counter.increment(labels=self._user_metrics_labels)
+            self._calls_per_batch_summary.observe(
+                value=len(batch),
+                labels=self._user_metrics_labels,
+            )
+
+        inputs = [item for pending_call in batch for item in pending_call.inputs]
+        try:
+            embeddings = await self._embed_with_embedder(
+                inputs,
+                max(pending_call.max_attempts for pending_call in batch),
+                mode,
+            )
+        except Exception as err:
+            await self._handle_batch_failure(batch, mode, err)
+            return
+
+        if len(embeddings) != len(inputs):
+            await self._handle_batch_failure(
+                batch,
+                mode,
+                ValueError(
+                    f"Received {len(embeddings)} embeddings for {len(inputs)} inputs"
+                ),
+            )
+            return
+
+        offset = 0
+        for pending_call in batch:
+            num_inputs = len(pending_call.inputs)
+            if not pending_call.future.done():
+                pending_call.future.set_result(
+                    embeddings[offset : offset + num_inputs],
+                )
+            offset += num_inputs
+
+    async def _handle_batch_failure(
+        self,
+        batch: list["BatchingEmbedder._PendingCall"],
+        mode: "BatchingEmbedder._EmbedMode",
+        err: Exception,
+    ) -> None:
+        """Fail a single call, or retry each call of a larger batch on its own."""
+        if len(batch) == 1:
+            if not batch[0].future.done():
+                batch[0].future.set_exception(err)
+            return
+
+        logger.info(
+            "Retrying %d coalesced embed calls individually "
+            "after batch failed due to %s",
+            len(batch),
+            type(err).__name__,
+        )
+        await asyncio.gather(
+            *(self._embed_batch([pending_call], mode) for pending_call in batch),
+        )
+
+    async def _embed_with_embedder(
+        self,
+        inputs: list[Any],
+        max_attempts: int,
+        mode: "BatchingEmbedder._EmbedMode",
+    ) -> list[list[float]]:
+        match mode:
+            case BatchingEmbedder._EmbedMode.INGEST:
+                return await self._embedder.ingest_embed(inputs, max_attempts)
+            case BatchingEmbedder._EmbedMode.SEARCH:
+                return await self._embedder.search_embed(inputs, max_attempts)
+
+    @staticmethod
+    def _estimate_num_tokens(item: Any) -> int:  # noqa: ANN401
+        """Roughly estimate the number of tokens in an input."""
+        # About 4 characters per token for English text.
+        return len(str(item)) // 4 + 1
+
+    @property
+    def model_id(self) -> str:
+        """Return the embedding model identifier."""
+        return self._embedder.model_id
+
+    @property
+    def dimensions(self) -> int:
+        """Return the embedding dimensionality."""
+        return self._embedder.dimensions
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        """Return the similarity metric used by the underlying embedder."""
+        return self._embedder.similarity_metric
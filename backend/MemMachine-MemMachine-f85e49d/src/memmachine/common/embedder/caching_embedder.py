@@ -0,0 +1,305 @@
+"""Embedder decorator that caches embeddings of previously seen inputs."""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.metrics_factory.metrics_factory import MetricsFactory
+
+from .embedder import Embedder
+
+logger = logging.getLogger(__name__)
+
+
+class CachingEmbedderParams(BaseModel):
+    """
+    Parameters for CachingEmbedder.
+
+    Attributes:
+        embedder (Embedder):
+            The embedder whose embeddings are cached.
+        max_cache_size (int):
+            Maximum number of embeddings
+            kept in the in-process LRU cache
+            (default: 10,000).
+        disk_cache_path (str | None):
+            Path to a SQLite file used as a second cache tier.
+            If None, only the in-process cache is used
+            (default: None).
+        metrics_factory (MetricsFactory | None):
+            An instance of MetricsFactory for collecting usage metrics
+            (default: None).
+        user_metrics_labels (dict[str, str]):
+            Labels to attach to the collected metrics
+            (default: {}).
+
+    """
+
+    embedder: InstanceOf[Embedder] = Field(
+        ...,
+        description="The embedder whose embeddings are cached",
+    )
+    max_cache_size: int = Field(
+        10_000,
+        description="Maximum number of embeddings kept in the in-process LRU cache",
+        gt=0,
+    )
+    disk_cache_path: str | None = Field(
+        None,
+        description="Path to a SQLite file used as a second cache tier",
+    )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        None,
+        description="An instance of MetricsFactory for collecting usage metrics",
+    )
+    user_metrics_labels: dict[str, str] = Field(
+        default_factory=dict,
+        description="Labels to attach to the collected metrics",
+    )
+
+
+class CachingEmbedder(Embedder):
+    """
+    Embedder that caches embeddings produced by another embedder.
+
+    Entries are keyed by model ID, dimensions, embed mode (ingest or search),
+    and a hash of the input, so embedders sharing a disk cache do not collide.
+    """
+
+    class _EmbedMode(Enum):
+        INGEST = "ingest"
+        SEARCH = "search"
+
+    def __init__(self, params: CachingEmbedderParams) -> None:
+        """Initialize the caching embedder with configuration parameters."""
+        super().__init__()
+
+        self._embedder = params.embedder
+        self._max_cache_size = params.max_cache_size
+
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+
+        self._disk_cache: sqlite3.Connection | None = None
+        self._disk_cache_lock = threading.Lock()
+        if params.disk_cache_path is not None:
+            Path(params.disk_cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = sqlite3.connect(
+                params.disk_cache_path,
+                check_same_thread=False,
+            )
+            with self._disk_cache_lock:
+                self._disk_cache.execute(
+                    "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                    "    key TEXT PRIMARY KEY,"
+                    "    embedding BLOB NOT NULL"
+                    ")",
+                )
+                self._disk_cache.commit()
+
+        metrics_factory = params.metrics_factory
+
+        self._collect_metrics = False
+        if metrics_factory is not None:
+            self._collect_metrics = True
+            self._user_metrics_labels = params.user_metrics_labels
+            label_names = self._user_metrics_labels.keys()
+
+            self._hits_counter = metrics_factory.get_counter(
+                "embedder_cache_hits",
+                "Number of inputs served from the in-process embedding cache",
+                label_names=label_names,
+            )
+            self._disk_hits_counter = metrics_factory.get_counter(
+                "embedder_cache_disk_hits",
+                "Number of inputs served from the on-disk embedding cache",
+                label_names=label_names,
+            )
+            self._misses_counter = metrics_factory.get_counter(
+                "embedder_cache_misses",
+                "Number of inputs embedded by the underlying embedder",
+                label_names=label_names,
+            )
+
+    async def ingest_embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed the provided inputs, reusing cached embeddings."""
+        return await self._embed(
+            inputs, max_attempts, CachingEmbedder._EmbedMode.INGEST
+        )
+
+    async def search_embed(
+        self,
+        queries: list[Any],
+        max_attempts: int = 1,
+    ) -> list[list[float]]:
+        """Embed search queries, reusing cached embeddings."""
+        return await self._embed(
+            queries, max_attempts, CachingEmbedder._EmbedMode.SEARCH
+        )
+
+    async def _embed(
+        self,
+        inputs: list[Any],
+        max_attempts: int,
+        mode: "CachingEmbedder._EmbedMode",
+    ) -> list[list[float]]:
+        """Look up each input in the cache tiers and embed only the misses."""
+        if not inputs:
+            return []
+
+        keys = [self._cache_key(mode, item) for item in inputs]
+
+        embeddings = self._cache_get(keys)
+        num_hits = sum(1 for key in keys if key in embeddings)
+
+        # Deduplicate misses so repeated inputs are embedded once.
+        missing = dict(zip(keys, inputs, strict=True))
+        for key in embeddings:
+            missing.pop(key, None)
+
+        num_disk_hits = 0
+        if missing and self._disk_cache is not None:
+            disk_embeddings = await asyncio.to_thread(
+                self._disk_cache_get,
+                list(missing.keys()),
+            )
+            for key, embedding in disk_embeddings.items():
+                self._cache_put(key, embedding)
+                del missing[key]
+            embeddings.update(disk_embeddings)
+            num_disk_hits = sum(1 for key in keys if key in disk_embeddings)
+
+        if missing:
+            missing_embeddings = await self._embed_with_embedder(
+                list(missing.values()),
+                max_attempts,
+                mode,
+            )
+            new_embeddings = dict(
+                zip(missing.keys(), missing_embeddings, strict=True),
+            )
+            for key, embedding in new_embeddings.items():
+                self._cache_put(key, embedding)
+            embeddings.update(new_embeddings)
+
+            if self._disk_cache is not None:
+                await asyncio.to_thread(self._disk_cache_put, new_embeddings)
+
+        if self._collect_metrics:
+            self._hits_counter.increment(
+                value=num_hits,
+                labels=self._user_metrics_labels,
+            )
+            self._disk_hits_counter.increment(
+                value=num_disk_hits,
+                labels=self._user_metrics_labels,
+            )
+            self._misses_counter.increment(
+                value=len(keys) - num_hits - num_disk_hits,
+                labels=self._user_metrics_labels,
+            )
+
+        return [list(embeddings[key]) for key in keys]
+
+    async def _embed_with_embedder(
+        self,
+        inputs: list[Any],
+        max_attempts: int,
+        mode: "CachingEmbedder._EmbedMode",
+    ) -> list[list[float]]:
+        match mode:
+            case CachingEmbedder._EmbedMode.INGEST:
+                return await self._embedder.ingest_embed(inputs, max_attempts)
+            case CachingEmbedder._EmbedMode.SEARCH:
+                return await self._embedder.search_embed(inputs, max_attempts)
+
+    def _cache_key(self, mode: "CachingEmbedder._EmbedMode", item: Any) -> str:  # noqa: ANN401
+        """Build a cache key for an input in the given mode."""
+        input_hash = hashlib.sha256(str(item).encode("utf-8")).hexdigest()
+        return (
+            f"{self._embedder.model_id}:{self._embedder.dimensions}:"
+            f"{mode.value}:{input_hash}"
+        )
+
+    def _cache_get(self, keys: list[str]) -> dict[str, list[float]]:
+        """Read embeddings for the given keys from the LRU cache."""
+        embeddings = {}
+        for key in keys:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+                embeddings[key] = embedding
+        return embeddings
+
+    def _cache_put(self, key: str, embedding: list[float]) -> None:
+        """Insert an embedding into the LRU cache, evicting if full."""
+        self._cache[key] = embedding
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_cache_size:
+            self._cache.popitem(last=False)
+
+    def _disk_cache_get(self, keys: list[str]) -> dict[str, list[float]]:
+        """Read embeddings for the given keys from the disk cache."""
+        if self._disk_cache is None or not keys:
+            return {}
+
+        rows = []
+        with self._disk_cache_lock:
+            # Stay well below SQLite's bound parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows += self._disk_cache.execute(
+                    "SELECT key, embedding FROM embedding_cache"
+                    f" WHERE key IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+
+        return {key: array("d", blob).tolist() for key, blob in rows}
+
+    def _disk_cache_put(self, embeddings: dict[str, list[float]]) -> None:
+        """Write embeddings to the disk cache."""
+        if self._disk_cache is None or not embeddings:
+            return
+
+        try:
+            with self._disk_cache_lock:
+                self._disk_cache.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, embedding)"
+                    " VALUES (?, ?)",
+                    [
+                        (key, array("d", embedding).tobytes())
+                        for key, embedding in embeddings.items()
+                    ],
+                )
+                self._disk_cache.commit()
+        except sqlite3.Error:
+            # The disk tier is best-effort; the in-process cache still holds the entries.
+            logger.exception("Failed to write embeddings to disk cache")
+
+    @property
+    def model_id(self) -> str:
+        """Return the embedding model identifier."""
+        return self._embedder.model_id
+
+    @property
+    def dimensions(self) -> int:
+        """Return the embedding dimensionality."""
+        return self._embedder.dimensions
+
+    @property
+    def similarity_metric(self) -> SimilarityMetric:
+        """Return the similarity metric used by the underlying embedder."""
+        return self._embedder.similarity_metric
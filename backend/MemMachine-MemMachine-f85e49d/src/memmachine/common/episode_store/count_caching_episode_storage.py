@@ -74,11 +74,18 @@ class CountCachingEpisodeStorage(EpisodeStorage):
     ) -> Episode | None:
         return await self._wrapped.get_episode(history_id)
 
+    async def get_episodes(
+        self,
+        episode_ids: list[EpisodeIdT],
+    ) -> list[Episode | None]:
+        return await self._wrapped.get_episodes(episode_ids)
+
     async def get_episode_messages(
         self,
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: str | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
@@ -86,6 +93,7 @@ class CountCachingEpisodeStorage(EpisodeStorage):
         return await self._wrapped.get_episode_messages(
             page_size=page_size,
             page_num=page_num,
+            cursor=cursor,
             filter_expr=filter_expr,
             start_time=start_time,
             end_time=end_time,
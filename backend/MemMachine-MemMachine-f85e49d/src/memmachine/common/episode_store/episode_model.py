@@ -1,10 +1,13 @@
 """Data models for representing episodes and related enumerations."""
 
+import base64
+import binascii
 from enum import Enum
 
-from pydantic import AwareDatetime, BaseModel, JsonValue
+from pydantic import AwareDatetime, BaseModel, JsonValue, ValidationError
 
 from memmachine.common.data_types import FilterablePropertyValue
+from memmachine.common.errors import InvalidArgumentError
 
 EpisodeIdT = str
 
@@ -65,3 +68,32 @@ class Episode(BaseModel):
     def __hash__(self) -> int:
         """Hash an episode by its UID."""
         return hash(self.uid)
+
+
+class EpisodeCursor(BaseModel):
+    """
+    Position in the listing of episodes, which is ordered by creation time.
+
+    Cursors are passed around as opaque strings, so that listing the next page
+    does not depend on how many episodes came before it.
+    """
+
+    created_at: AwareDatetime
+    uid: EpisodeIdT
+
+    @classmethod
+    def after(cls, episode: Episode) -> "EpisodeCursor":
+        """Create a cursor for the episodes listed after the given episode."""
+        return cls(created_at=episode.created_at, uid=episode.uid)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe string."""
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "EpisodeCursor":
+        """Decode a cursor created by encode."""
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError, ValidationError) as e:
+            raise InvalidArgumentError("Invalid episode cursor") from e
@@ -1,7 +1,8 @@
 """SQLAlchemy implementation of the episode storage layer."""
 
-from datetime import UTC
-from typing import Any, TypeVar, overload
+import re
+from datetime import UTC, datetime
+from typing import Any, TypeVar, cast, overload
 
 from pydantic import (
     AwareDatetime,
@@ -16,14 +17,18 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    Table,
     and_,
     delete,
     func,
     insert,
+    literal,
     or_,
     select,
+    text,
 )
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, mapped_column
@@ -31,7 +36,11 @@ from sqlalchemy.sql import Select
 from sqlalchemy.sql.elements import ColumnElement
 
 from memmachine.common.episode_store.episode_model import Episode as EpisodeE
-from memmachine.common.episode_store.episode_model import EpisodeEntry, EpisodeType
+from memmachine.common.episode_store.episode_model import (
+    EpisodeCursor,
+    EpisodeEntry,
+    EpisodeType,
+)
 from memmachine.common.episode_store.episode_storage import EpisodeIdT, EpisodeStorage
 from memmachine.common.errors import InvalidArgumentError, ResourceNotFoundError
 from memmachine.common.filter.filter_parser import (
@@ -44,7 +53,10 @@ from memmachine.common.filter.filter_parser import FilterExpr
 from memmachine.common.filter.filter_parser import (
     Or as FilterOr,
 )
-from memmachine.common.filter.sql_filter_util import parse_sql_filter
+from memmachine.common.filter.sql_filter_util import (
+    parse_jsonb_containment_filter,
+    parse_sql_filter,
+)
 
 
 class BaseEpisodeStore(DeclarativeBase):
@@ -98,6 +110,13 @@ class Episode(BaseEpisodeStore):
             "producer_role",
             "produced_for_id",
         ),
+        # Covers listing the episodes of a session in creation order
+        Index(
+            "idx_session_key_created_at_id",
+            "session_key",
+            "created_at",
+            "id",
+        ),
     )
 
     def to_typed_model(self) -> EpisodeE:
@@ -119,23 +138,82 @@ class Episode(BaseEpisodeStore):
         )
 
 
+METADATA_GIN_INDEX = "idx_episodestore_metadata_gin"
+METADATA_KEY_INDEX_PREFIX = "idx_episodestore_metadata_key_"
+
+
 class SqlAlchemyEpisodeStore(EpisodeStorage):
     """SQLAlchemy episode store implementation."""
 
-    def __init__(self, engine: AsyncEngine) -> None:
-        """Initialize the store with an async SQLAlchemy engine."""
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        metadata_gin_index: bool = False,
+        indexed_metadata_keys: list[str] | None = None,
+    ) -> None:
+        """
+        Initialize the store with an async SQLAlchemy engine.
+
+        On PostgreSQL, metadata_gin_index indexes the metadata column for
+        equality and IN filters, and indexed_metadata_keys lists metadata keys
+        to index on their own. Both are ignored on other databases.
+        """
         self._engine: AsyncEngine = engine
         self._session_factory = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
         )
 
+        self._is_postgres = engine.dialect.name == "postgresql"
+        self._metadata_gin_index = metadata_gin_index and self._is_postgres
+        self._indexed_metadata_keys = (
+            list(indexed_metadata_keys or []) if self._is_postgres else []
+        )
+
     def _create_session(self) -> AsyncSession:
         return self._session_factory()
 
     async def startup(self) -> None:
         async with self._engine.begin() as conn:
             await conn.run_sync(BaseEpisodeStore.metadata.create_all)
+            # create_all only creates indexes along with their table, so
+            # indexes added later are created on existing tables here.
+            for index in cast(Table, Episode.__table__).indexes:
+                await conn.run_sync(index.create, checkfirst=True)
+
+            if self._metadata_gin_index:
+                await conn.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS {METADATA_GIN_INDEX} "
+                        "ON episodestore USING gin (metadata jsonb_path_ops)",
+                    ),
+                )
+            for key in self._indexed_metadata_keys:
+                await conn.execute(text(self.create_metadata_key_index_sql(key)))
+
+    @classmethod
+    def create_metadata_key_index_sql(cls, key: str) -> str:
+        """Return the PostgreSQL DDL indexing the values of a metadata key."""
+        # Built from the expression that filters compile to, keys included,
+        # as they are lowercased, so that the planner matches them.
+        key = key.lower()
+        expression = cls._metadata_field(key, literal_key=True).compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+        index_name = METADATA_KEY_INDEX_PREFIX + re.sub(r"\W", "_", key)
+        return (
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON episodestore (({expression}))"
+        )
+
+    @staticmethod
+    def _metadata_field(key: str, *, literal_key: bool) -> ColumnElement[Any]:
+        if literal_key:
+            # Inlined in the SQL rather than bound, as PostgreSQL only matches
+            # expression indexes with constant keys.
+            return Episode.json_metadata[literal(key, literal_execute=True)].as_string()
+        return Episode.json_metadata[key].as_string()
 
     @validate_call
     async def add_episodes(
@@ -146,6 +224,9 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         if not episodes:
             return []
 
+        # Timestamps are set here rather than by the database so that they
+        # have the same precision on every backend, which keeps cursors exact.
+        now = datetime.now(UTC)
         values_to_insert: list[dict[str, Any]] = []
         for entry in episodes:
             entry_values: dict[str, Any] = {
@@ -164,8 +245,7 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
             if entry.metadata is not None:
                 entry_values["json_metadata"] = entry.metadata
 
-            if entry.created_at is not None:
-                entry_values["created_at"] = entry.created_at
+            entry_values["created_at"] = entry.created_at or now
 
             values_to_insert.append(entry_values)
 
@@ -215,6 +295,29 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
 
         return episode.to_typed_model() if episode else None
 
+    async def get_episodes(
+        self,
+        episode_ids: list[EpisodeIdT],
+    ) -> list[EpisodeE | None]:
+        try:
+            int_episode_ids = TypeAdapter(list[int]).validate_python(episode_ids)
+        except ValidationError as e:
+            raise ResourceNotFoundError("Invalid episode IDs") from e
+
+        if not int_episode_ids:
+            return []
+
+        stmt = select(Episode).where(Episode.id.in_(set(int_episode_ids)))
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt)
+            episodes = {episode.id: episode for episode in result.scalars().all()}
+
+        return [
+            episodes[episode_id].to_typed_model() if episode_id in episodes else None
+            for episode_id in int_episode_ids
+        ]
+
     @overload
     def _apply_episode_filter(
         self,
@@ -269,13 +372,27 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         self,
         expr: FilterComparison,
     ) -> ColumnElement[bool] | None:
-        column, is_metadata = self._resolve_episode_field(expr.field)
+        column, is_metadata = self._resolve_episode_field(
+            expr.field,
+            literal_metadata_key=self._is_postgres,
+        )
 
-        return parse_sql_filter(
+        parsed_filter = parse_sql_filter(
             column=column,
             is_metadata=is_metadata,
             expr=expr,
         )
+        if not (is_metadata and self._metadata_gin_index) or parsed_filter is None:
+            return parsed_filter
+
+        containment_filter = parse_jsonb_containment_filter(
+            Episode.json_metadata,
+            expr.field.split(".", 1)[1].lower(),
+            expr,
+        )
+        if containment_filter is None:
+            return parsed_filter
+        return and_(containment_filter, parsed_filter)
 
     def _compile_episode_filter_expr(
         self, expr: FilterExpr
@@ -295,9 +412,12 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
 
         raise TypeError(f"Unsupported filter expression type: {type(expr)!r}")
 
-    @staticmethod
+    @classmethod
     def _resolve_episode_field(
+        cls,
         field: str,
+        *,
+        literal_metadata_key: bool = False,
     ) -> tuple[Any, bool] | tuple[None, bool]:
         normalized = field.lower()
         field_mapping: dict[str, Any] = {
@@ -318,7 +438,10 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
 
         if normalized.startswith(("m.", "metadata.")):
             key = normalized.split(".", 1)[1]
-            return Episode.json_metadata[key].as_string(), True
+            return (
+                cls._metadata_field(key, literal_key=literal_metadata_key),
+                True,
+            )
         return None, False
 
     async def get_episode_messages(
@@ -326,6 +449,7 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: str | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
@@ -339,9 +463,16 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
             end_time=end_time,
         )
 
+        if cursor is not None:
+            if page_num is not None:
+                raise InvalidArgumentError("Cannot specify both cursor and offset")
+            stmt = self._apply_episode_cursor(stmt, EpisodeCursor.decode(cursor))
+
+        if page_size is not None or cursor is not None:
+            stmt = stmt.order_by(Episode.created_at.asc(), Episode.id.asc())
+
         if page_size is not None:
             stmt = stmt.limit(page_size)
-            stmt = stmt.order_by(Episode.created_at.asc())
 
             if page_num is not None:
                 stmt = stmt.offset(page_size * page_num)
@@ -355,6 +486,26 @@ class SqlAlchemyEpisodeStore(EpisodeStorage):
 
         return [h.to_typed_model() for h in episode_messages]
 
+    @staticmethod
+    def _apply_episode_cursor(
+        stmt: Select[Any],
+        cursor: EpisodeCursor,
+    ) -> Select[Any]:
+        try:
+            cursor_id = int(cursor.uid)
+        except ValueError as e:
+            raise InvalidArgumentError("Invalid episode cursor") from e
+
+        return stmt.where(
+            or_(
+                Episode.created_at > cursor.created_at,
+                and_(
+                    Episode.created_at == cursor.created_at,
+                    Episode.id > cursor_id,
+                ),
+            ),
+        )
+
     async def get_episode_messages_count(
         self,
         *,
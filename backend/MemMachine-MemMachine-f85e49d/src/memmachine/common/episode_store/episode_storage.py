@@ -34,16 +34,31 @@ class EpisodeStorage(ABC):
     ) -> Episode | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_episodes(
+        self,
+        episode_ids: list[EpisodeIdT],
+    ) -> list[Episode | None]:
+        """Fetch episodes by id, in order, with None for ids that do not exist."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_episode_messages(
         self,
         *,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: str | None = None,
         filter_expr: FilterExpr | None = None,
         start_time: AwareDatetime | None = None,
         end_time: AwareDatetime | None = None,
     ) -> list[Episode]:
+        """
+        List episodes in creation order.
+
+        Pages are selected either with page_num, or with a cursor encoded by
+        EpisodeCursor to list the episodes after a previously listed one.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -1,9 +1,12 @@
 """SQLAlchemy utilities for FilterExpr."""
 
+import json
 import logging
+import math
 from typing import Any
 
-from sqlalchemy import ColumnElement
+from sqlalchemy import ColumnElement, or_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import InstrumentedAttribute, MappedColumn
 
 from memmachine.common.data_types import FilterablePropertyValue
@@ -70,3 +73,54 @@ def parse_sql_filter(
             }[op]
         case _:
             raise ValueError(f"Unsupported operator: {expr.op}")
+
+
+def _json_candidates(value: FilterablePropertyValue) -> list[Any]:
+    """Return the JSON values whose text is the normalized filter value."""
+    text = _normalize_metadata_value(value)
+    candidates: list[Any] = [text]
+    if text in ("true", "false"):
+        candidates.append(text == "true")
+    try:
+        candidates.append(int(text))
+    except ValueError:
+        try:
+            number = float(text)
+        except ValueError:
+            return candidates
+        if math.isfinite(number):
+            candidates.append(number)
+    return candidates
+
+
+def parse_jsonb_containment_filter(
+    column: ColumnElement[Any] | InstrumentedAttribute[Any],
+    key: str,
+    expr: Comparison,
+) -> ColumnElement[bool] | None:
+    """
+    Parse a metadata equality or IN comparison into JSONB containment.
+
+    Containment can use a GIN index on the JSONB column. Metadata comparisons
+    are made on the text of the values, so the containment matches the
+    values of any JSON type with that text, and is meant to narrow down the
+    rows checked by the comparison rather than replace it.
+    """
+    match expr.op:
+        case "=":
+            values = [_ensure_scalar_value(expr.value, expr.op)]
+        case "in":
+            values = _ensure_list_value(expr.value)
+        case _:
+            return None
+
+    documents = {
+        json.dumps({key: candidate}): {key: candidate}
+        for value in values
+        for candidate in _json_candidates(value)
+    }
+    if not documents:
+        return None
+
+    jsonb_column = type_coerce(column, JSONB)
+    return or_(*(jsonb_column.contains(document) for document in documents.values()))
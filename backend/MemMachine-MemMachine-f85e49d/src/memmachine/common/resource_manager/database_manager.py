@@ -122,6 +122,9 @@ class DatabaseManager:
             params = Neo4jVectorGraphStoreParams(
                 driver=driver,
                 force_exact_similarity_search=conf.force_exact_similarity_search,
+                in_process_similarity_search_max_bytes=(
+                    conf.in_process_similarity_search_max_bytes
+                ),
             )
             self.graph_stores[name] = Neo4jVectorGraphStore(params)
             return driver
@@ -3,7 +3,11 @@
 import asyncio
 from asyncio import Lock
 
-from memmachine.common.configuration.embedder_conf import EmbeddersConf
+from memmachine.common.configuration.embedder_conf import (
+    EmbedderBatchingConf,
+    EmbedderCacheConf,
+    EmbeddersConf,
+)
 from memmachine.common.embedder import Embedder
 
 
@@ -53,6 +57,60 @@ class EmbedderManager:
             return embedder
 
     def _build_embedder(self, name: str) -> Embedder:
+        """Construct an embedder, wrapping it for batching and caching if configured."""
+        embedder = self._build_provider_embedder(name)
+
+        # Batching sits below caching so that cache hits never wait for a batch.
+        batching_conf = self.conf.get_embedder_batching_conf(name)
+        if batching_conf is not None:
+            embedder = self._build_batching_embedder(embedder, batching_conf)
+
+        cache_conf = self.conf.get_embedder_cache_conf(name)
+        if cache_conf is not None:
+            embedder = self._build_caching_embedder(embedder, cache_conf)
+
+        return embedder
+
+    @staticmethod
+    def _build_batching_embedder(
+        embedder: Embedder,
+        batching_conf: EmbedderBatchingConf,
+    ) -> Embedder:
+        from memmachine.common.embedder.batching_embedder import (
+            BatchingEmbedder,
+            BatchingEmbedderParams,
+        )
+
+        params = BatchingEmbedderParams(
+            embedder=embedder,
+            max_wait_seconds=batching_conf.max_wait_seconds,
+            max_batch_size=batching_conf.max_batch_size,
+            max_batch_tokens=batching_conf.max_batch_tokens,
+            metrics_factory=batching_conf.get_metrics_factory(),
+            user_metrics_labels=batching_conf.user_metrics_labels,
+        )
+        return BatchingEmbedder(params)
+
+    @staticmethod
+    def _build_caching_embedder(
+        embedder: Embedder,
+        cache_conf: EmbedderCacheConf,
+    ) -> Embedder:
+        from memmachine.common.embedder.caching_embedder import (
+            CachingEmbedder,
+            CachingEmbedderParams,
+        )
+
+        params = CachingEmbedderParams(
+            embedder=embedder,
+            max_cache_size=cache_conf.max_size,
+            disk_cache_path=cache_conf.disk_path,
+            metrics_factory=cache_conf.get_metrics_factory(),
+            user_metrics_labels=cache_conf.user_metrics_labels,
+        )
+        return CachingEmbedder(params)
+
+    def _build_provider_embedder(self, name: str) -> Embedder:
         """Construct an embedder based on provider."""
         if name in self.conf.amazon_bedrock:
             return self._build_amazon_bedrock_embedders(name)
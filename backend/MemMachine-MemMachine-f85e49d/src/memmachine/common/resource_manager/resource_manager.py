@@ -31,6 +31,7 @@ from memmachine.episodic_memory.episodic_memory_manager import (
     EpisodicMemoryManager,
     EpisodicMemoryManagerParams,
 )
+from memmachine.episodic_memory.long_term_memory import LongTermMemoryOutbox
 from memmachine.semantic_memory.semantic_memory import SemanticService
 from memmachine.semantic_memory.semantic_session_manager import SemanticSessionManager
 
@@ -60,6 +61,7 @@ class ResourceManagerImpl:
         self._episodic_memory_manager: EpisodicMemoryManager | None = None
 
         self._episode_storage: EpisodeStorage | None = None
+        self._long_term_memory_outbox: LongTermMemoryOutbox | None = None
         self._semantic_manager: SemanticResourceManager | None = None
 
     async def build(self) -> None:
@@ -134,6 +136,7 @@ class ResourceManagerImpl:
         params = EpisodicMemoryManagerParams(
             resource_manager=self,
             session_data_manager=session_data_manager,
+            metrics_factory=self._conf.session_manager.get_metrics_factory(),
         )
         self._episodic_memory_manager = EpisodicMemoryManager(params)
         return self._episodic_memory_manager
@@ -150,7 +153,11 @@ class ResourceManagerImpl:
         database = episode_storage_conf.database
         engine = await self.get_sql_engine(database)
 
-        episode_storage = SqlAlchemyEpisodeStore(engine)
+        episode_storage = SqlAlchemyEpisodeStore(
+            engine,
+            metadata_gin_index=episode_storage_conf.metadata_gin_index,
+            indexed_metadata_keys=episode_storage_conf.indexed_metadata_keys,
+        )
         await episode_storage.startup()
 
         if episode_storage_conf.with_count_cache:
@@ -159,6 +166,19 @@ class ResourceManagerImpl:
         self._episode_storage = episode_storage
         return self._episode_storage
 
+    async def get_long_term_memory_outbox(self) -> LongTermMemoryOutbox:
+        """Return the long-term memory outbox, stored with the episodes."""
+        if self._long_term_memory_outbox is not None:
+            return self._long_term_memory_outbox
+
+        engine = await self.get_sql_engine(self._conf.episode_store.database)
+
+        long_term_memory_outbox = LongTermMemoryOutbox(engine)
+        await long_term_memory_outbox.startup()
+
+        self._long_term_memory_outbox = long_term_memory_outbox
+        return self._long_term_memory_outbox
+
     async def get_semantic_service(self) -> SemanticService:
         """Return the semantic service manager."""
         semantic_manager = await self.get_semantic_manager()
@@ -116,6 +116,9 @@ class SemanticResourceManager:
                 semantic_storage=semantic_storage,
                 episode_storage=episode_store,
                 resource_retriever=resource_retriever,
+                ingestion_message_batch_size=self._conf.ingestion_message_batch_size,
+                feature_update_sweep_interval_sec=self._conf.ingestion_sweep_interval_sec,
+                max_concurrent_ingestion_sets=self._conf.max_concurrent_ingestion_sets,
             ),
         )
         return self._semantic_service
@@ -67,6 +67,11 @@ class SessionDataManager(ABC):
         """Return a list of all session keys (optionally filtered)."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_recent_session_keys(self, limit: int) -> list[str]:
+        """Return up to `limit` session keys, most recently active first."""
+        raise NotImplementedError
+
     @abstractmethod
     async def save_short_term_memory(
         self,
@@ -1,8 +1,8 @@
 """Manages database for session config and short term data."""
 
 import io
-import os
 import pickle
+import time
 from typing import Annotated, Any
 
 from sqlalchemy import (
@@ -129,7 +129,7 @@ class SessionDataManagerSQL(SessionDataManager):
             # create a new entry
             new_session = self.SessionConfig(
                 session_key=session_key,
-                timestamp=int(os.times()[4]),
+                timestamp=int(time.time()),
                 configuration=configuration,
                 param_data=param_data,
                 description=description,
@@ -215,6 +215,25 @@ class SessionDataManagerSQL(SessionDataManager):
             sessions = await dbsession.execute(stmt)
             return list(sessions.scalars().all())
 
+    async def get_recent_session_keys(self, limit: int) -> list[str]:
+        """Retrieve session keys ordered by their last short term memory update."""
+        last_active = func.coalesce(
+            self.ShortTermMemoryData.timestamp,
+            self.SessionConfig.timestamp,
+        )
+        stmt = (
+            select(self.SessionConfig.session_key)
+            .outerjoin(
+                self.ShortTermMemoryData,
+                self.ShortTermMemoryData.session_key == self.SessionConfig.session_key,
+            )
+            .order_by(last_active.desc())
+            .limit(limit)
+        )
+        async with self._async_session() as dbsession:
+            sessions = await dbsession.execute(stmt)
+            return list(sessions.scalars().all())
+
     async def save_short_term_memory(
         self,
         session_key: str,
@@ -247,7 +266,7 @@ class SessionDataManagerSQL(SessionDataManager):
                         summary=summary,
                         last_seq=last_seq,
                         episode_num=episode_num,
-                        timestamp=int(os.times()[4]),
+                        timestamp=int(time.time()),
                     )
                 )
                 await dbsession.execute(update_stmt)
@@ -257,7 +276,7 @@ class SessionDataManagerSQL(SessionDataManager):
                     summary=summary,
                     last_seq=last_seq,
                     episode_num=episode_num,
-                    timestamp=int(os.times()[4]),
+                    timestamp=int(time.time()),
                 )
                 await dbsession.execute(insert_stmt)
             await dbsession.commit()
@@ -1,11 +1,18 @@
 """Public exports for vector graph storage utilities."""
 
-from .data_types import Edge, Node, OrderedPropertyValue, PropertyValue
+from .data_types import (
+    Edge,
+    Node,
+    NodeProjection,
+    OrderedPropertyValue,
+    PropertyValue,
+)
 from .vector_graph_store import VectorGraphStore
 
 __all__ = [
     "Edge",
     "Node",
+    "NodeProjection",
     "OrderedPropertyValue",
     "PropertyValue",
     "VectorGraphStore",
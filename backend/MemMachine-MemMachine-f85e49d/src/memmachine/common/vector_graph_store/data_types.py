@@ -56,6 +56,20 @@ class Node:
         return hash(self.uid)
 
 
+@dataclass(kw_only=True, frozen=True)
+class NodeProjection:
+    """
+    Selection of node data returned by vector graph store queries.
+
+    The node UID is always returned. property_names limits the returned
+    properties (None returns all of them), and include_embeddings controls
+    whether embeddings are returned.
+    """
+
+    property_names: tuple[str, ...] | None = None
+    include_embeddings: bool = True
+
+
 @dataclass(kw_only=True)
 class Edge:
     """Graph edge representation with properties and embeddings."""
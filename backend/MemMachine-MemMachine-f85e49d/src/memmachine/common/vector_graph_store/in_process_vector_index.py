@@ -0,0 +1,325 @@
+"""
+In-process exact vector search over node embeddings.
+
+Small collections never reach the vector index creation threshold,
+so searching them in the database means scanning every node
+and computing similarities row by row.
+This module keeps the embeddings of such collections
+in contiguous NumPy matrices so that top-k search runs in process.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from memmachine.common.data_types import SimilarityMetric
+
+_INITIAL_CAPACITY = 64
+
+
+class _EmbeddingMatrix:
+    """Embeddings of one (collection, embedding name) pair."""
+
+    def __init__(self, dimensions: int, capacity: int) -> None:
+        self.dimensions = dimensions
+        self.vectors = np.empty((capacity, dimensions), dtype=np.float32)
+        self.squared_norms = np.empty(capacity, dtype=np.float32)
+        self.uids: list[str] = []
+        self.rows: dict[str, int] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.uids)
+
+    @property
+    def nbytes(self) -> int:
+        return self.vectors.nbytes + self.squared_norms.nbytes
+
+    def upsert(self, uids: Sequence[str], vectors: np.ndarray) -> None:
+        new_size = self.size + sum(1 for uid in uids if uid not in self.rows)
+        if new_size > len(self.vectors):
+            self._grow(new_size)
+
+        squared_norms = np.einsum("ij,ij->i", vectors, vectors)
+        for uid, vector, squared_norm in zip(uids, vectors, squared_norms, strict=True):
+            row = self.rows.get(uid)
+            if row is None:
+                row = self.size
+                self.rows[uid] = row
+                self.uids.append(uid)
+            self.vectors[row] = vector
+            self.squared_norms[row] = squared_norm
+
+    def remove(self, uids: Iterable[str]) -> None:
+        for uid in uids:
+            row = self.rows.pop(uid, None)
+            if row is None:
+                continue
+
+            # Keep rows contiguous by moving the last row into the gap.
+            last_row = self.size - 1
+            last_uid = self.uids.pop()
+            if row != last_row:
+                self.vectors[row] = self.vectors[last_row]
+                self.squared_norms[row] = self.squared_norms[last_row]
+                self.uids[row] = last_uid
+                self.rows[last_uid] = row
+
+    def reset(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+        self.vectors = np.empty((0, dimensions), dtype=np.float32)
+        self.squared_norms = np.empty(0, dtype=np.float32)
+        self.uids.clear()
+        self.rows.clear()
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = max(min_capacity, 2 * len(self.vectors), _INITIAL_CAPACITY)
+
+        vectors = np.empty((capacity, self.dimensions), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        squared_norms = np.empty(capacity, dtype=np.float32)
+        squared_norms[: self.size] = self.squared_norms[: self.size]
+
+        self.vectors = vectors
+        self.squared_norms = squared_norms
+
+
+class InProcessVectorIndex:
+    """
+    Memory-bounded exact vector search over node embeddings.
+
+    Embeddings are kept per (collection, embedding name).
+    When the total size exceeds max_bytes,
+    the least recently used matrices are evicted.
+    Evicted or never loaded matrices are simply absent,
+    and callers fall back to searching the database.
+
+    Each collection has a generation that changes on every write,
+    so that a load racing with writes is discarded instead of cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty index holding at most max_bytes of embeddings."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+
+        self._max_bytes = max_bytes
+        self._matrices: OrderedDict[tuple[str, str], _EmbeddingMatrix] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._nbytes = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Return the memory budget in bytes."""
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes currently used by embedding matrices."""
+        return self._nbytes
+
+    def contains(self, collection: str, embedding_name: str) -> bool:
+        """Return whether the embeddings of a collection are loaded."""
+        return (collection, embedding_name) in self._matrices
+
+    def generation(self, collection: str) -> int:
+        """Return the write generation of a collection."""
+        return self._generations.get(collection, 0)
+
+    def load(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        uids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        generation: int,
+    ) -> bool:
+        """
+        Cache all embeddings of a collection read from the database.
+
+        Args:
+            collection (str): Collection that the nodes belong to.
+            embedding_name (str): The name of the embedding.
+            uids (Sequence[str]): UIDs of all nodes having the embedding.
+            embeddings (Sequence[Sequence[float]]): Their embeddings.
+            generation (int):
+                The collection generation observed before reading.
+
+        Returns:
+            bool:
+                Whether the embeddings were cached.
+                They are not if the collection was written to since reading,
+                if the embeddings have inconsistent dimensions,
+                or if they do not fit within the memory budget.
+
+        """
+        key = (collection, embedding_name)
+        if key in self._matrices:
+            return True
+        if generation != self.generation(collection):
+            return False
+
+        vectors = InProcessVectorIndex._as_matrix(embeddings)
+        if vectors is None:
+            return False
+
+        dimensions = vectors.shape[1] if len(vectors) > 0 else 0
+        if len(vectors) * (dimensions + 1) * 4 > self._max_bytes:
+            return False
+
+        matrix = _EmbeddingMatrix(dimensions, len(vectors))
+        matrix.upsert(uids, vectors)
+        self._matrices[key] = matrix
+        self._nbytes += matrix.nbytes
+        self._evict()
+        return key in self._matrices
+
+    def add(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        uids: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        """Add or replace embeddings of nodes written to a collection."""
+        self._bump_generation(collection)
+
+        key = (collection, embedding_name)
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            return
+
+        vectors = InProcessVectorIndex._as_matrix(embeddings)
+        if vectors is None:
+            self._drop(key)
+            return
+        if len(vectors) == 0:
+            return
+
+        dimensions = vectors.shape[1]
+        if dimensions != matrix.dimensions and matrix.size > 0:
+            self._drop(key)
+            return
+
+        self._nbytes -= matrix.nbytes
+        if dimensions != matrix.dimensions:
+            matrix.reset(dimensions)
+        matrix.upsert(uids, vectors)
+        self._nbytes += matrix.nbytes
+        self._evict()
+
+    def remove(self, *, collection: str, uids: Iterable[str]) -> None:
+        """Remove nodes deleted from a collection."""
+        self._bump_generation(collection)
+
+        uids = list(uids)
+        for (matrix_collection, _), matrix in self._matrices.items():
+            if matrix_collection == collection:
+                matrix.remove(uids)
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        for collection in {collection for collection, _ in self._matrices}:
+            self._bump_generation(collection)
+        self._matrices.clear()
+        self._nbytes = 0
+
+    def search(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: Sequence[float],
+        similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
+        limit: int | None = None,
+    ) -> list[str] | None:
+        """
+        Return UIDs of the nodes most similar to the query embedding.
+
+        Similarity is computed like the exact database search,
+        which uses Euclidean similarity for SimilarityMetric.EUCLIDEAN
+        and cosine similarity otherwise.
+
+        Args:
+            collection (str): Collection that the nodes belong to.
+            embedding_name (str): The name of the embedding.
+            query_embedding (Sequence[float]): The embedding to compare against.
+            similarity_metric (SimilarityMetric):
+                The similarity metric to use (default: SimilarityMetric.COSINE).
+            limit (int | None):
+                Maximum number of UIDs to return.
+                If None, return all UIDs (default: None).
+
+        Returns:
+            list[str] | None:
+                UIDs ordered by descending similarity,
+                or None if the embeddings are not loaded
+                or do not match the query dimensions.
+
+        """
+        key = (collection, embedding_name)
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            return None
+        self._matrices.move_to_end(key)
+
+        if matrix.size == 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (matrix.dimensions,):
+            return None
+
+        vectors = matrix.vectors[: matrix.size]
+        squared_norms = matrix.squared_norms[: matrix.size]
+        dot_products = vectors @ query
+        query_squared_norm = float(query @ query)
+
+        match similarity_metric:
+            case SimilarityMetric.EUCLIDEAN:
+                # Negated squared distance orders like 1 / (1 + distance^2).
+                scores = 2 * dot_products - squared_norms - query_squared_norm
+            case _:
+                norm_products = np.sqrt(squared_norms * query_squared_norm)
+                scores = np.divide(
+                    dot_products,
+                    norm_products,
+                    out=np.full(matrix.size, -np.inf, dtype=np.float32),
+                    where=norm_products > 0,
+                )
+
+        if limit is not None and limit < matrix.size:
+            if limit <= 0:
+                return []
+            top_rows = np.argpartition(-scores, limit - 1)[:limit]
+            order = top_rows[np.argsort(-scores[top_rows], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        return [matrix.uids[row] for row in order]
+
+    def _bump_generation(self, collection: str) -> None:
+        self._generations[collection] = self.generation(collection) + 1
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        matrix = self._matrices.pop(key)
+        self._nbytes -= matrix.nbytes
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and self._matrices:
+            self._drop(next(iter(self._matrices)))
+
+    @staticmethod
+    def _as_matrix(embeddings: Sequence[Sequence[float]]) -> np.ndarray | None:
+        if len(embeddings) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        try:
+            vectors = np.asarray(embeddings, dtype=np.float32)
+        except ValueError:
+            return None
+        if vectors.ndim != 2:
+            return None
+        return vectors
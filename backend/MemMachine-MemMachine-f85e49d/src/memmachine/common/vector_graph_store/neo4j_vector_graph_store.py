@@ -11,7 +11,7 @@ import re
 import time
 from collections.abc import Awaitable, Iterable, Mapping
 from enum import Enum
-from typing import cast
+from typing import Any, cast
 from uuid import uuid4
 
 from neo4j import AsyncDriver
@@ -39,6 +39,7 @@ from .data_types import (
     Edge,
     EntityType,
     Node,
+    NodeProjection,
     OrderedPropertyValue,
     PropertyValue,
     demangle_embedding_name,
@@ -48,6 +49,7 @@ from .data_types import (
     mangle_embedding_name,
     mangle_property_name,
 )
+from .in_process_vector_index import InProcessVectorIndex
 from .vector_graph_store import VectorGraphStore
 
 logger = logging.getLogger(__name__)
@@ -88,6 +90,14 @@ class Neo4jVectorGraphStoreParams(BaseModel):
             in a collection or having a relation
             at which vector indexes may be created
             (default: 10,000).
+        in_process_similarity_search_max_bytes (int):
+            Memory budget in bytes for embeddings cached in process
+            to serve exact similarity search without scanning in Neo4j.
+            Least recently used collections are evicted beyond the budget.
+            Only writes made through this store instance update the cache,
+            so enable it only when a single process writes to the graph.
+            0 disables the in-process search
+            (default: 0).
         metrics_factory (MetricsFactory | None):
             An instance of MetricsFactory for collecting usage metrics
             (default: None).
@@ -148,6 +158,16 @@ class Neo4jVectorGraphStoreParams(BaseModel):
             "at which vector indexes may be created"
         ),
     )
+    in_process_similarity_search_max_bytes: int = Field(
+        0,
+        description=(
+            "Memory budget in bytes for embeddings cached in process "
+            "to serve exact similarity search without scanning in Neo4j; "
+            "only safe when a single process writes to the graph "
+            "(0 disables the in-process search)"
+        ),
+        ge=0,
+    )
     metrics_factory: InstanceOf[MetricsFactory] | None = Field(
         None,
         description="An instance of MetricsFactory for collecting usage metrics",
@@ -188,6 +208,17 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         self._vector_index_creation_threshold = params.vector_index_creation_threshold
 
+        self._in_process_vector_index = None
+        if params.in_process_similarity_search_max_bytes > 0:
+            logger.warning(
+                "In-process similarity search is enabled. It only sees writes "
+                "made through this process, so searches return stale results "
+                "if other processes or replicas write to the same Neo4j graph.",
+            )
+            self._in_process_vector_index = InProcessVectorIndex(
+                params.in_process_similarity_search_max_bytes,
+            )
+
         self._index_state_cache: dict[str, Neo4jVectorGraphStore.CacheIndexState] = {}
         self._populate_index_state_cache_lock = asyncio.Lock()
 
@@ -207,8 +238,12 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         self._search_similar_nodes_latency_summary = None
         self._search_related_nodes_calls_counter = None
         self._search_related_nodes_latency_summary = None
+        self._batch_search_related_nodes_calls_counter = None
+        self._batch_search_related_nodes_latency_summary = None
         self._search_directional_nodes_calls_counter = None
         self._search_directional_nodes_latency_summary = None
+        self._batch_search_directional_nodes_calls_counter = None
+        self._batch_search_directional_nodes_latency_summary = None
         self._search_matching_nodes_calls_counter = None
         self._search_matching_nodes_latency_summary = None
         self._get_nodes_calls_counter = None
@@ -275,6 +310,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for search_related_nodes in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._batch_search_related_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_batch_search_related_nodes_calls",
+                "Number of calls to batch_search_related_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._batch_search_related_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_batch_search_related_nodes_latency_seconds",
+                "Latency in seconds for batch_search_related_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
             self._search_directional_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_search_directional_nodes_calls",
                 "Number of calls to search_directional_nodes in Neo4jVectorGraphStore",
@@ -285,6 +330,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 "Latency in seconds for search_directional_nodes in Neo4jVectorGraphStore",
                 label_names=label_names,
             )
+            self._batch_search_directional_nodes_calls_counter = metrics_factory.get_counter(
+                "vector_graph_store_neo4j_batch_search_directional_nodes_calls",
+                "Number of calls to batch_search_directional_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
+            self._batch_search_directional_nodes_latency_summary = metrics_factory.get_summary(
+                "vector_graph_store_neo4j_batch_search_directional_nodes_latency_seconds",
+                "Latency in seconds for batch_search_directional_nodes in Neo4jVectorGraphStore",
+                label_names=label_names,
+            )
             self._search_matching_nodes_calls_counter = metrics_factory.get_counter(
                 "vector_graph_store_neo4j_search_matching_nodes_calls",
                 "Number of calls to search_matching_nodes in Neo4jVectorGraphStore",
@@ -403,6 +458,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
         sanitized_embedding_names = set()
+        embeddings_by_name: dict[str, tuple[list[str], list[list[float]]]] = {}
 
         query_nodes = []
         for node in nodes:
@@ -428,6 +484,13 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
                 sanitized_embedding_names.add(sanitized_embedding_name)
 
+                embedding_uids, embedding_values = embeddings_by_name.setdefault(
+                    embedding_name,
+                    ([], []),
+                )
+                embedding_uids.append(str(node.uid))
+                embedding_values.append(embedding)
+
                 query_node_properties[sanitized_embedding_name] = embedding
                 query_node_properties[sanitized_similarity_metric_name] = (
                     similarity_metric.value
@@ -446,6 +509,18 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             nodes=query_nodes,
         )
 
+        if self._in_process_vector_index is not None:
+            for embedding_name, (
+                embedding_uids,
+                embedding_values,
+            ) in embeddings_by_name.items():
+                self._in_process_vector_index.add(
+                    collection=collection,
+                    embedding_name=embedding_name,
+                    uids=embedding_uids,
+                    embeddings=embedding_values,
+                )
+
         self._collection_node_counts[collection] += len(query_nodes)
 
         if (
@@ -621,10 +696,19 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
         limit: int | None = 100,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """Search nodes by vector similarity with optional property filters."""
         start_time = time.monotonic()
 
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
         sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
             mangle_embedding_name(embedding_name),
@@ -666,7 +750,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 ")\n"
                 "YIELD node AS n, score AS similarity\n"
                 f"WHERE {query_filter_string}\n"
-                "RETURN n\n"
+                f"RETURN {node_projection_string} AS node\n"
                 "ORDER BY similarity DESC\n"
                 "LIMIT $limit"
             )
@@ -681,6 +765,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 ),
                 limit=limit,
                 query_filter_params=query_filter_params,
+                node_projection_params=node_projection_params,
                 vector_index_name=vector_index_name,
             )
 
@@ -691,14 +776,23 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             ):
                 do_exact_similarity_search = True
 
+        similar_nodes = None
         if do_exact_similarity_search:
-            match similarity_metric:
-                case SimilarityMetric.COSINE:
-                    vector_similarity_function = "vector.similarity.cosine"
-                case SimilarityMetric.EUCLIDEAN:
-                    vector_similarity_function = "vector.similarity.euclidean"
-                case _:
-                    vector_similarity_function = "vector.similarity.cosine"
+            similar_nodes = await self._search_similar_nodes_in_process(
+                collection=collection,
+                embedding_name=embedding_name,
+                query_embedding=query_embedding,
+                similarity_metric=similarity_metric,
+                limit=limit,
+                property_filter=property_filter,
+                projection=projection,
+            )
+            do_exact_similarity_search = similar_nodes is None
+
+        if do_exact_similarity_search:
+            vector_similarity_function = (
+                Neo4jVectorGraphStore._vector_similarity_function(similarity_metric)
+            )
 
             query = (
                 f"MATCH (n:{sanitized_collection})\n"
@@ -708,7 +802,7 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 f"    {vector_similarity_function}("
                 f"        n.{sanitized_embedding_name}, $query_embedding"
                 "    ) AS similarity\n"
-                "RETURN n\n"
+                f"RETURN {node_projection_string} AS node\n"
                 "ORDER BY similarity DESC\n"
                 f"{'LIMIT $limit' if limit is not None else ''}"
             )
@@ -718,12 +812,14 @@ class Neo4jVectorGraphStore(VectorGraphStore):
                 query_embedding=query_embedding,
                 limit=limit,
                 query_filter_params=query_filter_params,
+                node_projection_params=node_projection_params,
             )
 
-        similar_neo4j_nodes = [record["n"] for record in records]
-        similar_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
-            similar_neo4j_nodes
-        )
+        if similar_nodes is None:
+            similar_neo4j_nodes = [record["node"] for record in records]
+            similar_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                similar_neo4j_nodes
+            )
 
         end_time = time.monotonic()
         self._collect_metrics(
@@ -735,6 +831,155 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         return similar_nodes
 
+    async def _search_similar_nodes_in_process(
+        self,
+        *,
+        collection: str,
+        embedding_name: str,
+        query_embedding: list[float],
+        similarity_metric: SimilarityMetric,
+        limit: int | None,
+        property_filter: FilterExpr | None,
+        projection: NodeProjection | None,
+    ) -> list[Node] | None:
+        """
+        Search nodes by exact vector similarity using in-process embeddings.
+
+        Top-k is computed in process and only the hits are fetched by uid.
+        With a property filter, the best-ranked candidates are fetched first,
+        followed by the rest if not enough of them match.
+
+        Returns:
+            list[Node] | None:
+                The similar nodes, or None if the in-process search
+                is disabled or the embeddings could not be cached in process.
+
+        """
+        in_process_vector_index = self._in_process_vector_index
+        if in_process_vector_index is None:
+            return None
+
+        if not in_process_vector_index.contains(
+            collection, embedding_name
+        ) and not await self._load_in_process_vector_index(
+            in_process_vector_index,
+            collection=collection,
+            embedding_name=embedding_name,
+            dimensions=len(query_embedding),
+        ):
+            return None
+
+        ranked_uids = in_process_vector_index.search(
+            collection=collection,
+            embedding_name=embedding_name,
+            query_embedding=query_embedding,
+            similarity_metric=similarity_metric,
+            limit=limit if property_filter is None else None,
+        )
+        if ranked_uids is None:
+            return None
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
+        query_filter_string, query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "n",
+                "query_filter_params",
+                property_filter,
+            )
+        )
+
+        query = (
+            f"MATCH (n:{sanitized_collection})\n"
+            "WHERE n.uid IN $node_uids\n"
+            f"AND {query_filter_string}\n"
+            f"RETURN n.uid AS uid, {node_projection_string} AS node"
+        )
+
+        # With a property filter, try the best-ranked candidates first
+        # and only fetch the rest if not enough of them match.
+        candidate_uid_batches = [ranked_uids]
+        if property_filter is not None and limit is not None:
+            first_batch_size = limit * self._filtered_similarity_search_fudge_factor
+            candidate_uid_batches = [
+                ranked_uids[:first_batch_size],
+                ranked_uids[first_batch_size:],
+            ]
+
+        similar_neo4j_nodes: list[Neo4jNode | Mapping[str, Any]] = []
+        for batch_uids in candidate_uid_batches:
+            if len(batch_uids) == 0:
+                continue
+
+            records, _, _ = await self._driver.execute_query(
+                query,
+                node_uids=batch_uids,
+                query_filter_params=query_filter_params,
+                node_projection_params=node_projection_params,
+            )
+
+            neo4j_nodes_by_uid = {record["uid"]: record["node"] for record in records}
+            similar_neo4j_nodes.extend(
+                neo4j_nodes_by_uid[uid]
+                for uid in batch_uids
+                if uid in neo4j_nodes_by_uid
+            )
+
+            if limit is not None and len(similar_neo4j_nodes) >= limit:
+                similar_neo4j_nodes = similar_neo4j_nodes[:limit]
+                break
+
+        return Neo4jVectorGraphStore._nodes_from_neo4j_nodes(similar_neo4j_nodes)
+
+    async def _load_in_process_vector_index(
+        self,
+        in_process_vector_index: InProcessVectorIndex,
+        *,
+        collection: str,
+        embedding_name: str,
+        dimensions: int,
+    ) -> bool:
+        """Load the embeddings of a collection into the in-process index."""
+        if collection not in self._collection_node_counts:
+            self._collection_node_counts[collection] = await self._count_nodes(
+                collection,
+            )
+
+        estimated_nbytes = (
+            self._collection_node_counts[collection] * (dimensions + 1) * 4
+        )
+        if estimated_nbytes > in_process_vector_index.max_bytes:
+            return False
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        sanitized_embedding_name = Neo4jVectorGraphStore._sanitize_name(
+            mangle_embedding_name(embedding_name),
+        )
+
+        generation = in_process_vector_index.generation(collection)
+
+        records, _, _ = await self._driver.execute_query(
+            f"MATCH (n:{sanitized_collection})\n"
+            f"WHERE n.{sanitized_embedding_name} IS NOT NULL\n"
+            f"RETURN n.uid AS uid, n.{sanitized_embedding_name} AS embedding",
+        )
+
+        return in_process_vector_index.load(
+            collection=collection,
+            embedding_name=embedding_name,
+            uids=[record["uid"] for record in records],
+            embeddings=[record["embedding"] for record in records],
+            generation=generation,
+        )
+
     async def search_related_nodes(
         self,
         *,
@@ -747,10 +992,19 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         limit: int | None = None,
         edge_property_filter: FilterExpr | None = None,
         node_property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """Search nodes connected by a relation with optional property filters."""
         start_time = time.monotonic()
 
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
         edge_query_filter_string, edge_query_filter_params = (
             Neo4jVectorGraphStore._build_query_filter(
                 "r",
@@ -793,15 +1047,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             f"    (n:{sanitized_other_collection})"
             f"WHERE {edge_query_filter_string}\n"
             f"AND {node_query_filter_string}\n"
-            "RETURN DISTINCT n\n"
+            f"RETURN DISTINCT {node_projection_string} AS node\n"
             f"{'LIMIT $limit' if limit is not None else ''}",
             node_uid=str(this_node_uid),
             limit=limit,
             edge_query_filter_params=edge_query_filter_params,
             node_query_filter_params=node_query_filter_params,
+            node_projection_params=node_projection_params,
         )
 
-        related_neo4j_nodes = [record["n"] for record in records]
+        related_neo4j_nodes = [record["node"] for record in records]
         related_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
             related_neo4j_nodes
         )
@@ -816,6 +1071,108 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         return related_nodes
 
+    async def batch_search_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uids: Iterable[str],
+        find_sources: bool = True,
+        find_targets: bool = True,
+        limit: int | None = None,
+        edge_property_filter: FilterExpr | None = None,
+        node_property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
+    ) -> list[list[Node]]:
+        """Search nodes connected by a relation to each of many nodes at once."""
+        start_time = time.monotonic()
+
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
+        this_node_uids = [str(this_node_uid) for this_node_uid in this_node_uids]
+
+        if not (find_sources or find_targets) or len(this_node_uids) == 0:
+            end_time = time.monotonic()
+            self._collect_metrics(
+                self._batch_search_related_nodes_calls_counter,
+                self._batch_search_related_nodes_latency_summary,
+                start_time,
+                end_time,
+            )
+            return [[] for _ in this_node_uids]
+
+        edge_query_filter_string, edge_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "r",
+                "edge_query_filter_params",
+                edge_property_filter,
+            )
+        )
+        node_query_filter_string, node_query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "n",
+                "node_query_filter_params",
+                node_property_filter,
+            )
+        )
+
+        sanitized_this_collection = Neo4jVectorGraphStore._sanitize_name(
+            this_collection,
+        )
+        sanitized_other_collection = Neo4jVectorGraphStore._sanitize_name(
+            other_collection,
+        )
+        sanitized_relation = Neo4jVectorGraphStore._sanitize_name(relation)
+
+        records, _, _ = await self._driver.execute_query(
+            "UNWIND $node_uids AS node_uid\n"
+            "MATCH\n"
+            f"    (m:{sanitized_this_collection} {{uid: node_uid}})"
+            f"    {'-' if find_targets else '<-'}"
+            f"    [r:{sanitized_relation}]"
+            f"    {'-' if find_sources else '->'}"
+            f"    (n:{sanitized_other_collection})"
+            f"WHERE {edge_query_filter_string}\n"
+            f"AND {node_query_filter_string}\n"
+            f"WITH node_uid, collect(DISTINCT {node_projection_string})"
+            "    AS related_nodes\n"
+            "RETURN node_uid,"
+            f"    related_nodes{'[..$limit]' if limit is not None else ''}"
+            "    AS related_nodes",
+            node_uids=list(dict.fromkeys(this_node_uids)),
+            limit=limit,
+            edge_query_filter_params=edge_query_filter_params,
+            node_query_filter_params=node_query_filter_params,
+            node_projection_params=node_projection_params,
+        )
+
+        related_nodes_by_uid = {
+            record["node_uid"]: Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                record["related_nodes"],
+            )
+            for record in records
+        }
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._batch_search_related_nodes_calls_counter,
+            self._batch_search_related_nodes_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return [
+            list(related_nodes_by_uid.get(this_node_uid, []))
+            for this_node_uid in this_node_uids
+        ]
+
     async def search_directional_nodes(
         self,
         *,
@@ -826,10 +1183,19 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         include_equal_start: bool = False,
         limit: int | None = 1,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """Find nodes ordered by property values in a chosen direction."""
         start_time = time.monotonic()
 
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
         by_properties = list(by_properties)
         starting_at = list(starting_at)
         order_ascending = list(order_ascending)
@@ -894,15 +1260,16 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             f"MATCH (n:{sanitized_collection})\n"
             f"WHERE ({query_relational_requirements})\n"
             f"AND {query_filter_string}\n"
-            "RETURN n\n"
+            f"RETURN {node_projection_string} AS node\n"
             f"{query_order_by}"
             f"{'LIMIT $limit' if limit is not None else ''}",
             starting_at=starting_at,
             limit=limit,
             query_filter_params=query_filter_params,
+            node_projection_params=node_projection_params,
         )
 
-        directional_proximal_neo4j_nodes = [record["n"] for record in records]
+        directional_proximal_neo4j_nodes = [record["node"] for record in records]
         directional_proximal_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
             directional_proximal_neo4j_nodes,
         )
@@ -966,16 +1333,219 @@ class Neo4jVectorGraphStore(VectorGraphStore):
 
         return query_lexicographic_relational_requirements
 
+    async def batch_search_directional_nodes(
+        self,
+        *,
+        collection: str,
+        by_properties: Iterable[str],
+        starting_ats: Iterable[Iterable[OrderedPropertyValue | None]],
+        order_ascending: Iterable[bool],
+        include_equal_start: bool = False,
+        limit: int | None = 1,
+        property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
+    ) -> list[list[Node]]:
+        """Find nodes ordered by property values from each of many anchors."""
+        start_time = time.monotonic()
+
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
+        by_properties_list = list(by_properties)
+        starting_at_rows = [list(starting_at) for starting_at in starting_ats]
+        ascending_flags = list(order_ascending)
+
+        if not (len(by_properties_list) == len(ascending_flags) > 0) or any(
+            len(starting_at) != len(by_properties_list)
+            for starting_at in starting_at_rows
+        ):
+            raise ValueError(
+                "Lengths of "
+                "by_properties, each of starting_ats, and order_ascending "
+                "must be equal and greater than 0.",
+            )
+
+        if len(starting_at_rows) == 0:
+            end_time = time.monotonic()
+            self._collect_metrics(
+                self._batch_search_directional_nodes_calls_counter,
+                self._batch_search_directional_nodes_latency_summary,
+                start_time,
+                end_time,
+            )
+            return []
+
+        sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        sanitized_by_properties = [
+            Neo4jVectorGraphStore._sanitize_name(mangle_property_name(by_property))
+            for by_property in by_properties_list
+        ]
+
+        query_filter_string, query_filter_params = (
+            Neo4jVectorGraphStore._build_query_filter(
+                "n",
+                "query_filter_params",
+                property_filter,
+            )
+        )
+
+        # Anchors with None in the same positions share one query, so that
+        # the requirements are plain comparisons that can seek a range index.
+        anchor_indexes_by_null_positions: dict[tuple[bool, ...], list[int]] = {}
+        for anchor_index, starting_at in enumerate(starting_at_rows):
+            anchor_indexes_by_null_positions.setdefault(
+                tuple(value is None for value in starting_at),
+                [],
+            ).append(anchor_index)
+
+        async def search_anchor_group(
+            anchor_indexes: list[int],
+        ) -> list[tuple[int, list[Node]]]:
+            records, _, _ = await self._driver.execute_query(
+                Neo4jVectorGraphStore._batch_search_directional_nodes_query(
+                    sanitized_collection,
+                    sanitized_by_properties,
+                    starting_at_rows[anchor_indexes[0]],
+                    ascending_flags,
+                    include_equal_start=include_equal_start,
+                    has_limit=limit is not None,
+                    query_filter_string=query_filter_string,
+                    node_projection_string=node_projection_string,
+                ),
+                starting_ats=[
+                    starting_at_rows[anchor_index] for anchor_index in anchor_indexes
+                ],
+                limit=limit,
+                query_filter_params=query_filter_params,
+                node_projection_params=node_projection_params,
+            )
+            return [
+                (
+                    anchor_indexes[record["anchor_index"]],
+                    Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
+                        record["directional_nodes"],
+                    ),
+                )
+                for record in records
+            ]
+
+        anchor_group_results = await asyncio.gather(
+            *(
+                search_anchor_group(anchor_indexes)
+                for anchor_indexes in anchor_indexes_by_null_positions.values()
+            ),
+        )
+        directional_nodes_by_anchor_index = {
+            anchor_index: directional_nodes
+            for anchor_group_result in anchor_group_results
+            for anchor_index, directional_nodes in anchor_group_result
+        }
+
+        end_time = time.monotonic()
+        self._collect_metrics(
+            self._batch_search_directional_nodes_calls_counter,
+            self._batch_search_directional_nodes_latency_summary,
+            start_time,
+            end_time,
+        )
+
+        return [
+            directional_nodes_by_anchor_index.get(anchor_index, [])
+            for anchor_index in range(len(starting_at_rows))
+        ]
+
+    @staticmethod
+    def _batch_search_directional_nodes_query(
+        sanitized_collection: str,
+        sanitized_by_properties: list[str],
+        starting_at: list[OrderedPropertyValue | None],
+        order_ascending: list[bool],
+        *,
+        include_equal_start: bool,
+        has_limit: bool,
+        query_filter_string: str,
+        node_projection_string: str,
+    ) -> str:
+        """
+        Build the query searching from a group of anchors.
+
+        All anchors of the group have None starting values in the same
+        positions as starting_at. The anchors are passed in $starting_ats.
+        """
+        query_relational_requirements = (
+            Neo4jVectorGraphStore._query_lexicographic_relational_requirements(
+                "n",
+                "starting_ats[anchor_index]",
+                sanitized_by_properties,
+                starting_at,
+                order_ascending,
+            )
+            + (
+                (
+                    " OR ("
+                    + " AND ".join(
+                        f"(n.{sanitized_by_property}"
+                        f" = $starting_ats[anchor_index][{index}])"
+                        for index, sanitized_by_property in enumerate(
+                            sanitized_by_properties,
+                        )
+                    )
+                    + ")"
+                )
+                if include_equal_start
+                else ""
+            )
+        )
+
+        query_order_by = (
+            "    ORDER BY "
+            + ", ".join(
+                f"n.{sanitized_by_property} {
+                    'ASC' if order_ascending[index] else 'DESC'
+                }"
+                for index, sanitized_by_property in enumerate(sanitized_by_properties)
+            )
+            + "\n"
+        )
+
+        return (
+            "UNWIND range(0, size($starting_ats) - 1) AS anchor_index\n"
+            "CALL {\n"
+            "    WITH anchor_index\n"
+            f"    MATCH (n:{sanitized_collection})\n"
+            f"    WHERE ({query_relational_requirements})\n"
+            f"    AND {query_filter_string}\n"
+            f"    RETURN {node_projection_string} AS node\n"
+            f"{query_order_by}"
+            f"    {'LIMIT $limit' if has_limit else ''}\n"
+            "}\n"
+            "RETURN anchor_index, collect(node) AS directional_nodes"
+        )
+
     async def search_matching_nodes(
         self,
         *,
         collection: str,
         limit: int | None = None,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """Search nodes that match the provided property filters."""
         start_time = time.monotonic()
 
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
 
         query_filter_string, query_filter_params = (
@@ -989,13 +1559,14 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         records, _, _ = await self._driver.execute_query(
             f"MATCH (n:{sanitized_collection})\n"
             f"WHERE {query_filter_string}\n"
-            "RETURN n\n"
+            f"RETURN {node_projection_string} AS node\n"
             f"{'LIMIT $limit' if limit is not None else ''}",
             limit=limit,
             query_filter_params=query_filter_params,
+            node_projection_params=node_projection_params,
         )
 
-        matching_neo4j_nodes = [record["n"] for record in records]
+        matching_neo4j_nodes = [record["node"] for record in records]
         matching_nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(
             matching_neo4j_nodes
         )
@@ -1015,20 +1586,30 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         *,
         collection: str,
         node_uids: Iterable[str],
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """Retrieve nodes by uid from a specific collection."""
         start_time = time.monotonic()
 
+        node_projection_string, node_projection_params = (
+            Neo4jVectorGraphStore._build_node_projection(
+                "n",
+                "node_projection_params",
+                projection,
+            )
+        )
+
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
 
         records, _, _ = await self._driver.execute_query(
             "UNWIND $node_uids AS node_uid\n"
             f"MATCH (n:{sanitized_collection} {{uid: node_uid}})\n"
-            "RETURN n",
+            f"RETURN {node_projection_string} AS node",
             node_uids=[str(node_uid) for node_uid in node_uids],
+            node_projection_params=node_projection_params,
         )
 
-        neo4j_nodes = [record["n"] for record in records]
+        neo4j_nodes = [record["node"] for record in records]
         nodes = Neo4jVectorGraphStore._nodes_from_neo4j_nodes(neo4j_nodes)
 
         end_time = time.monotonic()
@@ -1051,14 +1632,21 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         start_time = time.monotonic()
 
         sanitized_collection = Neo4jVectorGraphStore._sanitize_name(collection)
+        node_uids = [str(node_uid) for node_uid in node_uids]
 
         await self._driver.execute_query(
             "UNWIND $node_uids AS node_uid\n"
             f"MATCH (n:{sanitized_collection} {{uid: node_uid}})\n"
             "DETACH DELETE n",
-            node_uids=[str(node_uid) for node_uid in node_uids],
+            node_uids=node_uids,
         )
 
+        if self._in_process_vector_index is not None:
+            self._in_process_vector_index.remove(
+                collection=collection,
+                uids=node_uids,
+            )
+
         end_time = time.monotonic()
         self._collect_metrics(
             self._delete_nodes_calls_counter,
@@ -1071,6 +1659,9 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         """Delete all nodes and relationships from the database."""
         await self._driver.execute_query("MATCH (n) DETACH DELETE n")
 
+        if self._in_process_vector_index is not None:
+            self._in_process_vector_index.clear()
+
     async def close(self) -> None:
         """Close the underlying Neo4j driver."""
         await self._driver.close()
@@ -1462,6 +2053,24 @@ class Neo4jVectorGraphStore(VectorGraphStore):
             f"{sanitized_property_names_string}"
         )
 
+    @staticmethod
+    def _vector_similarity_function(similarity_metric: SimilarityMetric) -> str:
+        """
+        Get the Cypher vector similarity function for a similarity metric.
+
+        Args:
+            similarity_metric (SimilarityMetric): The similarity metric.
+
+        Returns:
+            str: The name of the Cypher vector similarity function.
+
+        """
+        match similarity_metric:
+            case SimilarityMetric.EUCLIDEAN:
+                return "vector.similarity.euclidean"
+            case _:
+                return "vector.similarity.cosine"
+
     @staticmethod
     def _similarity_metric_property_name(embedding_name: str) -> str:
         """
@@ -1476,22 +2085,94 @@ class Neo4jVectorGraphStore(VectorGraphStore):
         """
         return f"similarity_metric_for_{embedding_name}"
 
+    @staticmethod
+    def _build_node_projection(
+        entity_query_alias: str,
+        query_value_parameter: str,
+        projection: NodeProjection | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build a Cypher expression returning the projected data of a node.
+
+        Without a projection, the whole node is returned. Otherwise, the
+        expression returns a map of the node UID and the selected entries,
+        which _nodes_from_neo4j_nodes decodes like a node.
+
+        Args:
+            entity_query_alias (str): The alias of the node in the query.
+            query_value_parameter (str): The query parameter for projection values.
+            projection (NodeProjection | None): The node data to return.
+
+        Returns:
+            tuple[str, dict[str, Any]]:
+                The Cypher expression and its query parameter values.
+
+        """
+        if projection is None or (
+            projection.property_names is None and projection.include_embeddings
+        ):
+            return entity_query_alias, {}
+
+        sanitized_property_prefix = Neo4jVectorGraphStore._sanitize_name(
+            mangle_property_name(""),
+        )
+
+        if projection.property_names is None:
+            key_requirement = (
+                f"key STARTS WITH ${query_value_parameter}.property_prefix"
+            )
+        else:
+            key_requirement = f"key IN ${query_value_parameter}.property_keys"
+            if projection.include_embeddings:
+                # Embeddings and their similarity metrics are not properties.
+                key_requirement += (
+                    f" OR NOT key STARTS WITH ${query_value_parameter}.property_prefix"
+                )
+
+        expression = (
+            f"{{uid: {entity_query_alias}.uid, entries: ["
+            f"key IN keys({entity_query_alias}) WHERE {key_requirement}"
+            f" | [key, {entity_query_alias}[key]]"
+            "]}"
+        )
+        query_values = {
+            "property_prefix": sanitized_property_prefix,
+            "property_keys": [
+                Neo4jVectorGraphStore._sanitize_name(
+                    mangle_property_name(property_name),
+                )
+                for property_name in projection.property_names or ()
+            ],
+        }
+        return expression, query_values
+
     @staticmethod
     def _nodes_from_neo4j_nodes(
-        neo4j_nodes: Iterable[Neo4jNode],
+        neo4j_nodes: Iterable[Neo4jNode | Mapping[str, Any]],
     ) -> list[Node]:
         """
         Convert a collection of Neo4jNodes to a list of Nodes.
 
         Args:
-            neo4j_nodes (Iterable[Neo4jNode]): Iterable of Neo4jNodes.
+            neo4j_nodes (Iterable[Neo4jNode | Mapping[str, Any]]):
+                Iterable of Neo4jNodes
+                or of maps returned by a node projection.
 
         Returns:
             list[Node]: List of Node objects.
 
         """
         nodes = []
-        for neo4j_node in neo4j_nodes:
+        for neo4j_node_or_projection in neo4j_nodes:
+            neo4j_node = (
+                neo4j_node_or_projection
+                if isinstance(neo4j_node_or_projection, Neo4jNode)
+                else {
+                    "uid": neo4j_node_or_projection["uid"],
+                    **dict(neo4j_node_or_projection["entries"]),
+                }
+            )
+
             node_properties = {}
             node_embeddings = {}
 
@@ -13,7 +13,7 @@ from memmachine.common.filter.filter_parser import (
     FilterExpr,
 )
 
-from .data_types import Edge, Node, OrderedPropertyValue
+from .data_types import Edge, Node, NodeProjection, OrderedPropertyValue
 
 
 class VectorGraphStore(ABC):
@@ -73,6 +73,7 @@ class VectorGraphStore(ABC):
         similarity_metric: SimilarityMetric = SimilarityMetric.COSINE,
         limit: int | None = 100,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """
         Search for nodes with embeddings similar to the query embedding.
@@ -95,6 +96,10 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
 
         Returns:
             list[Node]:
@@ -117,6 +122,7 @@ class VectorGraphStore(ABC):
         limit: int | None = None,
         edge_property_filter: FilterExpr | None = None,
         node_property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """
         Search for nodes related to the specified node via edges.
@@ -152,6 +158,10 @@ class VectorGraphStore(ABC):
                 Filter expression tree for node properties.
                 If None or empty, no property filtering is applied
                 (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
 
         Returns:
             list[Node]:
@@ -161,6 +171,74 @@ class VectorGraphStore(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def batch_search_related_nodes(
+        self,
+        *,
+        relation: str,
+        other_collection: str,
+        this_collection: str,
+        this_node_uids: Iterable[str],
+        find_sources: bool = True,
+        find_targets: bool = True,
+        limit: int | None = None,
+        edge_property_filter: FilterExpr | None = None,
+        node_property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
+    ) -> list[list[Node]]:
+        """
+        Search for nodes related to each of the specified nodes via edges.
+
+        Equivalent to calling search_related_nodes
+        for each UID in this_node_uids,
+        but in a single round-trip to the store.
+
+        Args:
+            relation (str):
+                Relation that the edges represent.
+            other_collection (str):
+                Collection that the related nodes belong to.
+            this_collection (str):
+                Collection that the specified nodes belong to.
+            this_node_uids (Iterable[str]):
+                UIDs of the nodes to find related nodes for.
+            find_sources (bool):
+                Whether to return nodes
+                that are sources of edges
+                pointing to the specified nodes
+                (default: True).
+            find_targets (bool):
+                Whether to return nodes
+                that are targets of edges
+                originating from the specified nodes
+                (default: True).
+            limit (int | None):
+                Maximum number of related nodes to return
+                for each specified node.
+                If None, return as many related nodes as possible
+                (default: None).
+            edge_property_filter (FilterExpr | None):
+                Filter expression tree for edge properties.
+                If None or empty, no property filtering is applied
+                (default: None).
+            node_property_filter (FilterExpr | None):
+                Filter expression tree for node properties.
+                If None or empty, no property filtering is applied
+                (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
+
+        Returns:
+            list[list[Node]]:
+                Lists of Node objects
+                that are related to each specified node,
+                in the same order as this_node_uids.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_directional_nodes(
         self,
@@ -172,6 +250,7 @@ class VectorGraphStore(ABC):
         include_equal_start: bool = False,
         limit: int | None = 1,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """
         Search for nodes ordered by a specific property.
@@ -198,6 +277,10 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
 
         Returns:
             list[Node]:
@@ -206,6 +289,61 @@ class VectorGraphStore(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def batch_search_directional_nodes(
+        self,
+        *,
+        collection: str,
+        by_properties: Iterable[str],
+        starting_ats: Iterable[Iterable[OrderedPropertyValue | None]],
+        order_ascending: Iterable[bool],
+        include_equal_start: bool = False,
+        limit: int | None = 1,
+        property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
+    ) -> list[list[Node]]:
+        """
+        Search for nodes ordered by a specific property from many anchors.
+
+        Equivalent to calling search_directional_nodes
+        for each starting_at in starting_ats,
+        but in a single round-trip to the store.
+
+        Args:
+            collection (str):
+                Collection that the nodes belong to.
+            by_properties (Iterable[str]):
+                Hierarchy of property names to order the nodes by.
+            starting_ats (Iterable[Iterable[OrderedPropertyValue | None]]):
+                Values for each property to start each search from.
+                If a value is None, start from the minimum or maximum
+                based on order_ascending.
+            order_ascending (Iterable[bool]):
+                Whether to order each property ascending (True) or descending (False).
+            include_equal_start (bool):
+                Whether to include nodes with all property values
+                equal to the starting_at values.
+            limit (int | None):
+                Maximum number of nodes to return for each anchor.
+                If None, return as many matching nodes as possible
+                (default: 1).
+            property_filter (FilterExpr | None):
+                Filter expression tree.
+                If None or empty, no property filtering is applied
+                (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
+
+        Returns:
+            list[list[Node]]:
+                Lists of Node objects ordered by the specified property,
+                in the same order as starting_ats.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def search_matching_nodes(
         self,
@@ -213,6 +351,7 @@ class VectorGraphStore(ABC):
         collection: str,
         limit: int | None = None,
         property_filter: FilterExpr | None = None,
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """
         Search for nodes matching the specified properties.
@@ -228,6 +367,10 @@ class VectorGraphStore(ABC):
                 Filter expression tree.
                 If None or empty, no property filtering is applied
                 (default: None).
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
 
         Returns:
             list[Node]:
@@ -242,6 +385,7 @@ class VectorGraphStore(ABC):
         *,
         collection: str,
         node_uids: Iterable[str],
+        projection: NodeProjection | None = None,
     ) -> list[Node]:
         """
         Get nodes from the collection.
@@ -251,6 +395,10 @@ class VectorGraphStore(ABC):
                 Name of the collection containing the nodes.
             node_uids (Iterable[str]):
                 Iterable of UIDs of the nodes to retrieve.
+            projection (NodeProjection | None):
+                Node data to return.
+                If None, return all properties and embeddings
+                (default: None).
 
         Returns:
             list[Node]:
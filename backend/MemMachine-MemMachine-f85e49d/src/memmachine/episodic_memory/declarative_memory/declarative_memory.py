@@ -25,7 +25,12 @@ from memmachine.common.filter.filter_parser import (
     Or as FilterOr,
 )
 from memmachine.common.reranker.reranker import Reranker
-from memmachine.common.vector_graph_store import Edge, Node, VectorGraphStore
+from memmachine.common.vector_graph_store import (
+    Edge,
+    Node,
+    NodeProjection,
+    VectorGraphStore,
+)
 
 from .data_types import (
     ContentType,
@@ -78,6 +83,10 @@ class DeclarativeMemoryParams(BaseModel):
 class DeclarativeMemory:
     """Declarative memory system."""
 
+    # Searches only read node UIDs and episode properties, never embeddings.
+    _UID_ONLY_PROJECTION = NodeProjection(property_names=(), include_embeddings=False)
+    _NO_EMBEDDINGS_PROJECTION = NodeProjection(include_embeddings=False)
+
     def __init__(self, params: DeclarativeMemoryParams) -> None:
         """
         Initialize a DeclarativeMemory with the provided parameters.
@@ -315,28 +324,30 @@ class DeclarativeMemory:
             similarity_metric=self._embedder.similarity_metric,
             limit=100,
             property_filter=mangled_property_filter,
+            projection=DeclarativeMemory._UID_ONLY_PROJECTION,
         )
 
         # Get source episodes of matched derivatives.
-        search_derivatives_source_episode_nodes_tasks = [
-            self._vector_graph_store.search_related_nodes(
+        derivatives_source_episode_nodes = (
+            await self._vector_graph_store.batch_search_related_nodes(
                 relation=self._derived_from_relation,
                 other_collection=self._episode_collection,
                 this_collection=self._derivative_collection,
-                this_node_uid=matched_derivative_node.uid,
+                this_node_uids=[
+                    matched_derivative_node.uid
+                    for matched_derivative_node in matched_derivative_nodes
+                ],
                 find_sources=False,
                 find_targets=True,
                 node_property_filter=mangled_property_filter,
+                projection=DeclarativeMemory._NO_EMBEDDINGS_PROJECTION,
             )
-            for matched_derivative_node in matched_derivative_nodes
-        ]
+        )
 
         # Use a dict instead of a set to preserve order.
         source_episode_nodes = dict.fromkeys(
             episode_node
-            for episode_nodes in await asyncio.gather(
-                *search_derivatives_source_episode_nodes_tasks,
-            )
+            for episode_nodes in derivatives_source_episode_nodes
             for episode_node in episode_nodes
         )
 
@@ -346,15 +357,10 @@ class DeclarativeMemory:
             for source_episode_node in source_episode_nodes
         ]
 
-        contextualize_episode_tasks = [
-            self._contextualize_episode(
-                nuclear_episode,
-                mangled_property_filter=mangled_property_filter,
-            )
-            for nuclear_episode in nuclear_episodes
-        ]
-
-        episode_contexts = await asyncio.gather(*contextualize_episode_tasks)
+        episode_contexts = await self._contextualize_episodes(
+            nuclear_episodes,
+            mangled_property_filter=mangled_property_filter,
+        )
 
         # Rerank episode contexts.
         episode_context_scores = await self._score_episode_contexts(
@@ -383,42 +389,57 @@ class DeclarativeMemory:
         )
         return unified_episode_context
 
-    async def _contextualize_episode(
+    async def _contextualize_episodes(
         self,
-        nuclear_episode: Episode,
+        nuclear_episodes: Iterable[Episode],
         max_backward_episodes: int = 1,
         max_forward_episodes: int = 2,
         mangled_property_filter: FilterExpr | None = None,
-    ) -> list[Episode]:
-        previous_episode_nodes = (
-            await self._vector_graph_store.search_directional_nodes(
+    ) -> list[list[Episode]]:
+        nuclear_episodes = list(nuclear_episodes)
+        if len(nuclear_episodes) == 0:
+            return []
+
+        starting_ats = [
+            (nuclear_episode.timestamp, str(nuclear_episode.uid))
+            for nuclear_episode in nuclear_episodes
+        ]
+
+        search_previous_episode_nodes_task = (
+            self._vector_graph_store.batch_search_directional_nodes(
                 collection=self._episode_collection,
                 by_properties=("timestamp", "uid"),
-                starting_at=(
-                    nuclear_episode.timestamp,
-                    str(nuclear_episode.uid),
-                ),
+                starting_ats=starting_ats,
                 order_ascending=(False, False),
                 include_equal_start=False,
                 limit=max_backward_episodes,
                 property_filter=mangled_property_filter,
+                projection=DeclarativeMemory._NO_EMBEDDINGS_PROJECTION,
             )
         )
 
-        next_episode_nodes = await self._vector_graph_store.search_directional_nodes(
-            collection=self._episode_collection,
-            by_properties=("timestamp", "uid"),
-            starting_at=(
-                nuclear_episode.timestamp,
-                str(nuclear_episode.uid),
-            ),
-            order_ascending=(True, True),
-            include_equal_start=False,
-            limit=max_forward_episodes,
-            property_filter=mangled_property_filter,
+        search_next_episode_nodes_task = (
+            self._vector_graph_store.batch_search_directional_nodes(
+                collection=self._episode_collection,
+                by_properties=("timestamp", "uid"),
+                starting_ats=starting_ats,
+                order_ascending=(True, True),
+                include_equal_start=False,
+                limit=max_forward_episodes,
+                property_filter=mangled_property_filter,
+                projection=DeclarativeMemory._NO_EMBEDDINGS_PROJECTION,
+            )
         )
 
-        context = (
+        (
+            nuclear_previous_episode_nodes,
+            nuclear_next_episode_nodes,
+        ) = await asyncio.gather(
+            search_previous_episode_nodes_task,
+            search_next_episode_nodes_task,
+        )
+
+        contexts = [
             [
                 DeclarativeMemory._episode_from_episode_node(episode_node)
                 for episode_node in reversed(previous_episode_nodes)
@@ -428,9 +449,15 @@ class DeclarativeMemory:
                 DeclarativeMemory._episode_from_episode_node(episode_node)
                 for episode_node in next_episode_nodes
             ]
-        )
+            for nuclear_episode, previous_episode_nodes, next_episode_nodes in zip(
+                nuclear_episodes,
+                nuclear_previous_episode_nodes,
+                nuclear_next_episode_nodes,
+                strict=True,
+            )
+        ]
 
-        return context
+        return contexts
 
     async def _score_episode_contexts(
         self,
@@ -484,6 +511,7 @@ class DeclarativeMemory:
         episode_nodes = await self._vector_graph_store.get_nodes(
             collection=self._episode_collection,
             node_uids=uids,
+            projection=DeclarativeMemory._NO_EMBEDDINGS_PROJECTION,
         )
 
         episodes = [
@@ -505,6 +533,7 @@ class DeclarativeMemory:
         matching_episode_nodes = await self._vector_graph_store.search_matching_nodes(
             collection=self._episode_collection,
             property_filter=mangled_property_filter,
+            projection=DeclarativeMemory._NO_EMBEDDINGS_PROJECTION,
         )
 
         matching_episodes = [
@@ -518,23 +547,21 @@ class DeclarativeMemory:
         """Delete episodes by their UIDs."""
         uids = list(uids)
 
-        search_derived_derivative_nodes_tasks = [
-            self._vector_graph_store.search_related_nodes(
+        episodes_derived_derivative_nodes = (
+            await self._vector_graph_store.batch_search_related_nodes(
                 relation=self._derived_from_relation,
                 other_collection=self._derivative_collection,
                 this_collection=self._episode_collection,
-                this_node_uid=episode_uid,
+                this_node_uids=uids,
                 find_sources=True,
                 find_targets=False,
+                projection=DeclarativeMemory._UID_ONLY_PROJECTION,
             )
-            for episode_uid in uids
-        ]
+        )
 
         derived_derivative_nodes = [
             derivative_node
-            for derivative_nodes in await asyncio.gather(
-                *search_derived_derivative_nodes_tasks,
-            )
+            for derivative_nodes in episodes_derived_derivative_nodes
             for derivative_node in derivative_nodes
         ]
 
@@ -203,12 +203,20 @@ class EpisodicMemory:
         """
         return self._session_key
 
-    async def add_memory_episodes(self, episodes: list[Episode]) -> None:
+    async def add_memory_episodes(
+        self,
+        episodes: list[Episode],
+        *,
+        add_to_long_term_memory: bool = True,
+    ) -> None:
         """
         Add a new memory episode to both session and declarative memory.
 
         Args:
             episodes: Episode instances to ingest.
+            add_to_long_term_memory: Whether to add the episodes to long-term
+                memory as well. When False, the caller is responsible for
+                adding them later with add_long_term_memory_episodes.
 
         """
         if not self._enabled:
@@ -217,19 +225,13 @@ class EpisodicMemory:
 
         if self._closed:
             raise RuntimeError(f"Memory is closed {self._session_key}")
-        # Create filterable property
-        for episode in episodes:
-            if episode.metadata is not None and episode.filterable_metadata is None:
-                episode.filterable_metadata = {}
-                for key, value in episode.metadata.items():
-                    if isinstance(value, get_args(FilterablePropertyValue)):
-                        episode.filterable_metadata[key] = value
+        EpisodicMemory._create_filterable_metadata(episodes)
 
         # Add the episode to both memory stores concurrently
         tasks: list[Coroutine] = []
         if self._short_term_memory:
             tasks.append(self._short_term_memory.add_episodes(episodes))
-        if self._long_term_memory:
+        if self._long_term_memory and add_to_long_term_memory:
             tasks.append(self._long_term_memory.add_episodes(episodes))
         await asyncio.gather(
             *tasks,
@@ -239,6 +241,32 @@ class EpisodicMemory:
         self._ingestion_latency_summary.observe(delta)
         self._ingestion_counter.increment()
 
+    async def add_long_term_memory_episodes(self, episodes: list[Episode]) -> None:
+        """
+        Add episodes to long-term memory only.
+
+        Args:
+            episodes: Episode instances already added to short-term memory.
+
+        """
+        if not self._enabled or self._long_term_memory is None:
+            return
+
+        if self._closed:
+            raise RuntimeError(f"Memory is closed {self._session_key}")
+        EpisodicMemory._create_filterable_metadata(episodes)
+
+        await self._long_term_memory.add_episodes(episodes)
+
+    @staticmethod
+    def _create_filterable_metadata(episodes: list[Episode]) -> None:
+        for episode in episodes:
+            if episode.metadata is not None and episode.filterable_metadata is None:
+                episode.filterable_metadata = {}
+                for key, value in episode.metadata.items():
+                    if isinstance(value, get_args(FilterablePropertyValue)):
+                        episode.filterable_metadata[key] = value
+
     async def close(self) -> None:
         """
         Decrement the reference count and close the underlying memory stores.
@@ -307,6 +335,7 @@ class EpisodicMemory:
         query: str,
         limit: int | None = None,
         property_filter: FilterExpr | None = None,
+        unindexed_episodes: list[Episode] | None = None,
     ) -> QueryResponse | None:
         """
         Retrieve relevant context for a given query from all memory stores.
@@ -321,6 +350,10 @@ class EpisodicMemory:
                    applied to both short and long term memories. The default
                    value is 20.
             property_filter: Properties to filter declarative memory searches.
+            unindexed_episodes: Episodes matching property_filter that are
+                   not added to long-term memory yet. As they are not ranked,
+                   they only fill the slots left by the long-term memory
+                   results, most recent first.
 
         Returns:
             A tuple containing a list of short term memory Episode objects,
@@ -367,6 +400,18 @@ class EpisodicMemory:
             )
             short_episode, short_summary = session_result
 
+        if unindexed_episodes:
+            # Keep the episodes waiting for long-term memory searchable,
+            # without displacing the ranked results
+            long_episode = [
+                *long_episode,
+                *sorted(
+                    unindexed_episodes,
+                    key=lambda episode: episode.created_at,
+                    reverse=True,
+                ),
+            ]
+
         # Deduplicate episodes from both memory stores, prioritizing
         # short-term memory
         episode_uid_set = {episode.uid for episode in short_episode}
@@ -376,6 +421,7 @@ class EpisodicMemory:
             if episode.uid not in episode_uid_set:
                 episode_uid_set.add(episode.uid)
                 unique_long_episodes.append(episode)
+        unique_long_episodes = unique_long_episodes[:search_limit]
 
         end_time = time.monotonic_ns()
         delta = (end_time - start_time) / 1000000
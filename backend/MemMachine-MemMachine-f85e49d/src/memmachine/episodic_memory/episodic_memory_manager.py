@@ -1,12 +1,15 @@
 """Factory and manager for per-session episodic memory instances."""
 
 import asyncio
+import logging
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.configuration.episodic_config import EpisodicMemoryConf
+from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.resource_manager import CommonResourceManager
 from memmachine.common.session_manager.session_data_manager import SessionDataManager
 from memmachine.episodic_memory.episodic_memory import EpisodicMemory
@@ -16,6 +19,8 @@ from memmachine.episodic_memory.service_locator import (
 
 from .instance_lru_cache import MemoryInstanceCache
 
+logger = logging.getLogger(__name__)
+
 
 class EpisodicMemoryManagerParams(BaseModel):
     """
@@ -26,6 +31,7 @@ class EpisodicMemoryManagerParams(BaseModel):
         max_life_time (int): The maximum idle lifetime of an instance in seconds.
         resource_manager (ResourceManager): The resource manager.
         session_data_manager (SessionDataManager): The session data manager.
+        metrics_factory (MetricsFactory | None): Factory for warm-up metrics.
 
     """
 
@@ -47,6 +53,10 @@ class EpisodicMemoryManagerParams(BaseModel):
         ...,
         description="Session data manager",
     )
+    metrics_factory: InstanceOf[MetricsFactory] | None = Field(
+        default=None,
+        description="An instance of MetricsFactory for collecting usage metrics",
+    )
 
 
 class EpisodicMemoryManager:
@@ -75,7 +85,19 @@ class EpisodicMemoryManager:
         self._resource_manager = params.resource_manager
         self._session_data_manager = params.session_data_manager
 
-        self._lock = asyncio.Lock()
+        self._warm_up_latency_summary = None
+        self._warm_up_sessions_counter = None
+        metrics_factory = params.metrics_factory
+        if metrics_factory is not None:
+            self._warm_up_latency_summary = metrics_factory.get_summary(
+                "episodic_memory_manager_warm_up_latency_seconds",
+                "Latency in seconds for warming up EpisodicMemoryManager",
+            )
+            self._warm_up_sessions_counter = metrics_factory.get_counter(
+                "episodic_memory_manager_warm_up_sessions",
+                "Number of sessions loaded by EpisodicMemoryManager warm-up",
+            )
+
         self._closed = False
         self._check_instance_task = asyncio.create_task(
             self._check_instance_life_time(),
@@ -84,8 +106,70 @@ class EpisodicMemoryManager:
     async def _check_instance_life_time(self) -> None:
         while not self._closed:
             await asyncio.sleep(2)
-            async with self._lock:
-                await self._instance_cache.clean_old_instance()
+            await self._instance_cache.clean_old_instance()
+
+    def _check_not_closed(self, session_key: str) -> None:
+        if self._closed:
+            raise RuntimeError(f"Memory is closed {session_key}")
+
+    async def warm_up(self, max_sessions: int, max_concurrency: int) -> int:
+        """
+        Load the most recently active sessions into the instance cache.
+
+        Sessions are loaded like `open_episodic_memory` and released right
+        away, so later opens hit the cache. Sessions that fail to load are
+        logged and skipped.
+
+        Args:
+            max_sessions: The maximum number of sessions to load.
+                It is capped at the instance cache size.
+            max_concurrency: The maximum number of sessions loaded at once.
+
+        Returns:
+            The number of sessions loaded.
+
+        """
+        max_sessions = min(max_sessions, self._instance_cache.capacity)
+        if max_sessions <= 0:
+            return 0
+
+        start_time = time.monotonic()
+        session_keys = await self._session_data_manager.get_recent_session_keys(
+            max_sessions
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def warm_up_session(session_key: str) -> bool:
+            async with semaphore:
+                try:
+                    async with self.open_episodic_memory(session_key):
+                        pass
+                except Exception:
+                    logger.exception(
+                        "Failed to warm up episodic memory for session %s",
+                        session_key,
+                    )
+                    return False
+            return True
+
+        results = await asyncio.gather(
+            *[warm_up_session(session_key) for session_key in session_keys],
+        )
+        num_loaded = sum(results)
+        latency = time.monotonic() - start_time
+
+        if self._warm_up_latency_summary is not None:
+            self._warm_up_latency_summary.observe(latency)
+        if self._warm_up_sessions_counter is not None:
+            self._warm_up_sessions_counter.increment(value=num_loaded)
+
+        logger.info(
+            "Warmed up %d of %d episodic memory sessions in %.3f seconds",
+            num_loaded,
+            len(session_keys),
+            latency,
+        )
+        return num_loaded
 
     @asynccontextmanager
     async def open_episodic_memory(
@@ -109,35 +193,26 @@ class EpisodicMemoryManager:
             ValueError: If episodic memory is not enabled in the configuration.
 
         """
-        instance: EpisodicMemory | None = None
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {session_key}")
+        self._check_not_closed(session_key)
 
-            # Check if the instance is in the cache and in use
-            instance = self._instance_cache.get(session_key)
-            if instance is None:
-                # load from the database
-                session_info = await self._session_data_manager.get_session_info(
-                    session_key
-                )
-                if session_info is None:
-                    raise RuntimeError(
-                        f"No session info found for session {session_key}"
-                    )
+        async def load() -> EpisodicMemory:
+            session_info = await self._session_data_manager.get_session_info(
+                session_key
+            )
+            if session_info is None:
+                raise RuntimeError(f"No session info found for session {session_key}")
 
-                episodic_memory_params = await episodic_memory_params_from_config(
-                    session_info.episode_memory_conf,
-                    self._resource_manager,
-                )
-                instance = EpisodicMemory(episodic_memory_params)
-                await self._instance_cache.add(session_key, instance)
+            episodic_memory_params = await episodic_memory_params_from_config(
+                session_info.episode_memory_conf,
+                self._resource_manager,
+            )
+            return EpisodicMemory(episodic_memory_params)
+
+        instance = await self._instance_cache.get_or_load(session_key, load)
         try:
             yield instance
         finally:
-            if instance is not None:
-                async with self._lock:
-                    self._instance_cache.put(session_key)
+            self._instance_cache.put(session_key)
 
     @asynccontextmanager
     async def create_episodic_memory(
@@ -162,13 +237,11 @@ class EpisodicMemoryManager:
             ValueError: If a session with the given session_key already exists.
 
         """
-        instance: EpisodicMemory | None = None
         if config is None:
             config = {}
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {session_key}")
+        self._check_not_closed(session_key)
 
+        async with self._instance_cache.exclusive(session_key):
             await self._session_data_manager.create_new_session(
                 session_key,
                 config,
@@ -185,9 +258,7 @@ class EpisodicMemoryManager:
         try:
             yield instance
         finally:
-            if instance is not None:
-                async with self._lock:
-                    self._instance_cache.put(session_key)
+            self._instance_cache.put(session_key)
 
     @asynccontextmanager
     async def open_or_create_episodic_memory(
@@ -209,29 +280,18 @@ class EpisodicMemoryManager:
             config: Additional configuration values for the session metadata.
 
         """
-        instance: EpisodicMemory | None = None
         if config is None:
             config = {}
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {session_key}")
-
-            # Check if the instance is in the cache
-            instance = self._instance_cache.get(session_key)
-            if instance is None:
-                # try to load from the database
-                session_info = await self._session_data_manager.get_session_info(
-                    session_key
-                )
-                if session_info is not None:
-                    episodic_memory_params = await episodic_memory_params_from_config(
-                        session_info.episode_memory_conf,
-                        self._resource_manager,
-                    )
-                    instance = EpisodicMemory(episodic_memory_params)
-                    await self._instance_cache.add(session_key, instance)
+        self._check_not_closed(session_key)
 
-            if instance is None:
+        async def load_or_create() -> EpisodicMemory:
+            # try to load from the database
+            session_info = await self._session_data_manager.get_session_info(
+                session_key
+            )
+            if session_info is not None:
+                memory_conf = session_info.episode_memory_conf
+            else:
                 # session does not exist, create it
                 await self._session_data_manager.create_new_session(
                     session_key,
@@ -240,18 +300,22 @@ class EpisodicMemoryManager:
                     description,
                     metadata,
                 )
-                episodic_memory_params = await episodic_memory_params_from_config(
-                    episodic_memory_config,
-                    self._resource_manager,
-                )
-                instance = EpisodicMemory(episodic_memory_params)
-                await self._instance_cache.add(session_key, instance)
+                memory_conf = episodic_memory_config
+
+            episodic_memory_params = await episodic_memory_params_from_config(
+                memory_conf,
+                self._resource_manager,
+            )
+            return EpisodicMemory(episodic_memory_params)
+
+        instance = await self._instance_cache.get_or_load(
+            session_key,
+            load_or_create,
+        )
         try:
             yield instance
         finally:
-            if instance is not None:
-                async with self._lock:
-                    self._instance_cache.put(session_key)
+            self._instance_cache.put(session_key)
 
     async def delete_episodic_session(self, session_key: str) -> None:
         """
@@ -261,15 +325,14 @@ class EpisodicMemoryManager:
             session_key: The unique identifier of the session to delete.
 
         """
-        instance: EpisodicMemory | None = None
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {session_key}")
+        self._check_not_closed(session_key)
+
+        async with self._instance_cache.exclusive(session_key):
             # Check if the instance is in the cache and in use
             ref_count = self._instance_cache.get_ref_count(session_key)
-            instance = self._instance_cache.get(session_key)
-            if instance and ref_count > 0:
+            if ref_count > 0:
                 raise RuntimeError(f"Session {session_key} is still in use {ref_count}")
+            instance = self._instance_cache.get(session_key)
             if instance:
                 self._instance_cache.put(session_key)
             self._instance_cache.erase(session_key)
@@ -321,29 +384,26 @@ class EpisodicMemoryManager:
             session_key: The unique identifier of the session to close.
 
         """
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError(f"Memory is closed {session_key}")
-            ref_count = self._instance_cache.get_ref_count(session_key)
-            if ref_count < 0:
-                return
-            if ref_count > 0:
-                raise RuntimeError(f"Session {session_key} is busy")
-            instance = self._instance_cache.get(session_key)
-            if instance is not None:
-                await instance.close()
-                self._instance_cache.put(session_key)
-            self._instance_cache.erase(session_key)
+        self._check_not_closed(session_key)
+
+        ref_count = self._instance_cache.get_ref_count(session_key)
+        if ref_count < 0:
+            return
+        if ref_count > 0:
+            raise RuntimeError(f"Session {session_key} is busy")
+        instance = self._instance_cache.get(session_key)
+        self._instance_cache.put(session_key)
+        self._instance_cache.erase(session_key)
+        if instance is not None:
+            await instance.close()
 
     async def close(self) -> None:
         """Close all open episodic memory instances and the session storage."""
-        async with self._lock:
-            if self._closed:
-                return
-            await self._instance_cache.clear_cache()
-            await self._session_data_manager.close()
-            self._instance_cache.clear()
-            self._closed = True
+        if self._closed:
+            return
+        self._closed = True
+        await self._instance_cache.clear_cache()
+        await self._session_data_manager.close()
 
         if hasattr(self, "_check_instance_task"):
             await self._check_instance_task
@@ -1,7 +1,8 @@
 """LRU cache implementation for managing episodic memory instances."""
 
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import cast
 
@@ -29,6 +30,11 @@ class MemoryInstanceCache:
     """
     Implement an LRU cache that manages memory instances.
 
+    Cache mutations are synchronous, so they are atomic with respect to other
+    coroutines and need no lock. Loading a missing instance is single-flight:
+    concurrent requests for the same key share one load, while loads for
+    different keys run concurrently.
+
     Attributes:
         capacity (int): The maximum number of items the cache can hold.
         cache (dict): A dictionary mapping keys to Node objects for O(1) lookups.
@@ -44,6 +50,9 @@ class MemoryInstanceCache:
         self.capacity = capacity
         self.max_lifetime = max_lifetime
         self.cache: dict[str, Node] = {}  # Stores key -> Node
+        # Stores key -> future resolved when an in-flight load or exclusive
+        # section for the key finishes.
+        self._pending: dict[str, asyncio.Future[None]] = {}
 
         # Initialize sentinel head and tail nodes for the doubly linked list.
         # head.next points to the most recently used item.
@@ -122,17 +131,21 @@ class MemoryInstanceCache:
         close_memory_coroutines.extend(
             cast(EpisodicMemory, node.value).close() for node in self.cache.values()
         )
-        await asyncio.gather(*close_memory_coroutines)
         self.cache.clear()
         self.head.next = self.tail
         self.tail.prev = self.head
+        await asyncio.gather(*close_memory_coroutines)
 
     async def add(self, key: str, value: EpisodicMemory) -> None:
         """Add a new item to the cache."""
+        await self._close_instances(self._insert(key, value))
+
+    def _insert(self, key: str, value: EpisodicMemory) -> list[EpisodicMemory]:
+        """Insert a new item and return the evicted instances to be closed."""
         if key in self.cache:
             raise ValueError(f"Key {key} already exists")
 
-        # Add new key
+        evicted: list[EpisodicMemory] = []
         lru_node = self.tail.prev
         while len(self.cache) >= self.capacity and lru_node != self.head:
             if lru_node.ref_count > 0:
@@ -141,13 +154,77 @@ class MemoryInstanceCache:
             tmp = lru_node.prev
             self._remove_node(lru_node)
             if lru_node.value is not None:
-                await lru_node.value.close()
+                evicted.append(lru_node.value)
             del self.cache[cast("str", lru_node.key)]
             lru_node = tmp
 
         new_node = Node(key, value)
         self.cache[key] = new_node
         self._add_to_front(new_node)
+        return evicted
+
+    @staticmethod
+    async def _close_instances(instances: list[EpisodicMemory]) -> None:
+        await asyncio.gather(*(instance.close() for instance in instances))
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[EpisodicMemory]],
+    ) -> EpisodicMemory:
+        """
+        Retrieve an item, loading it with `loader` on a miss.
+
+        Only one load per key is in flight at a time. Other callers for the
+        same key wait for it and then take a reference to the loaded item.
+        If the load fails, every waiting caller receives the same error.
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            await asyncio.shield(pending)
+
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        try:
+            value = await loader()
+            evicted = self._insert(key, value)
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark the error as retrieved in case no other caller is waiting.
+            pending.exception()
+            raise
+        finally:
+            del self._pending[key]
+            if not pending.done():
+                pending.set_result(None)
+
+        await self._close_instances(evicted)
+        return value
+
+    @asynccontextmanager
+    async def exclusive(self, key: str) -> AsyncGenerator[None, None]:
+        """
+        Hold off loads of `key` while the caller works on it.
+
+        Waits for any in-flight load of the key to finish first.
+        """
+        while (pending := self._pending.get(key)) is not None:
+            # The outcome of the load does not matter here.
+            await asyncio.wait([pending])
+
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        try:
+            yield
+        finally:
+            del self._pending[key]
+            pending.set_result(None)
 
     def put(self, key: str) -> None:
         """Release the object reference."""
@@ -161,7 +238,12 @@ class MemoryInstanceCache:
 
     async def clean_old_instance(self) -> None:
         """Remove unused instance with long lifetime."""
+        await self._close_instances(self._pop_old_instances())
+
+    def _pop_old_instances(self) -> list[EpisodicMemory]:
+        """Remove unused instances with long lifetime and return them."""
         now = datetime.now(tz=UTC)
+        expired: list[EpisodicMemory] = []
         lru_node = self.tail.prev
         while lru_node != self.head:
             if lru_node.ref_count > 0:
@@ -171,7 +253,7 @@ class MemoryInstanceCache:
             if (now - lru_node.last_access).total_seconds() > self.max_lifetime:
                 self._remove_node(lru_node)
                 if lru_node.value is not None:
-                    await lru_node.value.close()
+                    expired.append(lru_node.value)
                 del self.cache[cast("str", lru_node.key)]
-                lru_node = self.tail.prev
             lru_node = tmp
+        return expired
@@ -1,8 +1,11 @@
 """Long-term memory abstractions."""
 
 from .long_term_memory import LongTermMemory, LongTermMemoryParams
+from .long_term_memory_outbox import LongTermMemoryOutbox, LongTermMemoryOutboxWorker
 
 __all__ = [
     "LongTermMemory",
+    "LongTermMemoryOutbox",
+    "LongTermMemoryOutboxWorker",
     "LongTermMemoryParams",
 ]
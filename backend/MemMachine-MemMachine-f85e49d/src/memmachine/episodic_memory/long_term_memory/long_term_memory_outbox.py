@@ -0,0 +1,470 @@
+"""
+Durable outbox for adding episodes to long-term memory in the background.
+
+With write-behind ingestion, episodes are committed to the episode store and
+recorded in an outbox table, and workers drain the outbox into long-term
+memory in batches. Entries are retried with exponential backoff until they
+succeed or run out of attempts, and survive restarts. Entries that ran out of
+attempts are kept as dead letters for a retention period, then deleted.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, Field, InstanceOf
+from sqlalchemy import (
+    DateTime,
+    Index,
+    Integer,
+    String,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, mapped_column
+
+from memmachine.common.episode_store import Episode, EpisodeIdT, EpisodeStorage
+
+logger = logging.getLogger(__name__)
+
+
+class BaseLongTermMemoryOutbox(DeclarativeBase):
+    """Base class for the SQLAlchemy long-term memory outbox."""
+
+
+class OutboxEntry(BaseLongTermMemoryOutbox):
+    """SQLAlchemy mapping for episodes waiting to be added to long-term memory."""
+
+    __tablename__ = "long_term_memory_outbox"
+    id = mapped_column(Integer, primary_key=True)
+
+    episode_id = mapped_column(String, nullable=False)
+    session_key = mapped_column(String, nullable=False)
+
+    attempts = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at = mapped_column(DateTime(timezone=True), nullable=False)
+    last_error = mapped_column(String, nullable=True)
+    created_at = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_ltm_outbox_session_key", "session_key"),
+        Index("idx_ltm_outbox_episode_id", "episode_id"),
+        Index("idx_ltm_outbox_next_attempt_at", "next_attempt_at"),
+    )
+
+
+class LongTermMemoryOutbox:
+    """SQL outbox of episodes waiting to be added to long-term memory."""
+
+    class Entry(BaseModel):
+        """Outbox entry claimed by a worker."""
+
+        id: int
+        episode_id: EpisodeIdT
+        session_key: str
+        attempts: int
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize the outbox with an async SQLAlchemy engine."""
+        self._engine = engine
+        self._session_factory = async_sessionmaker(
+            self._engine,
+            expire_on_commit=False,
+        )
+        # Claims from workers of this process never overlap, even on
+        # databases without row locking.
+        self._claim_lock = asyncio.Lock()
+
+    def _create_session(self) -> AsyncSession:
+        return self._session_factory()
+
+    async def startup(self) -> None:
+        async with self._engine.begin() as conn:
+            await conn.run_sync(BaseLongTermMemoryOutbox.metadata.create_all)
+
+    async def add(self, session_key: str, episode_ids: list[EpisodeIdT]) -> None:
+        """Record episodes of a session as waiting for long-term memory."""
+        if not episode_ids:
+            return
+
+        now = datetime.now(UTC)
+        values = [
+            {
+                "episode_id": str(episode_id),
+                "session_key": session_key,
+                "attempts": 0,
+                "next_attempt_at": now,
+                "created_at": now,
+            }
+            for episode_id in episode_ids
+        ]
+
+        async with self._create_session() as session:
+            await session.execute(insert(OutboxEntry), values)
+            await session.commit()
+
+    async def claim(
+        self,
+        limit: int,
+        *,
+        lease_sec: float,
+        max_attempts: int,
+    ) -> list[Entry]:
+        """
+        Claim the oldest due entries that have attempts left.
+
+        Claimed entries are not due again until the lease expires, so an
+        entry claimed by a worker that stopped before finishing it is
+        eventually claimed again.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            select(OutboxEntry)
+            .where(
+                OutboxEntry.next_attempt_at <= now,
+                OutboxEntry.attempts < max_attempts,
+            )
+            .order_by(OutboxEntry.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        async with self._claim_lock, self._create_session() as session:
+            rows = (await session.scalars(stmt)).all()
+            if rows:
+                await session.execute(
+                    update(OutboxEntry)
+                    .where(OutboxEntry.id.in_([row.id for row in rows]))
+                    .values(next_attempt_at=now + timedelta(seconds=lease_sec)),
+                )
+            await session.commit()
+
+        return [
+            LongTermMemoryOutbox.Entry(
+                id=row.id,
+                episode_id=EpisodeIdT(row.episode_id),
+                session_key=row.session_key,
+                attempts=row.attempts,
+            )
+            for row in rows
+        ]
+
+    async def complete(self, entry_ids: list[int]) -> None:
+        """Remove entries whose episodes were added to long-term memory."""
+        if not entry_ids:
+            return
+
+        async with self._create_session() as session:
+            await session.execute(
+                delete(OutboxEntry).where(OutboxEntry.id.in_(entry_ids)),
+            )
+            await session.commit()
+
+    async def retry(
+        self,
+        entry_ids: list[int],
+        *,
+        error: str,
+        backoff_sec: float,
+    ) -> None:
+        """Record a failed attempt and delay the next one exponentially."""
+        if not entry_ids:
+            return
+
+        now = datetime.now(UTC)
+        async with self._create_session() as session:
+            rows = (
+                await session.scalars(
+                    select(OutboxEntry).where(OutboxEntry.id.in_(entry_ids)),
+                )
+            ).all()
+            for row in rows:
+                row.attempts += 1
+                row.last_error = error
+                row.next_attempt_at = now + timedelta(
+                    seconds=backoff_sec * 2 ** (row.attempts - 1),
+                )
+            await session.commit()
+
+    async def pending_episode_ids(
+        self,
+        session_key: str,
+        *,
+        max_attempts: int | None = None,
+        limit: int | None = None,
+    ) -> list[EpisodeIdT]:
+        """
+        Return the episodes of a session not added to long-term memory yet.
+
+        Episodes are returned most recently added first. With max_attempts,
+        entries that ran out of attempts are left out, as they are dead
+        letters that will not be added anymore.
+        """
+        stmt = (
+            select(OutboxEntry.episode_id)
+            .where(OutboxEntry.session_key == session_key)
+            .order_by(OutboxEntry.id.desc())
+        )
+        if max_attempts is not None:
+            stmt = stmt.where(OutboxEntry.attempts < max_attempts)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        async with self._create_session() as session:
+            episode_ids: Sequence[str] = (await session.scalars(stmt)).all()
+
+        return [EpisodeIdT(episode_id) for episode_id in episode_ids]
+
+    async def count_dead_letters(self, *, max_attempts: int) -> int:
+        """Count the entries that ran out of attempts."""
+        stmt = select(func.count()).where(OutboxEntry.attempts >= max_attempts)
+
+        async with self._create_session() as session:
+            return await session.scalar(stmt) or 0
+
+    async def delete_dead_letters(
+        self,
+        *,
+        max_attempts: int,
+        older_than: datetime,
+    ) -> int:
+        """
+        Delete the entries that ran out of attempts before a point in time.
+
+        An entry ran out of attempts around the next attempt time recorded
+        by its last failure, which is never updated afterwards.
+        Return the number of entries deleted.
+        """
+        async with self._create_session() as session:
+            entry_ids: Sequence[int] = (
+                await session.scalars(
+                    select(OutboxEntry.id).where(
+                        OutboxEntry.attempts >= max_attempts,
+                        OutboxEntry.next_attempt_at < older_than,
+                    ),
+                )
+            ).all()
+            if entry_ids:
+                await session.execute(
+                    delete(OutboxEntry).where(OutboxEntry.id.in_(entry_ids)),
+                )
+            await session.commit()
+
+        return len(entry_ids)
+
+    async def delete_episodes(self, episode_ids: list[EpisodeIdT]) -> None:
+        if not episode_ids:
+            return
+
+        async with self._create_session() as session:
+            await session.execute(
+                delete(OutboxEntry).where(
+                    OutboxEntry.episode_id.in_(
+                        [str(episode_id) for episode_id in episode_ids],
+                    ),
+                ),
+            )
+            await session.commit()
+
+    async def delete_session(self, session_key: str) -> None:
+        async with self._create_session() as session:
+            await session.execute(
+                delete(OutboxEntry).where(OutboxEntry.session_key == session_key),
+            )
+            await session.commit()
+
+
+class LongTermMemoryOutboxWorker:
+    """
+    Drains the long-term memory outbox with a pool of workers.
+
+    Workers claim batches of due entries, load their episodes from the
+    episode store and add them to long-term memory one session at a time.
+    Workers are woken when entries are added, and poll the outbox as a
+    fallback for entries added before a restart or by another process.
+    When idle, a worker periodically deletes the dead letters older than the
+    retention period and logs how many remain.
+    """
+
+    class Params(BaseModel):
+        """Dependencies and tuning knobs for the outbox workers."""
+
+        outbox: InstanceOf[LongTermMemoryOutbox]
+        episode_storage: InstanceOf[EpisodeStorage]
+        add_episodes: Callable[[str, list[Episode]], Awaitable[None]]
+        num_workers: int = Field(default=2, gt=0)
+        batch_size: int = Field(default=32, gt=0)
+        max_attempts: int = Field(default=5, gt=0)
+        retry_backoff_sec: float = Field(default=1.0, gt=0.0)
+        poll_interval_sec: float = Field(default=5.0, gt=0.0)
+        lease_sec: float = Field(default=300.0, gt=0.0)
+        dead_letter_retention_sec: float = Field(default=604800.0, gt=0.0)
+        dead_letter_purge_interval_sec: float = Field(default=3600.0, gt=0.0)
+
+    def __init__(self, params: Params) -> None:
+        """Initialize the workers without starting them."""
+        self._outbox = params.outbox
+        self._episode_storage = params.episode_storage
+        self._add_episodes = params.add_episodes
+        self._num_workers = params.num_workers
+        self._batch_size = params.batch_size
+        self._max_attempts = params.max_attempts
+        self._retry_backoff_sec = params.retry_backoff_sec
+        self._poll_interval_sec = params.poll_interval_sec
+        self._lease_sec = params.lease_sec
+        self._dead_letter_retention_sec = params.dead_letter_retention_sec
+        self._dead_letter_purge_interval_sec = params.dead_letter_purge_interval_sec
+
+        self._workers: list[asyncio.Task] = []
+        self._next_dead_letter_purge_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._is_shutting_down = False
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+
+        self._is_shutting_down = False
+        self._workers = [
+            asyncio.create_task(self._run_worker()) for _ in range(self._num_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers after their in-flight batches finish."""
+        if not self._workers:
+            return
+
+        self._is_shutting_down = True
+        self._wakeup.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def notify(self) -> None:
+        """Wake the workers after entries were added to the outbox."""
+        self._wakeup.set()
+
+    async def _run_worker(self) -> None:
+        while not self._is_shutting_down:
+            self._wakeup.clear()
+
+            try:
+                processed = await self._process_batch()
+            except Exception:
+                logger.exception("Failed to drain the long-term memory outbox")
+                processed = False
+
+            if processed:
+                continue
+
+            loop_time = asyncio.get_running_loop().time()
+            if loop_time >= self._next_dead_letter_purge_at:
+                # Set before purging so that only one idle worker purges
+                self._next_dead_letter_purge_at = (
+                    loop_time + self._dead_letter_purge_interval_sec
+                )
+                try:
+                    await self.purge_dead_letters()
+                except Exception:
+                    logger.exception(
+                        "Failed to purge long-term memory outbox dead letters"
+                    )
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self._poll_interval_sec,
+                )
+
+    async def purge_dead_letters(self) -> int:
+        """
+        Delete the dead letters older than the retention period.
+
+        Log the number of entries deleted and of dead letters remaining,
+        and return the number of entries deleted.
+        """
+        deleted = await self._outbox.delete_dead_letters(
+            max_attempts=self._max_attempts,
+            older_than=datetime.now(UTC)
+            - timedelta(seconds=self._dead_letter_retention_sec),
+        )
+        remaining = await self._outbox.count_dead_letters(
+            max_attempts=self._max_attempts,
+        )
+        if deleted or remaining:
+            logger.warning(
+                "Deleted %d expired long-term memory outbox dead letters, "
+                "%d dead letters remain",
+                deleted,
+                remaining,
+            )
+        return deleted
+
+    async def _process_batch(self) -> bool:
+        """Process one batch of due entries and return whether any was claimed."""
+        entries = await self._outbox.claim(
+            self._batch_size,
+            lease_sec=self._lease_sec,
+            max_attempts=self._max_attempts,
+        )
+        if not entries:
+            return False
+
+        entries_by_session: dict[str, list[LongTermMemoryOutbox.Entry]] = defaultdict(
+            list
+        )
+        for entry in entries:
+            entries_by_session[entry.session_key].append(entry)
+
+        for session_key, session_entries in entries_by_session.items():
+            await self._process_session_entries(session_key, session_entries)
+
+        return True
+
+    async def _process_session_entries(
+        self,
+        session_key: str,
+        entries: list[LongTermMemoryOutbox.Entry],
+    ) -> None:
+        entry_ids = [entry.id for entry in entries]
+        try:
+            episodes = await self._episode_storage.get_episodes(
+                [entry.episode_id for entry in entries],
+            )
+            # Episodes deleted in the meantime are dropped
+            existing_episodes = [episode for episode in episodes if episode is not None]
+            if existing_episodes:
+                await self._add_episodes(session_key, existing_episodes)
+        except Exception as e:
+            exhausted = [
+                entry.episode_id
+                for entry in entries
+                if entry.attempts + 1 >= self._max_attempts
+            ]
+            if exhausted:
+                logger.exception(
+                    "Giving up adding episodes %s of session %s to long-term memory",
+                    exhausted,
+                    session_key,
+                )
+            else:
+                logger.warning(
+                    "Failed to add episodes of session %s to long-term memory, "
+                    "retrying: %s",
+                    session_key,
+                    e,
+                )
+            await self._outbox.retry(
+                entry_ids,
+                error=str(e),
+                backoff_sec=self._retry_backoff_sec,
+            )
+            return
+
+        await self._outbox.complete(entry_ids)
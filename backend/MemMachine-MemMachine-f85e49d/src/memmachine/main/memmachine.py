@@ -15,7 +15,13 @@ from memmachine.common.configuration.episodic_config import (
     LongTermMemoryConf,
     ShortTermMemoryConf,
 )
-from memmachine.common.episode_store import Episode, EpisodeEntry, EpisodeIdT
+from memmachine.common.episode_store import (
+    Episode,
+    EpisodeCursor,
+    EpisodeEntry,
+    EpisodeIdT,
+)
+from memmachine.common.errors import InvalidArgumentError
 from memmachine.common.filter.filter_parser import (
     And as FilterAnd,
 )
@@ -30,6 +36,7 @@ from memmachine.common.filter.filter_parser import (
 from memmachine.common.resource_manager.resource_manager import ResourceManagerImpl
 from memmachine.common.session_manager.session_data_manager import SessionDataManager
 from memmachine.episodic_memory import EpisodicMemory
+from memmachine.episodic_memory.long_term_memory import LongTermMemoryOutboxWorker
 from memmachine.semantic_memory.semantic_model import FeatureIdT, SemanticFeature
 from memmachine.semantic_memory.semantic_session_manager import IsolationType
 
@@ -80,11 +87,53 @@ class MemMachine:
         else:
             self._resources = ResourceManagerImpl(conf)
 
+        self._long_term_memory_outbox_worker: LongTermMemoryOutboxWorker | None = None
+
     async def start(self) -> None:
         semantic_service = await self._resources.get_semantic_service()
         await semantic_service.start()
 
+        await self._start_long_term_memory_outbox_worker()
+
+        await self._warm_up_episodic_memory()
+
+    async def _start_long_term_memory_outbox_worker(self) -> None:
+        ingestion_conf = self._conf.long_term_memory_ingestion
+        if not ingestion_conf.write_behind:
+            return
+
+        self._long_term_memory_outbox_worker = LongTermMemoryOutboxWorker(
+            LongTermMemoryOutboxWorker.Params(
+                outbox=await self._resources.get_long_term_memory_outbox(),
+                episode_storage=await self._resources.get_episode_storage(),
+                add_episodes=self._add_long_term_memory_episodes,
+                num_workers=ingestion_conf.workers,
+                batch_size=ingestion_conf.batch_size,
+                max_attempts=ingestion_conf.max_attempts,
+                retry_backoff_sec=ingestion_conf.retry_backoff_sec,
+                poll_interval_sec=ingestion_conf.poll_interval_sec,
+                lease_sec=ingestion_conf.lease_sec,
+                dead_letter_retention_sec=ingestion_conf.dead_letter_retention_sec,
+            )
+        )
+        await self._long_term_memory_outbox_worker.start()
+
+    async def _warm_up_episodic_memory(self) -> None:
+        session_manager_conf = self._conf.session_manager
+        if session_manager_conf.warm_up_sessions <= 0:
+            return
+
+        episodic_memory_manager = await self._resources.get_episodic_memory_manager()
+        await episodic_memory_manager.warm_up(
+            max_sessions=session_manager_conf.warm_up_sessions,
+            max_concurrency=session_manager_conf.warm_up_concurrency,
+        )
+
     async def stop(self) -> None:
+        if self._long_term_memory_outbox_worker is not None:
+            await self._long_term_memory_outbox_worker.stop()
+            self._long_term_memory_outbox_worker = None
+
         semantic_service = await self._resources.get_semantic_service()
         await semantic_service.stop()
 
@@ -217,11 +266,17 @@ class MemMachine:
                 semantic_memory_manager.delete_messages(session_data=session_data),
             )
 
+        async def _delete_long_term_memory_outbox() -> None:
+            outbox = await self._resources.get_long_term_memory_outbox()
+            await outbox.delete_session(session_data.session_key)
+
         tasks = [
             _delete_episode_store(),
             _delete_episodic_memory(),
             _delete_semantic_memory(),
         ]
+        if self._long_term_memory_outbox_worker is not None:
+            tasks.append(_delete_long_term_memory_outbox())
 
         await asyncio.gather(*tasks)
 
@@ -273,7 +328,22 @@ class MemMachine:
                 ),
                 metadata={},
             ) as episodic_session:
-                tasks.append(episodic_session.add_memory_episodes(episodes))
+                if self._long_term_memory_outbox_worker is not None:
+                    # Long-term memory is updated in the background
+                    tasks.append(
+                        episodic_session.add_memory_episodes(
+                            episodes,
+                            add_to_long_term_memory=False,
+                        )
+                    )
+                    tasks.append(
+                        self._defer_long_term_memory_episodes(
+                            session_data.session_key,
+                            episode_ids,
+                        )
+                    )
+                else:
+                    tasks.append(episodic_session.add_memory_episodes(episodes))
 
         if MemoryType.Semantic in target_memories:
             semantic_session_manager = (
@@ -289,6 +359,62 @@ class MemMachine:
         await asyncio.gather(*tasks)
         return episode_ids
 
+    async def _defer_long_term_memory_episodes(
+        self,
+        session_key: str,
+        episode_ids: list[EpisodeIdT],
+    ) -> None:
+        outbox = await self._resources.get_long_term_memory_outbox()
+        await outbox.add(session_key, episode_ids)
+        if self._long_term_memory_outbox_worker is not None:
+            self._long_term_memory_outbox_worker.notify()
+
+    async def _add_long_term_memory_episodes(
+        self,
+        session_key: str,
+        episodes: list[Episode],
+    ) -> None:
+        episodic_memory_manager = await self._resources.get_episodic_memory_manager()
+        async with episodic_memory_manager.open_or_create_episodic_memory(
+            session_key=session_key,
+            description="",
+            episodic_memory_config=self._with_default_episodic_memory_conf(
+                session_key=session_key
+            ),
+            metadata={},
+        ) as episodic_session:
+            await episodic_session.add_long_term_memory_episodes(episodes)
+
+    async def _get_unindexed_episodes(
+        self,
+        session_key: str,
+        search_filter: FilterExpr | None,
+        limit: int | None,
+    ) -> list[Episode]:
+        """Return the most recent episodes still waiting in the outbox."""
+        if self._long_term_memory_outbox_worker is None:
+            return []
+
+        outbox = await self._resources.get_long_term_memory_outbox()
+        episode_ids = await outbox.pending_episode_ids(
+            session_key,
+            max_attempts=self._conf.long_term_memory_ingestion.max_attempts,
+            # Same default as EpisodicMemory.query_memory
+            limit=limit if limit is not None else 20,
+        )
+        if not episode_ids:
+            return []
+
+        episode_storage = await self._resources.get_episode_storage()
+        pending_filter = FilterComparison(
+            field="uid",
+            op="in",
+            value=[int(episode_id) for episode_id in episode_ids],
+        )
+        return await episode_storage.get_episode_messages(
+            filter_expr=self._merge_filter_exprs(pending_filter, search_filter),
+        )
+
     class SearchResponse(BaseModel):
         """Aggregated search results across memory types."""
 
@@ -304,6 +430,11 @@ class MemMachine:
         search_filter: FilterExpr | None = None,
     ) -> EpisodicMemory.QueryResponse | None:
         episodic_memory_manager = await self._resources.get_episodic_memory_manager()
+        unindexed_episodes = await self._get_unindexed_episodes(
+            session_data.session_key,
+            search_filter,
+            limit,
+        )
 
         async with episodic_memory_manager.open_or_create_episodic_memory(
             session_key=session_data.session_key,
@@ -317,6 +448,7 @@ class MemMachine:
                 query=query,
                 limit=limit,
                 property_filter=search_filter,
+                unindexed_episodes=unindexed_episodes,
             )
 
         return response
@@ -367,6 +499,7 @@ class MemMachine:
 
         episodic_memory: list[Episode] | None = None
         semantic_memory: list[SemanticFeature] | None = None
+        next_episodic_cursor: str | None = None
 
     async def list_search(
         self,
@@ -376,7 +509,17 @@ class MemMachine:
         search_filter: str | None = None,
         page_size: int | None = None,
         page_num: int | None = None,
+        cursor: str | None = None,
     ) -> ListResults:
+        """
+        List the memories of a session page by page.
+
+        Episodic memories can be paged with a cursor instead of page_num, by
+        passing the next_episodic_cursor of the previous page.
+        """
+        if cursor is not None and page_num is not None:
+            raise InvalidArgumentError("Cannot specify both cursor and page_num")
+
         search_filter_expr = parse_filter(search_filter) if search_filter else None
 
         episodic_task: Task | None = None
@@ -397,6 +540,7 @@ class MemMachine:
                 episode_storage.get_episode_messages(
                     page_size=page_size,
                     page_num=page_num,
+                    cursor=cursor,
                     filter_expr=combined_filter,
                 )
             )
@@ -415,9 +559,18 @@ class MemMachine:
         episodic_result = await episodic_task if episodic_task else None
         semantic_result = await semantic_task if semantic_task else None
 
+        next_episodic_cursor = None
+        if (
+            episodic_result
+            and page_size is not None
+            and len(episodic_result) == page_size
+        ):
+            next_episodic_cursor = EpisodeCursor.after(episodic_result[-1]).encode()
+
         return MemMachine.ListResults(
             episodic_memory=episodic_result,
             semantic_memory=semantic_result,
+            next_episodic_cursor=next_episodic_cursor,
         )
 
     async def episodes_count(
@@ -454,6 +607,9 @@ class MemMachine:
             episode_storage.delete_episodes(episode_ids),
             semantic_service.delete_history(episode_ids),
         ]
+        if self._long_term_memory_outbox_worker is not None:
+            outbox = await self._resources.get_long_term_memory_outbox()
+            tasks.append(outbox.delete_episodes(episode_ids))
 
         if session_data is not None:
             episodic_memory_manager = (
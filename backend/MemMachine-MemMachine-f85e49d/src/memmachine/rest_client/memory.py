@@ -17,6 +17,7 @@ from memmachine.common.api.spec import (
     AddMemoriesSpec,
     DeleteEpisodicMemorySpec,
     DeleteSemanticMemorySpec,
+    ListMemoriesSpec,
     MemoryMessage,
     SearchMemoriesSpec,
 )
@@ -480,6 +481,85 @@ class Memory:
             logger.exception("Failed to search memories")
             raise
 
+    def list_episodic(
+        self,
+        page_size: int = 100,
+        cursor: str | None = None,
+        filter_dict: dict[str, str] | None = None,
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        List episodic memories in creation order, one page at a time.
+
+        Built-in filters are applied and merged with `filter_dict` as in `search`.
+
+        Args:
+            page_size: Maximum number of episodic memories to return
+            cursor: The `next_cursor` returned with the previous page, or None
+                    for the first page
+            filter_dict: Additional filters for the listing (key-value pairs as strings)
+            timeout: Request timeout in seconds (uses client default if not provided)
+
+        Returns:
+            Dictionary with the page of episodes as "episodic_memory", and
+            the cursor of the next page as "next_cursor", which is None on
+            the last page
+
+        Raises:
+            requests.RequestException: If the request fails
+            RuntimeError: If the client has been closed
+
+        Example:
+            ```python
+            cursor = None
+            while True:
+                page = memory.list_episodic(page_size=50, cursor=cursor)
+                for episode in page["episodic_memory"]:
+                    print(episode["content"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            ```
+
+        """
+        if self._client_closed:
+            raise RuntimeError("Cannot list memories: client has been closed")
+
+        merged_filters = {**self.get_default_filter_dict()}
+        if filter_dict:
+            merged_filters.update(filter_dict)
+
+        spec = ListMemoriesSpec(
+            org_id=self.__org_id,
+            project_id=self.__project_id,
+            page_size=page_size,
+            page_num=None,
+            cursor=cursor,
+            filter=self._dict_to_filter_string(merged_filters)
+            if merged_filters
+            else "",
+            type=MemoryType.Episodic,
+        )
+        v2_list_data = spec.model_dump(mode="json", exclude_none=True)
+
+        try:
+            response = self.client.request(
+                "POST",
+                f"{self.client.base_url}/api/v2/memories/list",
+                json=v2_list_data,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            content = response.json().get("content", {})
+        except Exception:
+            logger.exception("Failed to list episodic memories")
+            raise
+
+        return {
+            "episodic_memory": content.get("episodic_memory", []),
+            "next_cursor": content.get("next_cursor"),
+        }
+
     def get_context(self) -> dict[str, Any]:
         """
         Get the current memory context.
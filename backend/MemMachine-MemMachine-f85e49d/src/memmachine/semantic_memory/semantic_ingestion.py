@@ -6,13 +6,13 @@ import logging
 from itertools import chain
 
 import numpy as np
-from pydantic import BaseModel, InstanceOf, TypeAdapter
+from pydantic import BaseModel, Field, InstanceOf, TypeAdapter
 
 from memmachine.common.embedder import Embedder
 from memmachine.common.episode_store import Episode, EpisodeIdT, EpisodeStorage
 from memmachine.common.filter.filter_parser import And, Comparison
 from memmachine.semantic_memory.semantic_llm import (
-    LLMReducedFeature,
+    llm_batch_feature_update,
     llm_consolidate_features,
     llm_feature_update,
 )
@@ -45,6 +45,7 @@ class IngestionService:
         history_store: InstanceOf[EpisodeStorage]
         resource_retriever: InstanceOf[ResourceRetriever]
         consolidated_threshold: int = 20
+        message_batch_size: int = Field(default=1, gt=0)
         debug_fail_loudly: bool = False
 
     def __init__(self, params: Params) -> None:
@@ -53,6 +54,7 @@ class IngestionService:
         self._history_store = params.history_store
         self._resource_retriever = params.resource_retriever
         self._consolidation_threshold = params.consolidated_threshold
+        self._message_batch_size = params.message_batch_size
         self._debug_fail_loudly = params.debug_fail_loudly
 
     async def process_set_ids(self, set_ids: list[SetIdT]) -> None:
@@ -83,24 +85,28 @@ class IngestionService:
         if len(history_ids) == 0:
             return
 
-        raw_messages = await asyncio.gather(
-            *[self._history_store.get_episode(h_id) for h_id in history_ids],
-        )
+        raw_messages = await self._history_store.get_episodes(history_ids)
 
         if len(raw_messages) != len([m for m in raw_messages if m is not None]):
             raise ValueError("Failed to retrieve messages. Invalid history_ids")
 
         messages = TypeAdapter(list[Episode]).validate_python(raw_messages)
 
+        for message in messages:
+            if message.uid is None:
+                raise ValueError(
+                    "Message ID is None for message %s",
+                    message.model_dump(),
+                )
+
         async def process_semantic_type(
             semantic_category: InstanceOf[SemanticCategory],
         ) -> None:
-            for message in messages:
-                if message.uid is None:
-                    raise ValueError(
-                        "Message ID is None for message %s",
-                        message.model_dump(),
-                    )
+            for window_start in range(0, len(messages), self._message_batch_size):
+                window = messages[
+                    window_start : window_start + self._message_batch_size
+                ]
+                window_ids = [EpisodeIdT(message.uid) for message in window]
 
                 filter_expr = And(
                     left=Comparison(field="set_id", op="=", value=set_id),
@@ -114,16 +120,16 @@ class IngestionService:
                 )
 
                 try:
-                    commands = await llm_feature_update(
+                    commands, citation_ids = await self._extract_commands(
                         features=features,
-                        message_content=message.content,
-                        model=resources.language_model,
-                        update_prompt=semantic_category.prompt.update_prompt,
+                        messages=window,
+                        resources=resources,
+                        semantic_category=semantic_category,
                     )
                 except Exception:
                     logger.exception(
-                        "Failed to process message %s for semantic type %s",
-                        message.uid,
+                        "Failed to process messages %s for semantic type %s",
+                        window_ids,
                         semantic_category.name,
                     )
                     if self._debug_fail_loudly:
@@ -135,11 +141,11 @@ class IngestionService:
                     commands=commands,
                     set_id=set_id,
                     category_name=semantic_category.name,
-                    citation_id=message.uid,
+                    citation_ids=citation_ids,
                     embedder=resources.embedder,
                 )
 
-                mark_messages.append(message.uid)
+                mark_messages.extend(window_ids)
 
         mark_messages: list[EpisodeIdT] = []
         semantic_category_runners = []
@@ -162,33 +168,93 @@ class IngestionService:
             resources=resources,
         )
 
+    async def _extract_commands(
+        self,
+        *,
+        features: list[SemanticFeature],
+        messages: list[Episode],
+        resources: InstanceOf[Resources],
+        semantic_category: InstanceOf[SemanticCategory],
+    ) -> tuple[list[SemanticCommand], list[list[EpisodeIdT]]]:
+        """Ask the LLM for commands and the message ids each command cites."""
+        message_ids = [EpisodeIdT(message.uid) for message in messages]
+
+        if len(messages) == 1:
+            commands = await llm_feature_update(
+                features=features,
+                message_content=messages[0].content,
+                model=resources.language_model,
+                update_prompt=semantic_category.prompt.update_prompt,
+            )
+            return commands, [message_ids] * len(commands)
+
+        sourced_commands = await llm_batch_feature_update(
+            features=features,
+            message_contents=[message.content for message in messages],
+            model=resources.language_model,
+            update_prompt=semantic_category.prompt.update_prompt,
+        )
+
+        commands = []
+        citation_ids = []
+        for sourced_command in sourced_commands:
+            commands.append(
+                SemanticCommand(
+                    command=sourced_command.command,
+                    feature=sourced_command.feature,
+                    tag=sourced_command.tag,
+                    value=sourced_command.value,
+                ),
+            )
+            # Cite the whole window if the LLM did not attribute the command.
+            cited_ids = [
+                message_ids[index]
+                for index in dict.fromkeys(sourced_command.message_indices)
+                if 0 <= index < len(message_ids)
+            ]
+            citation_ids.append(cited_ids or message_ids)
+
+        return commands, citation_ids
+
     async def _apply_commands(
         self,
         *,
         commands: list[SemanticCommand],
         set_id: SetIdT,
         category_name: str,
-        citation_id: EpisodeIdT | None,
+        citation_ids: list[list[EpisodeIdT]],
         embedder: InstanceOf[Embedder],
     ) -> None:
-        for command in commands:
+        add_values = [
+            command.value
+            for command in commands
+            if command.command == SemanticCommandType.ADD
+        ]
+        add_embeddings = iter(
+            await embedder.ingest_embed(add_values) if add_values else [],
+        )
+        pending_features: list[SemanticStorage.NewFeature] = []
+        for command, command_citation_ids in zip(commands, citation_ids, strict=True):
             match command.command:
                 case SemanticCommandType.ADD:
-                    value_embedding = (await embedder.ingest_embed([command.value]))[0]
-
-                    f_id = await self._semantic_storage.add_feature(
-                        set_id=set_id,
-                        category_name=category_name,
-                        feature=command.feature,
-                        value=command.value,
-                        tag=command.tag,
-                        embedding=np.array(value_embedding),
+                    pending_features.append(
+                        SemanticStorage.NewFeature(
+                            set_id=set_id,
+                            category_name=category_name,
+                            feature=command.feature,
+                            value=command.value,
+                            tag=command.tag,
+                            embedding=np.array(next(add_embeddings)),
+                            citations=list(command_citation_ids),
+                        ),
                     )
 
-                    if citation_id is not None:
-                        await self._semantic_storage.add_citations(f_id, [citation_id])
-
                 case SemanticCommandType.DELETE:
+                    # Write pending additions first so a later delete can remove them.
+                    if pending_features:
+                        await self._semantic_storage.add_features(pending_features)
+                        pending_features = []
+
                     filter_expr = And(
                         left=And(
                             left=Comparison(field="set_id", op="=", value=set_id),
@@ -211,6 +277,9 @@ class IngestionService:
                 case _:
                     logger.error("Command with unknown action: %s", command.command)
 
+        if pending_features:
+            await self._semantic_storage.add_features(pending_features)
+
     async def _consolidate_set_memories_if_applicable(
         self,
         *,
@@ -305,23 +374,29 @@ class IngestionService:
             list(merged_citations),
         )
 
-        async def _add_feature(f: LLMReducedFeature) -> None:
-            value_embedding = (await resources.embedder.ingest_embed([f.value]))[0]
-
-            f_id = await self._semantic_storage.add_feature(
-                set_id=set_id,
-                category_name=semantic_category.name,
-                tag=f.tag,
-                feature=f.feature,
-                value=f.value,
-                embedding=np.array(value_embedding),
-            )
+        consolidated_memories = consolidate_resp.consolidated_memories
+        if not consolidated_memories:
+            return
 
-            await self._semantic_storage.add_citations(f_id, citation_ids)
+        value_embeddings = await resources.embedder.ingest_embed(
+            [f.value for f in consolidated_memories],
+        )
 
-        await asyncio.gather(
-            *[
-                _add_feature(feature)
-                for feature in consolidate_resp.consolidated_memories
+        await self._semantic_storage.add_features(
+            [
+                SemanticStorage.NewFeature(
+                    set_id=set_id,
+                    category_name=semantic_category.name,
+                    tag=f.tag,
+                    feature=f.feature,
+                    value=f.value,
+                    embedding=np.array(value_embedding),
+                    citations=citation_ids,
+                )
+                for f, value_embedding in zip(
+                    consolidated_memories,
+                    value_embeddings,
+                    strict=True,
+                )
             ],
         )
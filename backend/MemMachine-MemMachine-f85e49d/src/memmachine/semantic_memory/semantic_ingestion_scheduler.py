@@ -0,0 +1,179 @@
+"""Event-driven scheduling of background semantic ingestion."""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+
+from pydantic import BaseModel, Field
+
+from memmachine.semantic_memory.semantic_model import SetIdT
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionScheduler:
+    """
+    Schedules ingestion for feature sets that have received new messages.
+
+    Sets are queued when notified and debounced so that a burst of messages
+    is ingested together. Queued sets are processed in FIFO order by a bounded
+    number of workers. A set that still has a backlog after a pass goes to the
+    back of the queue, so one large backlog cannot starve other sets.
+    A low-frequency sweep queues sets whose notifications were missed,
+    such as messages added before a restart or by another process.
+    """
+
+    class Params(BaseModel):
+        """Callbacks and tuning knobs for the scheduler."""
+
+        process_set: Callable[[SetIdT], Awaitable[None]]
+        has_backlog: Callable[[SetIdT], Awaitable[bool]]
+        find_sets_with_backlog: Callable[[], Awaitable[list[SetIdT]]]
+        debounce_sec: float = Field(default=2.0, ge=0.0)
+        sweep_interval_sec: float = Field(default=60.0, gt=0.0)
+        max_concurrent_sets: int = Field(default=4, gt=0)
+        debug_fail_loudly: bool = False
+
+    def __init__(self, params: Params) -> None:
+        """Initialize the scheduler with an empty queue."""
+        self._process_set = params.process_set
+        self._has_backlog = params.has_backlog
+        self._find_sets_with_backlog = params.find_sets_with_backlog
+        self._debounce_sec = params.debounce_sec
+        self._sweep_interval_sec = params.sweep_interval_sec
+        self._max_concurrent_sets = params.max_concurrent_sets
+        self._debug_fail_loudly = params.debug_fail_loudly
+
+        self._queue: deque[SetIdT] = deque()
+        self._ready_at: dict[SetIdT, float] = {}
+        self._running: set[SetIdT] = set()
+        self._renotified: set[SetIdT] = set()
+        self._workers: set[asyncio.Task] = set()
+
+        self._wakeup = asyncio.Event()
+        self._is_shutting_down = False
+        self._error: Exception | None = None
+
+    def notify(self, set_ids: Iterable[SetIdT], *, delay: float | None = None) -> None:
+        """Queue sets for ingestion after the debounce delay."""
+        ready_at = asyncio.get_running_loop().time() + (
+            self._debounce_sec if delay is None else delay
+        )
+
+        for set_id in set_ids:
+            if set_id in self._running:
+                self._renotified.add(set_id)
+                continue
+
+            # Keep the original start time of an already queued set,
+            # so a steady stream of messages cannot postpone it forever.
+            if set_id in self._ready_at:
+                continue
+
+            self._ready_at[set_id] = ready_at
+            self._queue.append(set_id)
+
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Ask the dispatch loop to exit after in-flight sets finish."""
+        self._is_shutting_down = True
+        self._wakeup.set()
+
+    async def run(self) -> None:
+        """Dispatch queued sets to workers until stopped."""
+        loop = asyncio.get_running_loop()
+        next_sweep_at = loop.time()
+
+        try:
+            while not self._is_shutting_down:
+                self._wakeup.clear()
+
+                if self._error is not None:
+                    raise self._error
+
+                if loop.time() >= next_sweep_at:
+                    await self._sweep()
+                    next_sweep_at = loop.time() + self._sweep_interval_sec
+
+                next_ready_at = self._dispatch_ready_sets(loop.time())
+
+                wake_at = next_sweep_at
+                if next_ready_at is not None:
+                    wake_at = min(wake_at, next_ready_at)
+
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        timeout=max(wake_at - loop.time(), 0.0),
+                    )
+        finally:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            # Clear the stop here rather than on entry, so a stop requested
+            # before the loop starts is not lost and the scheduler can rerun.
+            self._is_shutting_down = False
+
+    def _dispatch_ready_sets(self, now: float) -> float | None:
+        """Start workers for ready sets and return when the next set is due."""
+        next_ready_at: float | None = None
+        waiting: deque[SetIdT] = deque()
+
+        while self._queue:
+            set_id = self._queue.popleft()
+            ready_at = self._ready_at[set_id]
+
+            if len(self._running) >= self._max_concurrent_sets or ready_at > now:
+                waiting.append(set_id)
+                if ready_at > now and (
+                    next_ready_at is None or ready_at < next_ready_at
+                ):
+                    next_ready_at = ready_at
+                continue
+
+            del self._ready_at[set_id]
+            self._running.add(set_id)
+            worker = asyncio.create_task(self._run_worker(set_id))
+            self._workers.add(worker)
+            worker.add_done_callback(self._on_worker_done)
+
+        self._queue = waiting
+        return next_ready_at
+
+    def _on_worker_done(self, worker: asyncio.Task) -> None:
+        self._workers.discard(worker)
+        self._wakeup.set()
+
+    async def _run_worker(self, set_id: SetIdT) -> None:
+        """Ingest one set and queue it again if work remains."""
+        requeue = False
+        try:
+            if await self._has_backlog(set_id):
+                await self._process_set(set_id)
+                requeue = await self._has_backlog(set_id)
+        except Exception as e:
+            logger.exception("Failed to ingest messages for set %s", set_id)
+            if self._debug_fail_loudly:
+                self._error = e
+        finally:
+            self._running.discard(set_id)
+
+        if set_id in self._renotified:
+            self._renotified.discard(set_id)
+            requeue = True
+
+        if requeue and not self._is_shutting_down:
+            self.notify([set_id])
+
+    async def _sweep(self) -> None:
+        """Queue every set that has a backlog, as a fallback for missed notifications."""
+        try:
+            set_ids = await self._find_sets_with_backlog()
+        except Exception:
+            logger.exception("Failed to sweep for sets with un-ingested messages")
+            if self._debug_fail_loudly:
+                raise
+            return
+
+        self.notify(set_ids, delay=0.0)
@@ -76,6 +76,59 @@ async def llm_feature_update(
     return validated_output.commands
 
 
+class SourcedSemanticCommand(SemanticCommand):
+    """Feature-update command annotated with the messages it was derived from."""
+
+    message_indices: list[int] = Field(default_factory=list)
+
+
+class _SemanticBatchFeatureUpdateRes(BaseModel):
+    """Schema used to validate commands returned for a window of messages."""
+
+    commands: list[SourcedSemanticCommand] = Field(default_factory=list)
+
+
+@validate_call
+async def llm_batch_feature_update(
+    features: list[SemanticFeature],
+    message_contents: list[str],
+    model: InstanceOf[LanguageModel],
+    update_prompt: str,
+) -> list[SourcedSemanticCommand]:
+    """Generate feature update commands from several messages in one LLM call."""
+    history = "\n".join(
+        f'<MESSAGE index="{index}">\n{content}\n</MESSAGE>'
+        for index, content in enumerate(message_contents)
+    )
+    user_prompt = (
+        "The old feature set is provided below:\n"
+        "<OLD_PROFILE>\n"
+        f"{json.dumps(_features_to_llm_format(features))}\n"
+        "</OLD_PROFILE>\n"
+        "\n"
+        "The history is provided below as numbered messages, oldest first.\n"
+        "For each command, list the indices of the messages it is derived from "
+        "in message_indices.\n"
+        "<HISTORY>\n"
+        f"{history}\n"
+        "</HISTORY>\n"
+    )
+
+    parsed_output = await model.generate_parsed_response(
+        system_prompt=update_prompt,
+        user_prompt=user_prompt,
+        output_format=_SemanticBatchFeatureUpdateRes,
+    )
+
+    if parsed_output is None:
+        return []
+
+    validated_output = TypeAdapter(_SemanticBatchFeatureUpdateRes).validate_python(
+        parsed_output,
+    )
+    return validated_output.commands
+
+
 class LLMReducedFeature(BaseModel):
     """Minimal feature payload emitted by the consolidation prompt for reinsertion."""
 
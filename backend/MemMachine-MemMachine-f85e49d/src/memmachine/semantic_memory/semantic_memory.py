@@ -13,12 +13,13 @@ from asyncio import Task
 from typing import Any
 
 import numpy as np
-from pydantic import BaseModel, InstanceOf
+from pydantic import BaseModel, Field, InstanceOf
 
 from memmachine.common.episode_store import EpisodeIdT, EpisodeStorage
 from memmachine.common.filter.filter_parser import FilterExpr
 
 from .semantic_ingestion import IngestionService
+from .semantic_ingestion_scheduler import IngestionScheduler
 from .semantic_model import FeatureIdT, ResourceRetriever, SemanticFeature, SetIdT
 from .storage.storage_base import SemanticStorage
 
@@ -41,10 +42,18 @@ class SemanticService:
         episode_storage: InstanceOf[EpisodeStorage]
         consolidation_threshold: int = 20
 
+        # Debounce delay between a set receiving messages and its ingestion.
         feature_update_interval_sec: float = 2.0
 
         feature_update_message_limit: int = 5
 
+        # Fallback sweep for sets whose notifications were missed.
+        feature_update_sweep_interval_sec: float = Field(default=60.0, gt=0.0)
+
+        max_concurrent_ingestion_sets: int = Field(default=4, gt=0)
+
+        ingestion_message_batch_size: int = Field(default=1, gt=0)
+
         resource_retriever: InstanceOf[ResourceRetriever]
 
         debug_fail_loudly: bool = False
@@ -63,24 +72,50 @@ class SemanticService:
         self._consolidation_threshold = params.consolidation_threshold
 
         self._feature_update_message_limit = params.feature_update_message_limit
+        self._ingestion_message_batch_size = params.ingestion_message_batch_size
 
         self._ingestion_task: Task | None = None
         self._is_shutting_down = False
         self._debug_fail_loudly = params.debug_fail_loudly
 
+        self._ingestion_service = IngestionService(
+            params=IngestionService.Params(
+                semantic_storage=self._semantic_storage,
+                resource_retriever=self._resource_retriever,
+                history_store=self._episode_storage,
+                message_batch_size=self._ingestion_message_batch_size,
+                debug_fail_loudly=self._debug_fail_loudly,
+            ),
+        )
+        self._ingestion_scheduler = IngestionScheduler(
+            IngestionScheduler.Params(
+                process_set=self._ingest_set,
+                has_backlog=self._has_ingestion_backlog,
+                find_sets_with_backlog=self._find_sets_with_ingestion_backlog,
+                debounce_sec=self._background_ingestion_interval_sec,
+                sweep_interval_sec=params.feature_update_sweep_interval_sec,
+                max_concurrent_sets=params.max_concurrent_ingestion_sets,
+                debug_fail_loudly=self._debug_fail_loudly,
+            ),
+        )
+
     async def start(self) -> None:
         if self._ingestion_task is not None:
             return
 
         self._is_shutting_down = False
-        self._ingestion_task = asyncio.create_task(self._background_ingestion_task())
+        self._ingestion_task = asyncio.create_task(self._ingestion_scheduler.run())
 
     async def stop(self) -> None:
         if self._ingestion_task is None:
             return
 
         self._is_shutting_down = True
-        await self._ingestion_task
+        self._ingestion_scheduler.stop()
+        try:
+            await self._ingestion_task
+        finally:
+            self._ingestion_task = None
 
     async def search(
         self,
@@ -116,6 +151,7 @@ class SemanticService:
             ],
             return_exceptions=True,
         )
+        self._ingestion_scheduler.notify([set_id])
 
         _consolidate_errors_and_raise(res, "Failed to add messages to set")
 
@@ -134,6 +170,7 @@ class SemanticService:
             ],
             return_exceptions=True,
         )
+        self._ingestion_scheduler.notify(set_ids)
 
         _consolidate_errors_and_raise(res, "Failed to add message to sets")
 
@@ -253,27 +290,17 @@ class SemanticService:
             filter_expr=filter_expr,
         )
 
-    async def _background_ingestion_task(self) -> None:
-        ingestion_service = IngestionService(
-            params=IngestionService.Params(
-                semantic_storage=self._semantic_storage,
-                resource_retriever=self._resource_retriever,
-                history_store=self._episode_storage,
-            ),
+    async def _ingest_set(self, set_id: SetIdT) -> None:
+        await self._ingestion_service.process_set_ids([set_id])
+
+    async def _has_ingestion_backlog(self, set_id: SetIdT) -> bool:
+        uningested_count = await self._semantic_storage.get_history_messages_count(
+            set_ids=[set_id],
+            is_ingested=False,
         )
+        return uningested_count >= max(self._feature_update_message_limit, 1)
 
-        while not self._is_shutting_down:
-            dirty_sets = await self._semantic_storage.get_history_set_ids(
-                min_uningested_messages=self._feature_update_message_limit,
-            )
-
-            if len(dirty_sets) == 0:
-                await asyncio.sleep(self._background_ingestion_interval_sec)
-                continue
-
-            try:
-                await ingestion_service.process_set_ids(dirty_sets)
-            except Exception:
-                if self._debug_fail_loudly:
-                    raise
-                logger.exception("background task crashed, restarting")
+    async def _find_sets_with_ingestion_backlog(self) -> list[SetIdT]:
+        return await self._semantic_storage.get_history_set_ids(
+            min_uningested_messages=max(self._feature_update_message_limit, 1),
+        )
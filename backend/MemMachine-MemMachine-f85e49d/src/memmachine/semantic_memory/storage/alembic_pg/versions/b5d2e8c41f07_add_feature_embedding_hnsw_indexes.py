@@ -0,0 +1,70 @@
+"""
+Add HNSW indexes on feature embeddings.
+
+The embedding column has no fixed dimension, so one partial expression
+index is created per embedding dimension found in the table. Features with
+new dimensions get their index built concurrently in the background by the
+storage after they are first added.
+
+Revision ID: b5d2e8c41f07
+Revises: 79f00a9f2409
+Create Date: 2025-11-20 10:14:32.418205
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d2e8c41f07"
+down_revision: str | Sequence[str] | None = "79f00a9f2409"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# pgvector cannot build HNSW indexes on vectors with more dimensions.
+MAX_INDEXED_DIMENSIONS = 2000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dimensions: Sequence[int] = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT DISTINCT vector_dims(embedding) FROM feature "
+                "WHERE embedding IS NOT NULL"
+            ),
+        )
+        .scalars()
+        .all()
+    )
+
+    for dimension in sorted(dimensions):
+        if dimension > MAX_INDEXED_DIMENSIONS:
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_feature_embedding_hnsw_{dimension} "
+            f"ON feature USING hnsw ((embedding::vector({dimension})) "
+            f"vector_cosine_ops) WHERE vector_dims(embedding) = {dimension}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    index_names: Sequence[str] = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = 'feature' "
+                "AND indexname LIKE 'idx_feature_embedding_hnsw_%'"
+            ),
+        )
+        .scalars()
+        .all()
+    )
+
+    for index_name in index_names:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
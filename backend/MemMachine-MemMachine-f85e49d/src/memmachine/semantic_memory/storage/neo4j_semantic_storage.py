@@ -5,14 +5,14 @@ from __future__ import annotations
 import json
 import re
 from asyncio import Lock
+from collections import Counter
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, LiteralString, cast
 
 import numpy as np
-from neo4j import AsyncDriver
-from neo4j.graph import Node as Neo4jNode
+from neo4j import AsyncDriver, AsyncManagedTransaction
 from pydantic import InstanceOf
 
 from memmachine.common.data_types import FilterablePropertyValue
@@ -49,7 +49,6 @@ class _FeatureEntry:
     tag: str
     feature_name: str
     value: str
-    embedding: np.ndarray
     metadata: dict[str, Any] | None
     citations: list[EpisodeIdT]
     created_at_ts: float
@@ -217,6 +216,81 @@ class Neo4jSemanticStorage(SemanticStorage):
             raise RuntimeError("Neo4j did not return a feature id")
         return FeatureIdT(str(feature_id))
 
+    async def add_features(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        if not features:
+            return []
+
+        timestamp = _utc_timestamp()
+
+        # Set labels cannot be parameterized, so create one batch per set.
+        rows_by_set: dict[str, list[dict[str, Any]]] = {}
+        for index, f in enumerate(features):
+            embedding = [float(x) for x in np.array(f.embedding, dtype=float).tolist()]
+            await self._ensure_set_embedding_dimensions(f.set_id, len(embedding))
+
+            metadata_json, metadata_props = self._prepare_metadata_storage(f.metadata)
+            rows_by_set.setdefault(f.set_id, []).append(
+                {
+                    "index": index,
+                    "set_id": f.set_id,
+                    "category_name": f.category_name,
+                    "feature": f.feature,
+                    "value": f.value,
+                    "tag": f.tag,
+                    "embedding": embedding,
+                    "dimensions": len(embedding),
+                    "metadata_json": metadata_json,
+                    "metadata_props": metadata_props,
+                    "citations": sorted({str(hid) for hid in f.citations}),
+                },
+            )
+
+        async def _create_features(
+            tx: AsyncManagedTransaction,
+        ) -> dict[int, str]:
+            feature_ids_by_index: dict[int, str] = {}
+            for set_id, rows in rows_by_set.items():
+                # The set label is sanitized, so the query stays free of user input.
+                query = f"""
+                    UNWIND $rows AS row
+                    CREATE (f:Feature:{self._set_label_for_set(set_id)} {{
+                        set_id: row.set_id,
+                        category_name: row.category_name,
+                        feature: row.feature,
+                        value: row.value,
+                        tag: row.tag,
+                        embedding: row.embedding,
+                        embedding_dimensions: row.dimensions,
+                        metadata_json: row.metadata_json,
+                        citations: row.citations,
+                        created_at_ts: $ts,
+                        updated_at_ts: $ts
+                    }})
+                    SET f += row.metadata_props
+                    RETURN row.index AS index, elementId(f) AS feature_id
+                    """
+                result = await tx.run(
+                    cast(LiteralString, query),
+                    rows=rows,
+                    ts=timestamp,
+                )
+                async for record in result:
+                    feature_ids_by_index[record["index"]] = record["feature_id"]
+            return feature_ids_by_index
+
+        async with self._driver.session() as session:
+            feature_ids_by_index = await session.execute_write(_create_features)
+
+        if len(feature_ids_by_index) != len(features):
+            raise RuntimeError("Failed to create feature nodes")
+        return [
+            FeatureIdT(str(feature_ids_by_index[index]))
+            for index in range(len(features))
+        ]
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
@@ -367,13 +441,13 @@ class Neo4jSemanticStorage(SemanticStorage):
             f"""
             MATCH (f:Feature)
             WHERE {self._feature_id_condition()}
-            RETURN f
+            RETURN {self._feature_projection("f")}
             """,
             feature_id=str(feature_id),
         )
         if not records:
             return None
-        entry = self._node_to_entry(records[0]["f"])
+        entry = self._record_to_entry(records[0], "f")
         return self._entry_to_model(entry, load_citations=load_citations)
 
     async def delete_features(self, feature_ids: list[FeatureIdT]) -> None:
@@ -405,6 +479,9 @@ class Neo4jSemanticStorage(SemanticStorage):
             if page_num < 0:
                 raise InvalidArgumentError("Offset must be non-negative")
 
+        if tag_threshold is not None and tag_threshold <= 0:
+            tag_threshold = None
+
         page_offset = page_num or 0
         if vector_search_opts is not None:
             entries = await self._vector_search_entries(
@@ -414,17 +491,18 @@ class Neo4jSemanticStorage(SemanticStorage):
                 filter_expr=filter_expr,
             )
         else:
+            # Without a page, the tags can be counted over the matched features
+            # in the query. A page is counted after it is loaded.
             entries = await self._load_feature_entries(
                 filter_expr=filter_expr,
+                tag_threshold=tag_threshold if page_size is None else None,
             )
             entries.sort(key=lambda e: (e.created_at_ts, str(e.feature_id)))
             if page_size is not None:
                 start = page_size * page_offset
                 entries = entries[start : start + page_size]
 
-        if tag_threshold is not None and entries:
-            from collections import Counter
-
+        if tag_threshold is not None and page_size is not None and entries:
             counts = Counter(entry.tag for entry in entries)
             entries = [entry for entry in entries if counts[entry.tag] >= tag_threshold]
 
@@ -618,6 +696,7 @@ class Neo4jSemanticStorage(SemanticStorage):
         self,
         *,
         filter_expr: FilterExpr | None,
+        tag_threshold: int | None = None,
     ) -> list[_FeatureEntry]:
         query = ["MATCH (f:Feature)"]
         conditions, params = self._build_filter_conditions(
@@ -626,19 +705,36 @@ class Neo4jSemanticStorage(SemanticStorage):
         )
         if conditions:
             query.append("WHERE " + " AND ".join(conditions))
-        query.append("RETURN f")
+        if tag_threshold is not None:
+            query.extend(
+                [
+                    "WITH f.tag AS tag, collect(f) AS tag_features",
+                    "WHERE size(tag_features) >= $tag_threshold",
+                    "UNWIND tag_features AS f",
+                ]
+            )
+            params["tag_threshold"] = tag_threshold
+        query.append(f"RETURN {self._feature_projection('f')}")
         records, _, _ = await self._driver.execute_query("\n".join(query), **params)
-        return [self._node_to_entry(record["f"]) for record in records]
+        return [self._record_to_entry(record, "f") for record in records]
 
-    def _node_to_entry(self, node: Neo4jNode) -> _FeatureEntry:
-        props = dict(node)
-        node_id = getattr(node, "element_id", None)
+    @staticmethod
+    def _feature_projection(alias: str) -> str:
+        # Embeddings are only used for vector search in the database, so they
+        # are not sent back with the features.
+        return (
+            f"{alias} {{.*, embedding: null}} AS {alias}, "
+            f"elementId({alias}) AS {alias}_element_id"
+        )
+
+    def _record_to_entry(self, record: Mapping[str, Any], alias: str) -> _FeatureEntry:
+        props = dict(record[alias])
+        node_id = record.get(f"{alias}_element_id")
         if node_id is None:
             node_id = props.get("id")
         if node_id is None:
             raise ValueError("Feature node missing identifier")
         feature_id = FeatureIdT(str(node_id))
-        embedding = np.array(props.get("embedding", []), dtype=float)
         citations = [EpisodeIdT(cid) for cid in props.get("citations", [])]
         metadata = self._parse_metadata(props)
         return _FeatureEntry(
@@ -648,7 +744,6 @@ class Neo4jSemanticStorage(SemanticStorage):
             tag=_required_str_prop(props, "tag"),
             feature_name=_required_str_prop(props, "feature"),
             value=_required_str_prop(props, "value"),
-            embedding=embedding,
             metadata=metadata,
             citations=citations,
             created_at_ts=float(props.get("created_at_ts", 0.0)),
@@ -802,7 +897,10 @@ class Neo4jSemanticStorage(SemanticStorage):
         ]
         if conditions:
             query_parts.append("WHERE " + " AND ".join(conditions))
-        query_parts.append("RETURN f AS node, score ORDER BY score DESC")
+        query_parts.append(
+            f"RETURN {Neo4jSemanticStorage._feature_projection('f')}, score "
+            "ORDER BY score DESC"
+        )
         return "\n".join(query_parts)
 
     def _matching_set_ids(
@@ -841,7 +939,7 @@ class Neo4jSemanticStorage(SemanticStorage):
         params["index_name"] = index_name
         records, _, _ = await self._driver.execute_query(query_text, **params)
         return [
-            (float(record.get("score") or 0.0), self._node_to_entry(record["node"]))
+            (float(record.get("score") or 0.0), self._record_to_entry(record, "f"))
             for record in records
         ]
 
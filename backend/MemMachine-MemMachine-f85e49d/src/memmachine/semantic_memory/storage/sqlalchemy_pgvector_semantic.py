@@ -1,6 +1,9 @@
 """SQLAlchemy-backed semantic storage implementation using pgvector."""
 
+import asyncio
 import logging
+from collections import Counter
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, overload
 
@@ -20,8 +23,10 @@ from sqlalchemy import (
     String,
     Table,
     and_,
+    cast,
     delete,
     insert,
+    literal_column,
     or_,
     select,
     text,
@@ -35,6 +40,7 @@ from sqlalchemy.orm import (
     InstrumentedAttribute,
     MappedColumn,
     aliased,
+    defer,
     mapped_column,
 )
 from sqlalchemy.sql import Delete, Select, func
@@ -62,6 +68,32 @@ from memmachine.semantic_memory.storage.storage_base import (
 
 logger = logging.getLogger(__name__)
 
+# pgvector cannot build HNSW indexes on vectors with more dimensions.
+MAX_INDEXED_DIMENSIONS = 2000
+VECTOR_INDEX_PREFIX = "idx_feature_embedding_hnsw_"
+
+
+def create_vector_index_sql(dimensions: int) -> str:
+    """
+    Return the statement creating the HNSW index for one embedding dimension.
+
+    The embedding column has no fixed dimension, so each dimension gets a
+    partial index on the embedding cast to a typed vector. The index is
+    built concurrently so that writes are not blocked, which must run
+    outside of a transaction.
+    """
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {VECTOR_INDEX_PREFIX}{dimensions} "
+        f"ON feature USING hnsw ((embedding::vector({dimensions})) "
+        f"vector_cosine_ops) WHERE vector_dims(embedding) = {dimensions}"
+    )
+
+
+def _parse_version(version: str | None) -> tuple[int, ...]:
+    if not version:
+        return ()
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
 
 class BaseSemanticStorage(DeclarativeBase):
     """Declarative base for semantic memory SQLAlchemy models."""
@@ -199,6 +231,13 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             expire_on_commit=False,
         )
 
+        self._indexed_dimensions: set[int] = set()
+        self._pending_index_dimensions: set[int] = set()
+        self._vector_index_lock = asyncio.Lock()
+        self._supports_iterative_scan = False
+
+        self._background_tasks: set[asyncio.Task] = set()
+
     def _create_session(self) -> AsyncSession:
         return self._session_factory()
 
@@ -207,8 +246,127 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
 
     async def startup(self) -> None:
         await self._initialize_db()
+        await self._load_vector_index_state()
+
+    async def _load_vector_index_state(self) -> None:
+        async with self._create_session() as session:
+            index_names = (
+                await session.scalars(
+                    text(
+                        "SELECT index_class.relname FROM pg_index "
+                        "JOIN pg_class index_class "
+                        "ON index_class.oid = pg_index.indexrelid "
+                        "WHERE pg_index.indrelid = 'feature'::regclass "
+                        "AND pg_index.indisvalid "
+                        "AND index_class.relname LIKE :pattern"
+                    ),
+                    {"pattern": f"{VECTOR_INDEX_PREFIX}%"},
+                )
+            ).all()
+            pgvector_version = await session.scalar(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'"),
+            )
+
+        self._indexed_dimensions = {
+            int(suffix)
+            for suffix in (
+                index_name.removeprefix(VECTOR_INDEX_PREFIX)
+                for index_name in index_names
+            )
+            if suffix.isdigit()
+        }
+        # Iterative index scans keep filtered searches from returning
+        # fewer results than requested.
+        self._supports_iterative_scan = _parse_version(pgvector_version) >= (0, 8)
+
+    def _track_task(self, task: asyncio.Task) -> None:
+        """Keep background tasks from being garbage collected prematurely."""
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _schedule_vector_indexes(self, embeddings: list[np.ndarray]) -> None:
+        """Create the HNSW indexes of new embedding dimensions in the background."""
+        missing = {
+            len(embedding)
+            for embedding in embeddings
+            if len(embedding) <= MAX_INDEXED_DIMENSIONS
+        } - (self._indexed_dimensions | self._pending_index_dimensions)
+
+        for dimension in sorted(missing):
+            self._pending_index_dimensions.add(dimension)
+            self._track_task(
+                asyncio.create_task(self._create_pending_vector_index(dimension)),
+            )
+
+    async def _create_pending_vector_index(self, dimension: int) -> None:
+        try:
+            await self._create_vector_index(dimension)
+        except Exception:
+            logger.exception(
+                "Failed to create HNSW index for %d-dimension features",
+                dimension,
+            )
+        finally:
+            self._pending_index_dimensions.discard(dimension)
+
+    async def _create_vector_index(self, dimension: int) -> None:
+        async with self._vector_index_lock:
+            if dimension in self._indexed_dimensions:
+                return
+
+            logger.info("Creating HNSW index for %d-dimension features", dimension)
+            async with self._engine.connect() as conn:
+                autocommit_conn = await conn.execution_options(
+                    isolation_level="AUTOCOMMIT",
+                )
+                await autocommit_conn.exec_driver_sql(
+                    create_vector_index_sql(dimension)
+                )
+                is_valid = await autocommit_conn.scalar(
+                    text(
+                        "SELECT pg_index.indisvalid FROM pg_index "
+                        "WHERE pg_index.indexrelid = to_regclass(:index_name)"
+                    ),
+                    {"index_name": f"{VECTOR_INDEX_PREFIX}{dimension}"},
+                )
+
+            if not is_valid:
+                # IF NOT EXISTS skips indexes still being built by another
+                # process, or left invalid by an interrupted build.
+                logger.warning(
+                    "HNSW index %s%d is not valid, drop it to have it rebuilt "
+                    "unless another process is still building it",
+                    VECTOR_INDEX_PREFIX,
+                    dimension,
+                )
+            self._indexed_dimensions.add(dimension)
+
+    async def create_vector_indexes(self) -> None:
+        """
+        Create the missing HNSW indexes of the embedding dimensions in use.
+
+        Indexes of new dimensions are otherwise created in the background
+        after features with that dimension are first added.
+        """
+        async with self._create_session() as session:
+            dimensions: Sequence[int] = (
+                await session.scalars(
+                    text(
+                        "SELECT DISTINCT vector_dims(embedding) FROM feature "
+                        "WHERE embedding IS NOT NULL"
+                    ),
+                )
+            ).all()
+
+        for dimension in sorted(dimensions):
+            if dimension <= MAX_INDEXED_DIMENSIONS:
+                await self._create_vector_index(dimension)
 
     async def cleanup(self) -> None:
+        # Interrupted concurrent builds leave invalid indexes behind
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
         await self._engine.dispose()
 
     async def delete_all(self) -> None:
@@ -248,8 +406,51 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             await session.commit()
             feature_id = result.scalar_one()
 
+        self._schedule_vector_indexes([embedding])
+
         return FeatureIdT(feature_id)
 
+    async def add_features(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        if not features:
+            return []
+
+        stmt = insert(Feature).returning(Feature.id, sort_by_parameter_order=True)
+        rows = [
+            {
+                "set_id": f.set_id,
+                "semantic_category_id": f.category_name,
+                "tag_id": f.tag,
+                "feature": f.feature,
+                "value": f.value,
+                "embedding": f.embedding,
+                "json_metadata": f.metadata,
+            }
+            for f in features
+        ]
+
+        async with self._create_session() as session:
+            result = await session.execute(stmt, rows)
+            feature_ids = list(result.scalars().all())
+
+            citation_rows = [
+                {"feature_id": feature_id, "history_id": str(hid)}
+                for feature_id, f in zip(feature_ids, features, strict=True)
+                for hid in dict.fromkeys(f.citations)
+            ]
+            if citation_rows:
+                await session.execute(
+                    insert(citation_association_table).values(citation_rows),
+                )
+
+            await session.commit()
+
+        self._schedule_vector_indexes([f.embedding for f in features])
+
+        return [FeatureIdT(feature_id) for feature_id in feature_ids]
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
@@ -288,6 +489,9 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             await session.execute(stmt)
             await session.commit()
 
+        if embedding is not None:
+            self._schedule_vector_indexes([embedding])
+
     async def get_feature(
         self,
         feature_id: FeatureIdT,
@@ -326,7 +530,8 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
         load_citations: bool = False,
         filter_expr: FilterExpr | None = None,
     ) -> list[SemanticFeature]:
-        stmt = select(Feature)
+        # Embeddings are only needed for ordering, which happens in SQL
+        stmt = select(Feature).options(defer(Feature.embedding))
 
         stmt = self._apply_feature_filter(
             stmt,
@@ -335,6 +540,14 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             filter_expr=filter_expr,
         )
 
+        if tag_threshold is not None and tag_threshold <= 0:
+            tag_threshold = None
+
+        # Without a page, the tags can be counted over the matched rows in SQL.
+        # A page is counted after it is loaded, as it is bounded anyway.
+        if tag_threshold is not None and page_size is None:
+            stmt = self._apply_tag_threshold(stmt, tag_threshold)
+
         if vector_search_opts is None:
             stmt = stmt.order_by(Feature.created_at.asc(), Feature.id.asc())
 
@@ -346,6 +559,8 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
             raise InvalidArgumentError("Cannot specify offset without limit")
 
         async with self._create_session() as session:
+            if vector_search_opts is not None:
+                await self._apply_vector_search_settings(session, vector_search_opts)
             result = await session.execute(stmt)
             features = result.scalars().all()
             citations_map: dict[int, list[EpisodeIdT]] = {}
@@ -354,9 +569,7 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
                     session,
                     [f.id for f in features if f.id is not None],
                 )
-        if tag_threshold is not None and tag_threshold > 0 and features:
-            from collections import Counter
-
+        if tag_threshold is not None and page_size is not None and features:
             counts = Counter(f.tag_id for f in features)
             features = [f for f in features if counts[f.tag_id] >= tag_threshold]
 
@@ -523,29 +736,67 @@ class SqlAlchemyPgVectorSemanticStorage(SemanticStorage):
 
         return stmt
 
+    async def _apply_vector_search_settings(
+        self,
+        session: AsyncSession,
+        vector_search_opts: SemanticStorage.VectorSearchOpts,
+    ) -> None:
+        settings: dict[str, str] = {}
+        for name, value in (
+            ("hnsw.ef_search", vector_search_opts.ef_search),
+            ("ivfflat.probes", vector_search_opts.probes),
+        ):
+            if value is None:
+                continue
+            if value < 1:
+                raise InvalidArgumentError(f"{name} must be positive, got {value}")
+            settings[name] = str(value)
+
+        if self._supports_iterative_scan:
+            settings["hnsw.iterative_scan"] = "strict_order"
+
+        # Local settings only last for the transaction running the search
+        for name, setting in settings.items():
+            await session.execute(select(func.set_config(name, setting, True)))
+
     def _apply_vector_search_opts(
         self,
         *,
         stmt: Select[Any],
         vector_search_opts: SemanticStorage.VectorSearchOpts,
     ) -> Select[Any]:
+        dimensions = len(vector_search_opts.query_embedding)
+
+        # Match the per-dimension HNSW index expression and predicate
+        distance = cast(Feature.embedding, Vector(dimensions)).cosine_distance(
+            vector_search_opts.query_embedding,
+        )
+        stmt = stmt.where(
+            func.vector_dims(Feature.embedding) == literal_column(str(dimensions)),
+        )
+
         if vector_search_opts.min_distance is not None:
             threshold = 1 - vector_search_opts.min_distance
-            stmt = stmt.where(
-                Feature.embedding.cosine_distance(
-                    vector_search_opts.query_embedding,
-                )
-                <= threshold,
-            )
+            stmt = stmt.where(distance <= threshold)
 
-        stmt = stmt.order_by(
-            Feature.embedding.cosine_distance(
-                vector_search_opts.query_embedding,
-            ).asc(),
-        )
+        stmt = stmt.order_by(distance.asc())
 
         return stmt
 
+    @staticmethod
+    def _apply_tag_threshold(stmt: Select[Any], tag_threshold: int) -> Select[Any]:
+        """Keep features whose tag has tag_threshold or more matched features."""
+        frequent_tags = (
+            select(Feature.tag_id)
+            .group_by(Feature.tag_id)
+            .having(func.count() >= tag_threshold)
+            .correlate(None)
+        )
+        if stmt.whereclause is not None:
+            frequent_tags = frequent_tags.where(stmt.whereclause)
+
+        return stmt.where(Feature.tag_id.in_(frequent_tags))
+
     def _apply_feature_select_filter(
         self,
         stmt: Select[Any],
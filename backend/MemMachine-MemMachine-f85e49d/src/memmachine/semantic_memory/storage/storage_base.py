@@ -1,7 +1,7 @@
 """Abstract interfaces for semantic storage implementations."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
@@ -58,6 +58,33 @@ class SemanticStorage(ABC):
         """Add a new feature to the user."""
         raise NotImplementedError
 
+    @dataclass
+    class NewFeature:
+        """A feature to add in bulk, together with the history ids it cites."""
+
+        set_id: SetIdT
+        category_name: str
+        feature: str
+        value: str
+        tag: str
+        embedding: InstanceOf[np.ndarray]
+        metadata: dict[str, Any] | None = None
+        citations: list[EpisodeIdT] = field(default_factory=list)
+
+    @abstractmethod
+    async def add_features(
+        self,
+        features: list[NewFeature],
+    ) -> list[FeatureIdT]:
+        """
+        Add new features and their citations in a single transaction.
+
+        Returns:
+            The ids of the added features, in the same order as the input.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update_feature(
         self,
@@ -86,6 +113,11 @@ class SemanticStorage(ABC):
         query_embedding: InstanceOf[np.ndarray]
         min_distance: float | None = None
 
+        # Approximate index tuning, for backends that support it. Higher
+        # values trade latency for recall; None keeps the backend default.
+        ef_search: int | None = None
+        probes: int | None = None
+
     @abstractmethod
     async def get_feature_set(
         self,
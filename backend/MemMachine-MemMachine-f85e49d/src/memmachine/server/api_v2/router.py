@@ -205,7 +205,8 @@ async def _list_target_memories(
         target_memories=[spec.type],
         search_filter=spec.filter,
         page_size=spec.page_size,
-        page_num=spec.page_num,
+        page_num=spec.page_num if spec.cursor is None else None,
+        cursor=spec.cursor,
     )
 
     return SearchResult(
@@ -217,6 +218,7 @@ async def _list_target_memories(
             "semantic_memory": results.semantic_memory
             if results.semantic_memory
             else [],
+            "next_cursor": results.next_episodic_cursor,
         },
     )
 
@@ -227,7 +229,10 @@ async def list_memories(
     memmachine: Annotated[MemMachine, Depends(get_memmachine)],
 ) -> SearchResult:
     """List memories in a project."""
-    return await _list_target_memories(spec=spec, memmachine=memmachine)
+    try:
+        return await _list_target_memories(spec=spec, memmachine=memmachine)
+    except InvalidArgumentError as e:
+        raise RestError(code=422, message="invalid argument: " + str(e)) from e
 
 
 @router.post(
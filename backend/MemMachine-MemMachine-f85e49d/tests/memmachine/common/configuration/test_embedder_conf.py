@@ -127,3 +127,54 @@ def test_open_ai_embeder_without_key():
     }
     conf = OpenAIEmbedderConf(**conf_dict)
     assert conf.api_key.get_secret_value() == ""
+
+
+def test_embedder_cache_conf(openai_embedder_conf, aws_embedder_conf):
+    openai_embedder_conf["config"]["cache"] = {
+        "max_size": 100,
+        "disk_path": "/tmp/embeddings.sqlite",
+    }
+    conf = EmbeddersConf.parse(
+        {
+            "embedders": {
+                "openai_embedder": openai_embedder_conf,
+                "aws_embedder_id": aws_embedder_conf,
+            },
+        },
+    )
+
+    cache_conf = conf.get_embedder_cache_conf("openai_embedder")
+    assert cache_conf is not None
+    assert cache_conf.max_size == 100
+    assert cache_conf.disk_path == "/tmp/embeddings.sqlite"
+    assert conf.get_embedder_cache_conf("aws_embedder_id") is None
+    assert conf.get_embedder_cache_conf("unknown_embedder") is None
+
+    conf_cp = EmbeddersConf.parse(yaml.safe_load(conf.to_yaml()))
+    assert conf_cp == conf
+
+
+def test_embedder_batching_conf(openai_embedder_conf, aws_embedder_conf):
+    openai_embedder_conf["config"]["batching"] = {
+        "max_wait_seconds": 0.01,
+        "max_batch_size": 64,
+    }
+    conf = EmbeddersConf.parse(
+        {
+            "embedders": {
+                "openai_embedder": openai_embedder_conf,
+                "aws_embedder_id": aws_embedder_conf,
+            },
+        },
+    )
+
+    batching_conf = conf.get_embedder_batching_conf("openai_embedder")
+    assert batching_conf is not None
+    assert batching_conf.max_wait_seconds == 0.01
+    assert batching_conf.max_batch_size == 64
+    assert batching_conf.max_batch_tokens == 100_000
+    assert conf.get_embedder_batching_conf("aws_embedder_id") is None
+    assert conf.get_embedder_batching_conf("unknown_embedder") is None
+
+    conf_cp = EmbeddersConf.parse(yaml.safe_load(conf.to_yaml()))
+    assert conf_cp == conf
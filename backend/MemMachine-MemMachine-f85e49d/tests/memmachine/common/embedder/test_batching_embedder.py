@@ -0,0 +1,183 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from memmachine.common.embedder.batching_embedder import (
+    BatchingEmbedder,
+    BatchingEmbedderParams,
+)
+from memmachine.common.metrics_factory import MetricsFactory
+from tests.memmachine.common.reranker.fake_embedder import FakeEmbedder
+
+
+class RecordingEmbedder(FakeEmbedder):
+    def __init__(self, failing_inputs=()):
+        super().__init__()
+        self.failing_inputs = set(failing_inputs)
+        self.ingest_calls = []
+        self.search_calls = []
+
+    async def ingest_embed(self, inputs, max_attempts=1):
+        self.ingest_calls.append(list(inputs))
+        if self.failing_inputs.intersection(inputs):
+            raise RuntimeError("embedding failed")
+        return await super().ingest_embed(inputs, max_attempts)
+
+    async def search_embed(self, queries, max_attempts=1):
+        self.search_calls.append(list(queries))
+        return [[float(len(query)), 1.0] for query in queries]
+
+
+@pytest.fixture
+def embedder():
+    return RecordingEmbedder()
+
+
+@pytest.fixture
+def batching_embedder(embedder):
+    return BatchingEmbedder(
+        BatchingEmbedderParams(embedder=embedder, max_wait_seconds=0.01),
+    )
+
+
+@pytest.mark.asyncio
+async def test_properties_delegate(embedder, batching_embedder):
+    assert batching_embedder.model_id == embedder.model_id
+    assert batching_embedder.dimensions == embedder.dimensions
+    assert batching_embedder.similarity_metric == embedder.similarity_metric
+
+
+@pytest.mark.asyncio
+async def test_empty_inputs(embedder, batching_embedder):
+    assert await batching_embedder.ingest_embed([]) == []
+    assert await batching_embedder.search_embed([]) == []
+    assert embedder.ingest_calls == []
+    assert embedder.search_calls == []
+
+
+@pytest.mark.asyncio
+async def test_invalid_max_attempts(batching_embedder):
+    with pytest.raises(ValueError, match="max_attempts"):
+        await batching_embedder.ingest_embed(["a"], max_attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_coalesces_concurrent_calls(embedder, batching_embedder):
+    results = await asyncio.gather(
+        batching_embedder.ingest_embed(["a"]),
+        batching_embedder.ingest_embed(["bb", "ccc"]),
+        batching_embedder.search_embed(["dddd"]),
+        batching_embedder.search_embed(["e"]),
+    )
+
+    assert results == [
+        [[1.0, -1.0]],
+        [[2.0, -2.0], [3.0, -3.0]],
+        [[4.0, 1.0]],
+        [[1.0, 1.0]],
+    ]
+    assert embedder.ingest_calls == [["a", "bb", "ccc"]]
+    assert embedder.search_calls == [["dddd", "e"]]
+
+
+@pytest.mark.asyncio
+async def test_respects_max_batch_size(embedder):
+    batching_embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=embedder,
+            max_wait_seconds=0.01,
+            max_batch_size=3,
+        ),
+    )
+
+    results = await asyncio.gather(
+        batching_embedder.ingest_embed(["a", "b"]),
+        batching_embedder.ingest_embed(["c", "d"]),
+        batching_embedder.ingest_embed(["e"]),
+    )
+
+    assert [len(result) for result in results] == [2, 2, 1]
+    assert all(len(inputs) <= 3 for inputs in embedder.ingest_calls)
+    assert sorted(input_ for inputs in embedder.ingest_calls for input_ in inputs) == [
+        "a",
+        "b",
+        "c",
+        "d",
+        "e",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_respects_max_batch_tokens(embedder):
+    batching_embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=embedder,
+            max_wait_seconds=0.01,
+            max_batch_tokens=20,
+        ),
+    )
+
+    await asyncio.gather(
+        batching_embedder.ingest_embed(["x" * 40]),
+        batching_embedder.ingest_embed(["y" * 40]),
+    )
+
+    assert embedder.ingest_calls == [["x" * 40], ["y" * 40]]
+
+
+@pytest.mark.asyncio
+async def test_isolates_failing_calls():
+    embedder = RecordingEmbedder(failing_inputs={"bad"})
+    batching_embedder = BatchingEmbedder(
+        BatchingEmbedderParams(embedder=embedder, max_wait_seconds=0.01),
+    )
+
+    results = await asyncio.gather(
+        batching_embedder.ingest_embed(["a"]),
+        batching_embedder.ingest_embed(["bad"]),
+        batching_embedder.ingest_embed(["ccc"]),
+        return_exceptions=True,
+    )
+
+    assert results[0] == [[1.0, -1.0]]
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == [[3.0, -3.0]]
+    assert embedder.ingest_calls[0] == ["a", "bad", "ccc"]
+    assert sorted(embedder.ingest_calls[1:]) == [["a"], ["bad"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_does_not_affect_others(embedder, batching_embedder):
+    cancelled = asyncio.create_task(batching_embedder.ingest_embed(["a"]))
+    kept = asyncio.create_task(batching_embedder.ingest_embed(["bb"]))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == [[2.0, -2.0]]
+    assert embedder.ingest_calls == [["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_metrics(embedder):
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    batches_counter = MagicMock()
+    calls_per_batch_summary = MagicMock()
+    metrics_factory.get_counter.return_value = batches_counter
+    metrics_factory.get_summary.return_value = calls_per_batch_summary
+
+    batching_embedder = BatchingEmbedder(
+        BatchingEmbedderParams(
+            embedder=embedder,
+            max_wait_seconds=0.01,
+            metrics_factory=metrics_factory,
+        ),
+    )
+
+    await asyncio.gather(
+        batching_embedder.ingest_embed(["a"]),
+        batching_embedder.ingest_embed(["b"]),
+    )
+
+    batches_counter.increment.assert_called_once_with(labels={})
+    calls_per_batch_summary.observe.assert_called_once_with(value=2, labels={})
@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from memmachine.common.embedder.caching_embedder import (
+    CachingEmbedder,
+    CachingEmbedderParams,
+)
+from memmachine.common.metrics_factory import MetricsFactory
+from tests.memmachine.common.reranker.fake_embedder import FakeEmbedder
+
+
+class CountingEmbedder(FakeEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.ingest_inputs = []
+        self.search_queries = []
+
+    async def ingest_embed(self, inputs, max_attempts=1):
+        self.ingest_inputs.append(list(inputs))
+        return await super().ingest_embed(inputs, max_attempts)
+
+    async def search_embed(self, queries, max_attempts=1):
+        self.search_queries.append(list(queries))
+        return [[float(len(query)), 1.0] for query in queries]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def caching_embedder(embedder):
+    return CachingEmbedder(CachingEmbedderParams(embedder=embedder))
+
+
+@pytest.mark.asyncio
+async def test_properties_delegate(embedder, caching_embedder):
+    assert caching_embedder.model_id == embedder.model_id
+    assert caching_embedder.dimensions == embedder.dimensions
+    assert caching_embedder.similarity_metric == embedder.similarity_metric
+
+
+@pytest.mark.asyncio
+async def test_empty_inputs(embedder, caching_embedder):
+    assert await caching_embedder.ingest_embed([]) == []
+    assert await caching_embedder.search_embed([]) == []
+    assert embedder.ingest_inputs == []
+    assert embedder.search_queries == []
+
+
+@pytest.mark.asyncio
+async def test_embeds_only_misses(embedder, caching_embedder):
+    assert await caching_embedder.ingest_embed(["a", "bb"]) == [
+        [1.0, -1.0],
+        [2.0, -2.0],
+    ]
+    assert await caching_embedder.ingest_embed(["bb", "ccc", "a", "ccc"]) == [
+        [2.0, -2.0],
+        [3.0, -3.0],
+        [1.0, -1.0],
+        [3.0, -3.0],
+    ]
+    assert embedder.ingest_inputs == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_modes_are_cached_separately(embedder, caching_embedder):
+    assert await caching_embedder.ingest_embed(["a"]) == [[1.0, -1.0]]
+    assert await caching_embedder.search_embed(["a"]) == [[1.0, 1.0]]
+    assert await caching_embedder.search_embed(["a"]) == [[1.0, 1.0]]
+    assert embedder.ingest_inputs == [["a"]]
+    assert embedder.search_queries == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_returned_embeddings_do_not_alias_cache(caching_embedder):
+    embeddings = await caching_embedder.ingest_embed(["a"])
+    embeddings[0][0] = 100.0
+    assert await caching_embedder.ingest_embed(["a"]) == [[1.0, -1.0]]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(embedder):
+    caching_embedder = CachingEmbedder(
+        CachingEmbedderParams(embedder=embedder, max_cache_size=2),
+    )
+    await caching_embedder.ingest_embed(["a", "bb"])
+    await caching_embedder.ingest_embed(["a"])
+    await caching_embedder.ingest_embed(["ccc"])
+
+    # "bb" was least recently used, so it was evicted.
+    await caching_embedder.ingest_embed(["a", "bb"])
+    assert embedder.ingest_inputs == [["a", "bb"], ["ccc"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache(embedder, tmp_path):
+    disk_cache_path = str(tmp_path / "embeddings.sqlite")
+
+    caching_embedder = CachingEmbedder(
+        CachingEmbedderParams(embedder=embedder, disk_cache_path=disk_cache_path),
+    )
+    await caching_embedder.ingest_embed(["a", "bb"])
+
+    other_embedder = CountingEmbedder()
+    other_caching_embedder = CachingEmbedder(
+        CachingEmbedderParams(
+            embedder=other_embedder,
+            disk_cache_path=disk_cache_path,
+        ),
+    )
+    assert await other_caching_embedder.ingest_embed(["bb", "ccc", "a"]) == [
+        [2.0, -2.0],
+        [3.0, -3.0],
+        [1.0, -1.0],
+    ]
+    assert other_embedder.ingest_inputs == [["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_metrics(embedder):
+    metrics_factory = MagicMock(spec=MetricsFactory)
+    counters = {}
+
+    def get_counter(name, description, label_names=()):
+        counters[name] = MagicMock()
+        return counters[name]
+
+    metrics_factory.get_counter.side_effect = get_counter
+
+    caching_embedder = CachingEmbedder(
+        CachingEmbedderParams(
+            embedder=embedder,
+            metrics_factory=metrics_factory,
+            user_metrics_labels={"label": "value"},
+        ),
+    )
+    await caching_embedder.ingest_embed(["a", "bb"])
+    await caching_embedder.ingest_embed(["a", "ccc"])
+
+    hits = counters["embedder_cache_hits"].increment.call_args_list
+    misses = counters["embedder_cache_misses"].increment.call_args_list
+    assert [call.kwargs["value"] for call in hits] == [0, 1]
+    assert [call.kwargs["value"] for call in misses] == [2, 1]
+    assert misses[0].kwargs["labels"] == {"label": "value"}
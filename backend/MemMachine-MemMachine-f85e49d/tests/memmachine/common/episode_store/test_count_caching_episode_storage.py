@@ -12,6 +12,7 @@ def wrapped_store():
     store.startup = AsyncMock()
     store.add_episodes = AsyncMock(return_value=[])
     store.get_episode = AsyncMock()
+    store.get_episodes = AsyncMock(return_value=[])
     store.get_episode_messages = AsyncMock()
     store.get_episode_messages_count = AsyncMock()
     store.delete_episodes = AsyncMock()
@@ -103,3 +104,11 @@ async def test_non_session_filters_bypass_cache(wrapped_store):
     assert first == 7
     assert second == 9
     assert wrapped_store.get_episode_messages_count.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_episodes_passes_through(wrapped_store):
+    storage = CountCachingEpisodeStorage(wrapped_store)
+
+    assert await storage.get_episodes(["1", "2"]) == []
+    wrapped_store.get_episodes.assert_awaited_once_with(["1", "2"])
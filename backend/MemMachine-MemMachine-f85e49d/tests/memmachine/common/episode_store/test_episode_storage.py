@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from memmachine.common.episode_store import (
+    EpisodeCursor,
     EpisodeEntry,
     EpisodeIdT,
     EpisodeStorage,
     EpisodeType,
 )
+from memmachine.common.episode_store.episode_sqlalchemy_store import (
+    Episode,
+    SqlAlchemyEpisodeStore,
+)
 from memmachine.common.errors import InvalidArgumentError
 from memmachine.common.filter.filter_parser import FilterExpr, parse_filter
 
@@ -102,6 +111,28 @@ async def test_add_and_get_history(episode_storage: EpisodeStorage):
     assert history.episode_type == EpisodeType.MESSAGE
 
 
+@pytest.mark.asyncio
+async def test_get_episodes_preserves_order(episode_storage: EpisodeStorage):
+    first_id = await create_history_entry(episode_storage, content="first")
+    second_id = await create_history_entry(episode_storage, content="second")
+    missing_id = await create_history_entry(episode_storage, content="missing")
+    await episode_storage.delete_episodes([missing_id])
+
+    episodes = await episode_storage.get_episodes(
+        [second_id, missing_id, first_id, second_id],
+    )
+
+    assert [e.content if e is not None else None for e in episodes] == [
+        "second",
+        None,
+        "first",
+        "second",
+    ]
+    assert await episode_storage.get_episodes([]) == []
+
+    await episode_storage.delete_episodes([first_id, second_id])
+
+
 @pytest.mark.asyncio
 async def test_add_multiple_episodes_returns_models(
     episode_storage: EpisodeStorage,
@@ -277,6 +308,79 @@ async def test_history_metadata_filter(episode_storage: EpisodeStorage):
     await episode_storage.delete_episodes([first, second])
 
 
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_history_metadata_filter_with_indexed_metadata(
+    sqlalchemy_pg_engine: AsyncEngine,
+):
+    episode_storage = SqlAlchemyEpisodeStore(
+        sqlalchemy_pg_engine,
+        metadata_gin_index=True,
+        indexed_metadata_keys=["user_id"],
+    )
+    await episode_storage.startup()
+    await episode_storage.delete_episode_messages()
+
+    # On PostgreSQL, filters compare the text of metadata values, whatever
+    # their JSON type, and the containment check must not change that.
+    string_id = await create_history_entry(
+        episode_storage, content="string", metadata={"user_id": "123"}
+    )
+    number_id = await create_history_entry(
+        episode_storage, content="number", metadata={"user_id": 123}
+    )
+    name_id = await create_history_entry(
+        episode_storage, content="name", metadata={"user_id": "alice"}
+    )
+    other_id = await create_history_entry(
+        episode_storage, content="other", metadata={"user_id": "456"}
+    )
+
+    try:
+        results = await episode_storage.get_episode_messages(
+            filter_expr=_filter("metadata.user_id = 123"),
+        )
+        assert sorted(entry.uid for entry in results) == sorted([string_id, number_id])
+
+        results = await episode_storage.get_episode_messages(
+            filter_expr=_filter("metadata.user_id IN ('alice', 456)"),
+        )
+        assert sorted(entry.uid for entry in results) == sorted([name_id, other_id])
+
+        assert (
+            await episode_storage.get_episode_messages_count(
+                filter_expr=_filter("metadata.user_id < 200"),
+            )
+            == 2
+        )
+    finally:
+        await episode_storage.delete_episodes([string_id, number_id, name_id, other_id])
+
+
+def test_postgres_metadata_filters_use_containment():
+    engine = MagicMock(spec=AsyncEngine)
+    engine.dialect.name = "postgresql"
+    episode_storage = SqlAlchemyEpisodeStore(engine, metadata_gin_index=True)
+
+    stmt = episode_storage._apply_episode_filter(
+        select(Episode.id),
+        filter_expr=_filter("metadata.user_id = 123 AND producer_id = 'p'"),
+    )
+    compiled = stmt.compile(dialect=postgresql.dialect())
+
+    # Equality is matched by containment of the string and the number
+    assert str(compiled).count("episodestore.metadata @>") == 2
+    assert {"user_id": "123"} in compiled.params.values()
+    assert {"user_id": 123} in compiled.params.values()
+    assert "producer_id" in str(compiled).rsplit("@>", 1)[1]
+
+    ddl = SqlAlchemyEpisodeStore.create_metadata_key_index_sql("User_Id")
+    assert ddl == (
+        "CREATE INDEX IF NOT EXISTS idx_episodestore_metadata_key_user_id "
+        "ON episodestore ((CAST(episodestore.metadata ->> 'user_id' AS VARCHAR)))"
+    )
+
+
 @pytest.mark.asyncio
 async def test_history_pagination_with_page_offset(
     episode_storage: EpisodeStorage,
@@ -308,6 +412,58 @@ async def test_history_pagination_with_page_offset(
         await episode_storage.delete_episodes(episode_ids)
 
 
+@pytest.mark.asyncio
+async def test_history_pagination_with_cursor(
+    episode_storage: EpisodeStorage,
+):
+    base_time = datetime.now(tz=UTC)
+    episode_ids = []
+
+    # Episodes created at the same time are ordered by id
+    for idx in range(5):
+        created_at = base_time + timedelta(minutes=idx // 2)
+        episode_ids.append(
+            await create_history_entry(
+                episode_storage,
+                content=f"message-{idx}",
+                created_at=created_at,
+            )
+        )
+
+    try:
+        pages = []
+        cursor = None
+        while True:
+            page = await episode_storage.get_episode_messages(
+                page_size=2,
+                cursor=cursor,
+            )
+            if not page:
+                break
+            pages.append([entry.uid for entry in page])
+            cursor = EpisodeCursor.after(page[-1]).encode()
+
+        assert pages == [episode_ids[:2], episode_ids[2:4], episode_ids[4:5]]
+    finally:
+        await episode_storage.delete_episodes(episode_ids)
+
+
+@pytest.mark.asyncio
+async def test_history_pagination_invalid_cursor_raises(
+    episode_storage: EpisodeStorage,
+):
+    with pytest.raises(InvalidArgumentError):
+        await episode_storage.get_episode_messages(page_size=2, cursor="not-a-cursor")
+
+    cursor = EpisodeCursor(created_at=datetime.now(tz=UTC), uid="1").encode()
+    with pytest.raises(InvalidArgumentError):
+        await episode_storage.get_episode_messages(
+            page_size=2,
+            page_num=1,
+            cursor=cursor,
+        )
+
+
 @pytest.mark.asyncio
 async def test_history_pagination_offset_without_limit_raises(
     episode_storage: EpisodeStorage,
@@ -4,10 +4,14 @@ from pydantic import SecretStr
 from memmachine.common.configuration import EmbeddersConf
 from memmachine.common.configuration.embedder_conf import (
     AmazonBedrockEmbedderConf,
+    EmbedderBatchingConf,
+    EmbedderCacheConf,
     OpenAIEmbedderConf,
     SentenceTransformerEmbedderConfig,
 )
 from memmachine.common.embedder import Embedder
+from memmachine.common.embedder.batching_embedder import BatchingEmbedder
+from memmachine.common.embedder.caching_embedder import CachingEmbedder
 from memmachine.common.resource_manager.embedder_manager import EmbedderManager
 
 
@@ -78,3 +82,41 @@ async def test_build_all(mock_conf):
 
     for embedder in all_embedders.values():
         assert isinstance(embedder, Embedder)
+
+
+@pytest.mark.asyncio
+async def test_build_caching_embedder():
+    conf = EmbeddersConf(
+        openai={
+            "openai_embedder_id": OpenAIEmbedderConf(
+                model="text-embedding-ada-002",
+                api_key=SecretStr("<OPENAI_API_KEY>"),
+                cache=EmbedderCacheConf(max_size=100),
+            ),
+        },
+    )
+    builder = EmbedderManager(conf)
+    embedder = await builder.get_embedder("openai_embedder_id")
+
+    assert isinstance(embedder, CachingEmbedder)
+    assert embedder.model_id == "text-embedding-ada-002"
+
+
+@pytest.mark.asyncio
+async def test_build_batching_embedder():
+    conf = EmbeddersConf(
+        openai={
+            "openai_embedder_id": OpenAIEmbedderConf(
+                model="text-embedding-ada-002",
+                api_key=SecretStr("<OPENAI_API_KEY>"),
+                batching=EmbedderBatchingConf(max_wait_seconds=0.01),
+                cache=EmbedderCacheConf(max_size=100),
+            ),
+        },
+    )
+    builder = EmbedderManager(conf)
+    embedder = await builder.get_embedder("openai_embedder_id")
+
+    assert isinstance(embedder, CachingEmbedder)
+    assert isinstance(embedder._embedder, BatchingEmbedder)
+    assert embedder.model_id == "text-embedding-ada-002"
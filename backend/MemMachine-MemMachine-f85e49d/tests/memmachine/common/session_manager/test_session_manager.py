@@ -1,3 +1,5 @@
+import itertools
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -251,6 +253,39 @@ async def test_get_sessions_empty(session_manager: SessionDataManager):
     assert sessions == []
 
 
+@pytest.mark.asyncio
+async def test_get_recent_session_keys(
+    session_manager: SessionDataManager,
+    episodic_memory_conf: EpisodicMemoryConf,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that recent session keys are ordered by last activity."""
+    clock = itertools.count(1)
+    monkeypatch.setattr(time, "time", lambda: float(next(clock)))
+
+    for session_key in ["session1", "session2", "session3"]:
+        await session_manager.create_new_session(
+            session_key,
+            {},
+            episodic_memory_conf,
+            "",
+            {},
+        )
+
+    # Activity in session1 makes it the most recent session.
+    await session_manager.save_short_term_memory("session1", "summary", 1, 1)
+
+    assert await session_manager.get_recent_session_keys(limit=10) == [
+        "session1",
+        "session3",
+        "session2",
+    ]
+    assert await session_manager.get_recent_session_keys(limit=2) == [
+        "session1",
+        "session3",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_save_short_term_memory_new(
     session_manager: SessionDataManager,
@@ -0,0 +1,229 @@
+import numpy as np
+import pytest
+
+from memmachine.common.data_types import SimilarityMetric
+from memmachine.common.vector_graph_store.in_process_vector_index import (
+    InProcessVectorIndex,
+)
+
+
+def _load(index, collection, embedding_name, uids, embeddings):
+    return index.load(
+        collection=collection,
+        embedding_name=embedding_name,
+        uids=uids,
+        embeddings=embeddings,
+        generation=index.generation(collection),
+    )
+
+
+def test_init_invalid_max_bytes():
+    with pytest.raises(ValueError, match="max_bytes must be a positive integer"):
+        InProcessVectorIndex(0)
+
+
+def test_search_not_loaded():
+    index = InProcessVectorIndex(1 << 20)
+    assert not index.contains("Entity", "embedding")
+    assert (
+        index.search(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[1.0, 0.0],
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "similarity_metric",
+    [SimilarityMetric.COSINE, SimilarityMetric.EUCLIDEAN, SimilarityMetric.DOT],
+)
+def test_search_matches_brute_force(similarity_metric):
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(500, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+    uids = [f"uid{i}" for i in range(len(embeddings))]
+
+    index = InProcessVectorIndex(1 << 20)
+    assert _load(index, "Entity", "embedding", uids, embeddings.tolist())
+
+    if similarity_metric == SimilarityMetric.EUCLIDEAN:
+        scores = -np.linalg.norm(embeddings - query, axis=1)
+    else:
+        # Like the exact Neo4j search, other metrics fall back to cosine.
+        scores = (embeddings @ query) / (
+            np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query)
+        )
+    expected = [uids[i] for i in np.argsort(-scores)]
+
+    assert (
+        index.search(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=query.tolist(),
+            similarity_metric=similarity_metric,
+            limit=10,
+        )
+        == expected[:10]
+    )
+    assert (
+        index.search(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=query.tolist(),
+            similarity_metric=similarity_metric,
+        )
+        == expected
+    )
+
+
+def test_search_zero_vector_ranks_last():
+    index = InProcessVectorIndex(1 << 20)
+    _load(index, "Entity", "embedding", ["zero", "a"], [[0.0, 0.0], [1.0, 1.0]])
+
+    assert index.search(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[1.0, 0.0],
+    ) == ["a", "zero"]
+
+
+def test_search_dimension_mismatch():
+    index = InProcessVectorIndex(1 << 20)
+    _load(index, "Entity", "embedding", ["a"], [[1.0, 0.0]])
+
+    assert (
+        index.search(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[1.0, 0.0, 0.0],
+        )
+        is None
+    )
+
+
+def test_add_and_remove():
+    index = InProcessVectorIndex(1 << 20)
+    _load(index, "Entity", "embedding", [], [])
+
+    index.add(
+        collection="Entity",
+        embedding_name="embedding",
+        uids=[f"uid{i}" for i in range(100)],
+        embeddings=[[float(i), 1.0] for i in range(100)],
+    )
+    index.remove(collection="Entity", uids=["uid0", "uid1", "missing"])
+    index.add(
+        collection="Entity",
+        embedding_name="embedding",
+        uids=["uid2"],
+        embeddings=[[-1.0, 1.0]],
+    )
+
+    results = index.search(
+        collection="Entity",
+        embedding_name="embedding",
+        query_embedding=[-1.0, 1.0],
+        similarity_metric=SimilarityMetric.EUCLIDEAN,
+    )
+    assert results is not None
+    assert len(results) == 98
+    assert results[:3] == ["uid2", "uid3", "uid4"]
+    assert "uid0" not in results
+
+
+def test_add_not_loaded_is_ignored():
+    index = InProcessVectorIndex(1 << 20)
+    index.add(
+        collection="Entity",
+        embedding_name="embedding",
+        uids=["a"],
+        embeddings=[[1.0, 0.0]],
+    )
+    assert not index.contains("Entity", "embedding")
+
+
+def test_add_dimension_mismatch_drops_embeddings():
+    index = InProcessVectorIndex(1 << 20)
+    _load(index, "Entity", "embedding", ["a"], [[1.0, 0.0]])
+
+    index.add(
+        collection="Entity",
+        embedding_name="embedding",
+        uids=["b"],
+        embeddings=[[1.0, 0.0, 0.0]],
+    )
+    assert not index.contains("Entity", "embedding")
+    assert index.nbytes == 0
+
+
+def test_load_discarded_after_concurrent_write():
+    index = InProcessVectorIndex(1 << 20)
+    generation = index.generation("Entity")
+
+    index.remove(collection="Entity", uids=["a"])
+
+    assert not index.load(
+        collection="Entity",
+        embedding_name="embedding",
+        uids=["a"],
+        embeddings=[[1.0, 0.0]],
+        generation=generation,
+    )
+    assert not index.contains("Entity", "embedding")
+
+
+def test_load_rejects_inconsistent_dimensions():
+    index = InProcessVectorIndex(1 << 20)
+    assert not _load(
+        index,
+        "Entity",
+        "embedding",
+        ["a", "b"],
+        [[1.0, 0.0], [1.0, 0.0, 0.0]],
+    )
+
+
+def test_lru_eviction():
+    matrix_nbytes = 100 * (8 + 1) * 4
+    index = InProcessVectorIndex(2 * matrix_nbytes)
+    uids = [f"uid{i}" for i in range(100)]
+    embeddings = [[1.0] * 8 for _ in range(100)]
+
+    assert _load(index, "Entity1", "embedding", uids, embeddings)
+    assert _load(index, "Entity2", "embedding", uids, embeddings)
+
+    # Use Entity1 so that Entity2 is the least recently used.
+    index.search(
+        collection="Entity1",
+        embedding_name="embedding",
+        query_embedding=[1.0] * 8,
+    )
+
+    assert _load(index, "Entity3", "embedding", uids, embeddings)
+    assert index.contains("Entity1", "embedding")
+    assert not index.contains("Entity2", "embedding")
+    assert index.contains("Entity3", "embedding")
+    assert index.nbytes <= index.max_bytes
+
+
+def test_load_too_large():
+    index = InProcessVectorIndex(1024)
+    assert not _load(
+        index,
+        "Entity",
+        "embedding",
+        [f"uid{i}" for i in range(100)],
+        [[1.0] * 8 for _ in range(100)],
+    )
+    assert index.nbytes == 0
+
+
+def test_clear():
+    index = InProcessVectorIndex(1 << 20)
+    _load(index, "Entity", "embedding", ["a"], [[1.0, 0.0]])
+
+    index.clear()
+    assert not index.contains("Entity", "embedding")
+    assert index.nbytes == 0
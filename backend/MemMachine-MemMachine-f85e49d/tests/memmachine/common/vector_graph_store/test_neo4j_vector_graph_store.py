@@ -20,7 +20,13 @@ from memmachine.common.filter.filter_parser import (
 from memmachine.common.metrics_factory.prometheus_metrics_factory import (
     PrometheusMetricsFactory,
 )
-from memmachine.common.vector_graph_store.data_types import Edge, EntityType, Node
+from memmachine.common.vector_graph_store.data_types import (
+    Edge,
+    EntityType,
+    Node,
+    NodeProjection,
+    mangle_property_name,
+)
 from memmachine.common.vector_graph_store.neo4j_vector_graph_store import (
     Neo4jVectorGraphStore,
     Neo4jVectorGraphStoreParams,
@@ -89,6 +95,18 @@ def vector_graph_store_ann(neo4j_driver):
     )
 
 
+@pytest.fixture
+def vector_graph_store_in_process(neo4j_driver):
+    # Function-scoped because db_cleanup bypasses the in-process index.
+    return Neo4jVectorGraphStore(
+        Neo4jVectorGraphStoreParams(
+            driver=neo4j_driver,
+            force_exact_similarity_search=True,
+            in_process_similarity_search_max_bytes=64 * 1024 * 1024,
+        ),
+    )
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def db_cleanup(neo4j_driver):
     # Delete all nodes and relationships.
@@ -682,6 +700,147 @@ async def test_search_related_nodes(vector_graph_store):
     assert len(results) == 2
 
 
+@pytest.mark.asyncio
+async def test_batch_search_related_nodes(vector_graph_store):
+    node1_uid = str(uuid4())
+    node2_uid = str(uuid4())
+    node3_uid = str(uuid4())
+    node4_uid = str(uuid4())
+
+    nodes = [
+        Node(
+            uid=node1_uid,
+            properties={"name": "Node1"},
+        ),
+        Node(
+            uid=node2_uid,
+            properties={"name": "Node2", "extra!": "something"},
+        ),
+        Node(
+            uid=node3_uid,
+            properties={"name": "Node3", "marker?": "A"},
+        ),
+        Node(
+            uid=node4_uid,
+            properties={"name": "Node4", "marker?": "B"},
+        ),
+    ]
+
+    edges = [
+        Edge(
+            uid=str(uuid4()),
+            source_uid=node1_uid,
+            target_uid=node2_uid,
+        ),
+        Edge(
+            uid=str(uuid4()),
+            source_uid=node3_uid,
+            target_uid=node2_uid,
+            properties={"extra": 1},
+        ),
+        Edge(
+            uid=str(uuid4()),
+            source_uid=node3_uid,
+            target_uid=node4_uid,
+            properties={"extra": 2},
+        ),
+    ]
+
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+    await vector_graph_store.add_edges(
+        relation="RELATED_TO",
+        source_collection="Entity",
+        target_collection="Entity",
+        edges=edges,
+    )
+
+    this_node_uids = [node3_uid, node1_uid, node4_uid, node2_uid, node3_uid]
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=this_node_uids,
+        find_sources=False,
+    )
+    assert len(results) == len(this_node_uids)
+    assert {node.properties["name"] for node in results[0]} == {"Node2", "Node4"}
+    assert [node.properties["name"] for node in results[1]] == ["Node2"]
+    assert results[2] == []
+    assert results[3] == []
+    assert results[4] == results[0]
+
+    # Results match the unbatched search for every node.
+    for this_node_uid, batch_result in zip(this_node_uids, results, strict=True):
+        result = await vector_graph_store.search_related_nodes(
+            relation="RELATED_TO",
+            other_collection="Entity",
+            this_collection="Entity",
+            this_node_uid=this_node_uid,
+            find_sources=False,
+        )
+        assert set(batch_result) == set(result)
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=[node2_uid, node4_uid],
+        find_targets=False,
+    )
+    assert {node.properties["name"] for node in results[0]} == {"Node1", "Node3"}
+    assert [node.properties["name"] for node in results[1]] == ["Node3"]
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=[node3_uid, node1_uid],
+        find_sources=False,
+        limit=1,
+    )
+    assert len(results[0]) == 1
+    assert len(results[1]) == 1
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=[node3_uid, node1_uid],
+        find_sources=False,
+        edge_property_filter=FilterComparison(
+            field="extra",
+            op="=",
+            value=2,
+        ),
+    )
+    assert [node.properties["name"] for node in results[0]] == ["Node4"]
+    assert results[1] == []
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=[node3_uid, node1_uid],
+        find_sources=False,
+        node_property_filter=FilterComparison(
+            field="extra!",
+            op="=",
+            value="something",
+        ),
+    )
+    assert [node.properties["name"] for node in results[0]] == ["Node2"]
+    assert [node.properties["name"] for node in results[1]] == ["Node2"]
+
+    results = await vector_graph_store.batch_search_related_nodes(
+        relation="RELATED_TO",
+        other_collection="Entity",
+        this_collection="Entity",
+        this_node_uids=[],
+    )
+    assert results == []
+
+
 @pytest.mark.asyncio
 async def test_search_directional_nodes(vector_graph_store):
     time = datetime.now(tz=UTC)
@@ -1054,6 +1213,186 @@ async def test_search_directional_nodes_multiple_by_properties(
     assert results[7].properties["name"] == "Event1"
 
 
+@pytest.mark.asyncio
+async def test_batch_search_directional_nodes(vector_graph_store):
+    time = datetime.now(tz=UTC)
+    delta = timedelta(days=1)
+
+    nodes = [
+        Node(
+            uid=f"event{index}",
+            properties={
+                "name": f"Event{index}",
+                "timestamp": time + (index // 2) * delta,
+                "sequence": index % 2,
+            }
+            | ({"include?": "yes"} if index % 3 == 0 else {}),
+        )
+        for index in range(8)
+    ]
+
+    await vector_graph_store.add_nodes(collection="Event", nodes=nodes)
+
+    starting_ats = [
+        (time + delta, 0),
+        (time, 1),
+        (time + 3 * delta, 1),
+        (None, None),
+        (time + delta, None),
+    ]
+
+    for order_ascending in ([True, True], [False, False], [True, False]):
+        for include_equal_start in (True, False):
+            for limit in (1, 3, None):
+                for property_filter in (
+                    None,
+                    FilterComparison(field="include?", op="=", value="yes"),
+                ):
+                    results = await vector_graph_store.batch_search_directional_nodes(
+                        collection="Event",
+                        by_properties=["timestamp", "sequence"],
+                        starting_ats=starting_ats,
+                        order_ascending=order_ascending,
+                        include_equal_start=include_equal_start,
+                        limit=limit,
+                        property_filter=property_filter,
+                    )
+                    assert len(results) == len(starting_ats)
+
+                    # Results match the unbatched search for every anchor.
+                    for starting_at, batch_result in zip(
+                        starting_ats, results, strict=True
+                    ):
+                        result = await vector_graph_store.search_directional_nodes(
+                            collection="Event",
+                            by_properties=["timestamp", "sequence"],
+                            starting_at=starting_at,
+                            order_ascending=order_ascending,
+                            include_equal_start=include_equal_start,
+                            limit=limit,
+                            property_filter=property_filter,
+                        )
+                        assert [node.uid for node in batch_result] == [
+                            node.uid for node in result
+                        ]
+
+    results = await vector_graph_store.batch_search_directional_nodes(
+        collection="Event",
+        by_properties=["timestamp", "sequence"],
+        starting_ats=[(time + delta, 0), (time + 3 * delta, 1)],
+        order_ascending=[True, True],
+        limit=2,
+    )
+    assert [node.properties["name"] for node in results[0]] == ["Event3", "Event4"]
+    assert results[1] == []
+
+    results = await vector_graph_store.batch_search_directional_nodes(
+        collection="Event",
+        by_properties=["timestamp", "sequence"],
+        starting_ats=[],
+        order_ascending=[True, True],
+    )
+    assert results == []
+
+    with pytest.raises(ValueError, match="must be equal"):
+        await vector_graph_store.batch_search_directional_nodes(
+            collection="Event",
+            by_properties=["timestamp", "sequence"],
+            starting_ats=[(time,)],
+            order_ascending=[True, True],
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_search_directional_nodes_seeks_range_index(
+    neo4j_driver,
+    vector_graph_store,
+):
+    time = datetime.now(tz=UTC)
+    delta = timedelta(minutes=1)
+
+    await vector_graph_store.add_nodes(
+        collection="Event",
+        nodes=[
+            Node(
+                uid=f"event{index}",
+                properties={
+                    "timestamp": time + (index // 2) * delta,
+                    "sequence": index % 2,
+                },
+            )
+            for index in range(1000)
+        ],
+    )
+
+    sanitized_collection = Neo4jVectorGraphStore._sanitize_name("Event")
+    sanitized_by_properties = [
+        Neo4jVectorGraphStore._sanitize_name(mangle_property_name(by_property))
+        for by_property in ["timestamp", "sequence"]
+    ]
+    await vector_graph_store._create_range_index_if_not_exists(
+        EntityType.NODE,
+        sanitized_collection,
+        sanitized_by_properties[0],
+    )
+
+    query_filter_string, query_filter_params = (
+        Neo4jVectorGraphStore._build_query_filter("n", "query_filter_params", None)
+    )
+    node_projection_string, node_projection_params = (
+        Neo4jVectorGraphStore._build_node_projection(
+            "n",
+            "node_projection_params",
+            None,
+        )
+    )
+    starting_ats = [[time + 100 * delta, 0], [time + 400 * delta, 1]]
+
+    # Anchors without None starting values are compared directly,
+    # so the planner can seek the range index instead of scanning.
+    _, summary, _ = await neo4j_driver.execute_query(
+        "PROFILE "
+        + Neo4jVectorGraphStore._batch_search_directional_nodes_query(
+            sanitized_collection,
+            sanitized_by_properties,
+            starting_ats[0],
+            [True, True],
+            include_equal_start=False,
+            has_limit=True,
+            query_filter_string=query_filter_string,
+            node_projection_string=node_projection_string,
+        ),
+        starting_ats=starting_ats,
+        limit=1,
+        query_filter_params=query_filter_params,
+        node_projection_params=node_projection_params,
+    )
+
+    def operator_types(plan: dict) -> list[str]:
+        return [plan["operatorType"]] + [
+            operator_type
+            for child in plan.get("children", [])
+            for operator_type in operator_types(child)
+        ]
+
+    plan_operator_types = operator_types(summary.profile)
+    assert any(
+        operator_type.startswith("NodeIndexSeek")
+        for operator_type in plan_operator_types
+    ), plan_operator_types
+
+    results = await vector_graph_store.batch_search_directional_nodes(
+        collection="Event",
+        by_properties=["timestamp", "sequence"],
+        starting_ats=starting_ats,
+        order_ascending=[True, True],
+    )
+    assert [[node.uid for node in result] for result in results] == [
+        ["event201"],
+        ["event802"],
+    ]
+
+
 @pytest.mark.asyncio
 async def test_search_matching_nodes(vector_graph_store):
     person_nodes = [
@@ -1270,6 +1609,66 @@ async def test_get_nodes(vector_graph_store):
     assert fetched_nodes[0] == nodes[0]
 
 
+@pytest.mark.asyncio
+async def test_get_nodes_with_projection(vector_graph_store):
+    node = Node(
+        uid=str(uuid4()),
+        properties={"name": "Node1", "time": datetime.now(tz=UTC), "count": 3},
+        embeddings={
+            "embedding_name": (
+                [0.1, 0.2, 0.3],
+                SimilarityMetric.COSINE,
+            ),
+        },
+    )
+
+    await vector_graph_store.add_nodes(collection="Entity", nodes=[node])
+
+    fetched_nodes = await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=[node.uid],
+        projection=NodeProjection(),
+    )
+    assert fetched_nodes == [node]
+
+    fetched_nodes = await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=[node.uid],
+        projection=NodeProjection(include_embeddings=False),
+    )
+    assert fetched_nodes == [Node(uid=node.uid, properties=node.properties)]
+
+    fetched_nodes = await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=[node.uid],
+        projection=NodeProjection(property_names=("name",)),
+    )
+    assert fetched_nodes == [
+        Node(
+            uid=node.uid,
+            properties={"name": "Node1"},
+            embeddings=node.embeddings,
+        ),
+    ]
+
+    fetched_nodes = await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=[node.uid],
+        projection=NodeProjection(
+            property_names=("name", "missing"),
+            include_embeddings=False,
+        ),
+    )
+    assert fetched_nodes == [Node(uid=node.uid, properties={"name": "Node1"})]
+
+    fetched_nodes = await vector_graph_store.get_nodes(
+        collection="Entity",
+        node_uids=[node.uid],
+        projection=NodeProjection(property_names=(), include_embeddings=False),
+    )
+    assert fetched_nodes == [Node(uid=node.uid)]
+
+
 @pytest.mark.asyncio
 async def test_delete_nodes(neo4j_driver, vector_graph_store):
     nodes = [
@@ -1674,3 +2073,144 @@ async def test__nodes_from_neo4j_nodes(neo4j_driver, vector_graph_store):
     assert len(fetched_nodes) == 3
 
     assert all(fetched_node in nodes for fetched_node in fetched_nodes)
+
+
+@pytest.mark.asyncio
+async def test_search_similar_nodes_with_projection(
+    vector_graph_store,
+    vector_graph_store_ann,
+):
+    nodes = [
+        Node(
+            uid=str(uuid4()),
+            properties={"name": f"Node{i}", "index": i},
+            embeddings={
+                "embedding": (
+                    [float(i), 1.0],
+                    SimilarityMetric.EUCLIDEAN,
+                ),
+            },
+        )
+        for i in range(5)
+    ]
+
+    await vector_graph_store.add_nodes(collection="Entity", nodes=nodes)
+
+    for store in (vector_graph_store, vector_graph_store_ann):
+        results = await store.search_similar_nodes(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[0.0, 1.0],
+            similarity_metric=SimilarityMetric.EUCLIDEAN,
+            limit=3,
+            projection=NodeProjection(property_names=(), include_embeddings=False),
+        )
+        assert [result.uid for result in results] == [node.uid for node in nodes[:3]]
+        assert all(result.properties == {} for result in results)
+        assert all(result.embeddings == {} for result in results)
+
+        results = await store.search_similar_nodes(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[0.0, 1.0],
+            similarity_metric=SimilarityMetric.EUCLIDEAN,
+            limit=3,
+            property_filter=FilterComparison(field="index", op=">=", value=1),
+            projection=NodeProjection(include_embeddings=False),
+        )
+        assert results == [
+            Node(uid=node.uid, properties=node.properties) for node in nodes[1:4]
+        ]
+
+
+def test__build_node_projection():
+    assert Neo4jVectorGraphStore._build_node_projection(
+        "n",
+        "node_projection_params",
+        None,
+    ) == ("n", {})
+    assert Neo4jVectorGraphStore._build_node_projection(
+        "n",
+        "node_projection_params",
+        NodeProjection(),
+    ) == ("n", {})
+
+    expression, query_values = Neo4jVectorGraphStore._build_node_projection(
+        "n",
+        "node_projection_params",
+        NodeProjection(property_names=("name",), include_embeddings=False),
+    )
+    assert expression.startswith("{uid: n.uid, entries: [key IN keys(n) WHERE ")
+    assert "$node_projection_params.property_keys" in expression
+    assert "$node_projection_params.property_prefix" not in expression
+    assert len(query_values["property_keys"]) == 1
+
+    expression, query_values = Neo4jVectorGraphStore._build_node_projection(
+        "n",
+        "node_projection_params",
+        NodeProjection(include_embeddings=False),
+    )
+    assert "$node_projection_params.property_prefix" in expression
+    assert query_values["property_keys"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_similar_nodes_in_process(
+    vector_graph_store,
+    vector_graph_store_in_process,
+):
+    nodes = [
+        Node(
+            uid=str(uuid4()),
+            properties={"name": f"Node{i}", "index": i},
+            embeddings={
+                "embedding": (
+                    [float(i), 1.0],
+                    SimilarityMetric.EUCLIDEAN,
+                ),
+            },
+        )
+        for i in range(10)
+    ]
+
+    await vector_graph_store_in_process.add_nodes(
+        collection="Entity",
+        nodes=nodes[:5],
+    )
+
+    async def search(store, property_filter=None, limit=3):
+        return await store.search_similar_nodes(
+            collection="Entity",
+            embedding_name="embedding",
+            query_embedding=[0.0, 1.0],
+            similarity_metric=SimilarityMetric.EUCLIDEAN,
+            limit=limit,
+            property_filter=property_filter,
+        )
+
+    results = await search(vector_graph_store_in_process)
+    assert results == nodes[:3]
+    assert results == await search(vector_graph_store)
+
+    # Writes through the store keep the in-process embeddings in sync.
+    await vector_graph_store_in_process.add_nodes(
+        collection="Entity",
+        nodes=nodes[5:],
+    )
+    await vector_graph_store_in_process.delete_nodes(
+        collection="Entity",
+        node_uids=[nodes[0].uid, nodes[2].uid],
+    )
+
+    results = await search(vector_graph_store_in_process)
+    assert results == [nodes[1], nodes[3], nodes[4]]
+    assert results == await search(vector_graph_store)
+
+    property_filter = FilterComparison(field="index", op=">=", value=6)
+    results = await search(vector_graph_store_in_process, property_filter)
+    assert results == nodes[6:9]
+    assert results == await search(vector_graph_store, property_filter)
+
+    results = await search(vector_graph_store_in_process, limit=None)
+    assert len(results) == 8
+    assert results == await search(vector_graph_store, limit=None)
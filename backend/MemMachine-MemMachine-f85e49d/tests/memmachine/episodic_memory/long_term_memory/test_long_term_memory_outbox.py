@@ -0,0 +1,261 @@
+"""Tests for the write-behind long-term memory outbox."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+from memmachine.common.episode_store import EpisodeEntry
+from memmachine.common.episode_store.episode_sqlalchemy_store import (
+    SqlAlchemyEpisodeStore,
+)
+from memmachine.episodic_memory.long_term_memory import (
+    LongTermMemoryOutbox,
+    LongTermMemoryOutboxWorker,
+)
+
+
+@pytest_asyncio.fixture
+async def episode_storage(sqlalchemy_sqlite_engine):
+    storage = SqlAlchemyEpisodeStore(sqlalchemy_sqlite_engine)
+    await storage.startup()
+    return storage
+
+
+@pytest_asyncio.fixture
+async def outbox(sqlalchemy_sqlite_engine):
+    outbox = LongTermMemoryOutbox(sqlalchemy_sqlite_engine)
+    await outbox.startup()
+    return outbox
+
+
+async def _add_episodes(episode_storage, session_key, contents):
+    return await episode_storage.add_episodes(
+        session_key,
+        [
+            EpisodeEntry(content=content, producer_id="user", producer_role="user")
+            for content in contents
+        ],
+    )
+
+
+def _create_worker(outbox, episode_storage, add_episodes, **kwargs):
+    return LongTermMemoryOutboxWorker(
+        LongTermMemoryOutboxWorker.Params(
+            outbox=outbox,
+            episode_storage=episode_storage,
+            add_episodes=add_episodes,
+            **kwargs,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_claim_leases_entries(outbox):
+    await outbox.add("session_a", ["1", "2", "3"])
+
+    claimed = await outbox.claim(2, lease_sec=60, max_attempts=3)
+    assert [entry.episode_id for entry in claimed] == ["1", "2"]
+    assert all(entry.session_key == "session_a" for entry in claimed)
+
+    # Leased entries are not claimed again until the lease expires
+    claimed = await outbox.claim(10, lease_sec=60, max_attempts=3)
+    assert [entry.episode_id for entry in claimed] == ["3"]
+    assert await outbox.claim(10, lease_sec=60, max_attempts=3) == []
+
+    # Claimed entries stay pending until completed
+    assert sorted(await outbox.pending_episode_ids("session_a")) == ["1", "2", "3"]
+
+    await outbox.complete([entry.id for entry in claimed])
+    assert sorted(await outbox.pending_episode_ids("session_a")) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_retry_until_attempts_are_exhausted(outbox):
+    await outbox.add("session_a", ["1"])
+
+    for _ in range(2):
+        (entry,) = await outbox.claim(10, lease_sec=60, max_attempts=2)
+        await outbox.retry([entry.id], error="failed", backoff_sec=0.000001)
+        await asyncio.sleep(0.01)
+
+    # The entry is kept as a dead letter, no longer claimed nor pending
+    assert await outbox.claim(10, lease_sec=60, max_attempts=2) == []
+    assert await outbox.pending_episode_ids("session_a", max_attempts=2) == []
+    assert await outbox.pending_episode_ids("session_a") == ["1"]
+
+    (entry,) = await outbox.claim(10, lease_sec=60, max_attempts=3)
+    assert entry.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_backs_off(outbox):
+    await outbox.add("session_a", ["1"])
+
+    (entry,) = await outbox.claim(10, lease_sec=60, max_attempts=3)
+    await outbox.retry([entry.id], error="failed", backoff_sec=60)
+
+    assert await outbox.claim(10, lease_sec=60, max_attempts=3) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_entries(outbox):
+    await outbox.add("session_a", ["1", "2"])
+    await outbox.add("session_b", ["3"])
+
+    assert await outbox.pending_episode_ids("session_a", limit=1) == ["2"]
+
+    await outbox.delete_episodes(["2"])
+    assert await outbox.pending_episode_ids("session_a") == ["1"]
+
+    await outbox.delete_session("session_a")
+    assert await outbox.pending_episode_ids("session_a") == []
+    assert await outbox.pending_episode_ids("session_b") == ["3"]
+
+
+@pytest.mark.asyncio
+async def test_delete_dead_letters(outbox):
+    await outbox.add("session_a", ["1", "2"])
+
+    (entry, _) = await outbox.claim(10, lease_sec=60, max_attempts=1)
+    await outbox.retry([entry.id], error="failed", backoff_sec=0.000001)
+    assert await outbox.count_dead_letters(max_attempts=1) == 1
+
+    assert (
+        await outbox.delete_dead_letters(
+            max_attempts=1,
+            older_than=datetime.now(UTC) - timedelta(days=1),
+        )
+        == 0
+    )
+    assert (
+        await outbox.delete_dead_letters(
+            max_attempts=1,
+            older_than=datetime.now(UTC) + timedelta(seconds=1),
+        )
+        == 1
+    )
+
+    # Entries with attempts left are kept
+    assert await outbox.count_dead_letters(max_attempts=1) == 0
+    assert await outbox.pending_episode_ids("session_a") == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_worker_purges_expired_dead_letters(outbox, episode_storage):
+    await outbox.add("session_a", ["1"])
+    (entry,) = await outbox.claim(10, lease_sec=60, max_attempts=1)
+    await outbox.retry([entry.id], error="failed", backoff_sec=0.000001)
+
+    worker = _create_worker(
+        outbox,
+        episode_storage,
+        AsyncMock(),
+        max_attempts=1,
+        dead_letter_retention_sec=3600,
+    )
+    assert await worker.purge_dead_letters() == 0
+    assert await outbox.count_dead_letters(max_attempts=1) == 1
+
+    worker = _create_worker(
+        outbox,
+        episode_storage,
+        AsyncMock(),
+        max_attempts=1,
+        dead_letter_retention_sec=0.000001,
+    )
+    await asyncio.sleep(0.01)
+    assert await worker.purge_dead_letters() == 1
+    assert await outbox.count_dead_letters(max_attempts=1) == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_drains_outbox_by_session(outbox, episode_storage):
+    episodes_a = await _add_episodes(episode_storage, "session_a", ["a1", "a2"])
+    episodes_b = await _add_episodes(episode_storage, "session_b", ["b1"])
+    await outbox.add("session_a", [episode.uid for episode in episodes_a])
+    await outbox.add("session_b", [episode.uid for episode in episodes_b])
+
+    add_episodes = AsyncMock()
+    worker = _create_worker(outbox, episode_storage, add_episodes)
+    assert await worker._process_batch()
+    assert not await worker._process_batch()
+
+    added = {
+        call.args[0]: [episode.content for episode in call.args[1]]
+        for call in add_episodes.await_args_list
+    }
+    assert added == {"session_a": ["a1", "a2"], "session_b": ["b1"]}
+    assert await outbox.pending_episode_ids("session_a") == []
+    assert await outbox.pending_episode_ids("session_b") == []
+
+
+@pytest.mark.asyncio
+async def test_worker_skips_deleted_episodes(outbox, episode_storage):
+    episodes = await _add_episodes(episode_storage, "session_a", ["kept", "deleted"])
+    await outbox.add("session_a", [episode.uid for episode in episodes])
+    await episode_storage.delete_episodes([episodes[1].uid])
+
+    add_episodes = AsyncMock()
+    worker = _create_worker(outbox, episode_storage, add_episodes)
+    await worker._process_batch()
+
+    add_episodes.assert_awaited_once()
+    session_key, added = add_episodes.await_args.args
+    assert session_key == "session_a"
+    assert [episode.content for episode in added] == ["kept"]
+    assert await outbox.pending_episode_ids("session_a") == []
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_failed_sessions(outbox, episode_storage):
+    episodes_a = await _add_episodes(episode_storage, "session_a", ["a1"])
+    episodes_b = await _add_episodes(episode_storage, "session_b", ["b1"])
+    await outbox.add("session_a", [episode.uid for episode in episodes_a])
+    await outbox.add("session_b", [episode.uid for episode in episodes_b])
+
+    async def add_episodes(session_key, episodes):
+        if session_key == "session_a":
+            raise RuntimeError("long-term memory unavailable")
+
+    worker = _create_worker(
+        outbox,
+        episode_storage,
+        add_episodes,
+        retry_backoff_sec=60,
+    )
+    await worker._process_batch()
+
+    # A failing session does not hold back the others
+    assert await outbox.pending_episode_ids("session_a") == [episodes_a[0].uid]
+    assert await outbox.pending_episode_ids("session_b") == []
+    assert not await worker._process_batch()
+
+
+@pytest.mark.asyncio
+async def test_worker_processes_notified_entries(outbox, episode_storage):
+    added = asyncio.Event()
+
+    async def add_episodes(session_key, episodes):
+        added.set()
+
+    worker = _create_worker(
+        outbox,
+        episode_storage,
+        add_episodes,
+        num_workers=2,
+        poll_interval_sec=60,
+    )
+    await worker.start()
+    try:
+        episodes = await _add_episodes(episode_storage, "session_a", ["a1"])
+        await outbox.add("session_a", [episode.uid for episode in episodes])
+        worker.notify()
+
+        await asyncio.wait_for(added.wait(), timeout=5)
+    finally:
+        await worker.stop()
+
+    assert await outbox.pending_episode_ids("session_a") == []
@@ -100,6 +100,9 @@ class MockShortTermMemoryDataManager(SessionDataManager):
     async def get_sessions(self, filters: dict[str, object] | None = None) -> list[str]:
         return []
 
+    async def get_recent_session_keys(self, limit: int) -> list[str]:
+        return []
+
 
 T = TypeVar("T")
 
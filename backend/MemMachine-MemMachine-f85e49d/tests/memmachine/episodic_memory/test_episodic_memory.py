@@ -137,6 +137,26 @@ async def test_add_memory_episode_when_disabled(
     mock_long_term_memory.add_episodes.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_add_memory_episode_without_long_term_memory(
+    episodic_memory,
+    mock_short_term_memory,
+    mock_long_term_memory,
+):
+    """Test deferring long-term memory when adding a memory episode."""
+    episode = create_test_episode()
+    await episodic_memory.add_memory_episodes(
+        [episode],
+        add_to_long_term_memory=False,
+    )
+    mock_short_term_memory.add_episodes.assert_awaited_once_with([episode])
+    mock_long_term_memory.add_episodes.assert_not_awaited()
+
+    await episodic_memory.add_long_term_memory_episodes([episode])
+    mock_short_term_memory.add_episodes.assert_awaited_once_with([episode])
+    mock_long_term_memory.add_episodes.assert_awaited_once_with([episode])
+
+
 @pytest.mark.asyncio
 async def test_add_memory_episode_when_closed(episodic_memory):
     """Test that adding an episode to a closed memory raises RuntimeError."""
@@ -221,6 +241,54 @@ async def test_query_memory_all_enabled(
     mock_long_term_memory.search.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_query_memory_with_unindexed_episodes(
+    episodic_memory,
+    mock_short_term_memory,
+    mock_long_term_memory,
+):
+    """Test that episodes not in long-term memory yet fill the left slots."""
+    short = create_test_episode(content="short")
+    older = create_test_episode(
+        content="older", created_at=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    newer = create_test_episode(
+        content="newer", created_at=datetime(2024, 1, 2, tzinfo=UTC)
+    )
+    indexed = create_test_episode(content="indexed")
+
+    mock_short_term_memory.get_short_term_memory_context.return_value = (
+        [short],
+        "summary",
+    )
+    mock_long_term_memory.search.return_value = [indexed]
+
+    response = await episodic_memory.query_memory(
+        "test query",
+        limit=3,
+        unindexed_episodes=[older, short, newer],
+    )
+
+    assert response is not None
+    assert [episode.uid for episode in response.long_term_memory.episodes] == [
+        indexed.uid,
+        newer.uid,
+        older.uid,
+    ]
+
+    # Ranked long-term memory results are not displaced
+    response = await episodic_memory.query_memory(
+        "test query",
+        limit=1,
+        unindexed_episodes=[older, newer],
+    )
+
+    assert response is not None
+    assert [episode.uid for episode in response.long_term_memory.episodes] == [
+        indexed.uid,
+    ]
+
+
 @pytest.mark.asyncio
 async def test_query_memory_short_term_only(
     episodic_memory_params,
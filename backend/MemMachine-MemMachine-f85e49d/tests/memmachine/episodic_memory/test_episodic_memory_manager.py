@@ -1,5 +1,9 @@
 """Tests for the EpisodicMemoryManager class."""
 
+import asyncio
+import logging
+import statistics
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +14,7 @@ from memmachine.common.configuration.episodic_config import EpisodicMemoryConf
 from memmachine.common.language_model import LanguageModel
 from memmachine.common.metrics_factory import MetricsFactory
 from memmachine.common.resource_manager import CommonResourceManager
+from memmachine.common.session_manager.session_data_manager import SessionDataManager
 from memmachine.common.session_manager.session_data_manager_sql_impl import (
     SessionDataManagerSQL,
 )
@@ -499,3 +504,130 @@ async def test_manager_methods_after_close_raise_error(manager: EpisodicMemoryMa
 
     with pytest.raises(RuntimeError, match="Memory is closed"):
         await manager.close_session("s")
+
+
+@pytest.mark.asyncio
+@patch("memmachine.episodic_memory.episodic_memory_manager.EpisodicMemory")
+async def test_warm_up_loads_recent_sessions(
+    mock_episodic_memory_cls,
+    mock_episodic_memory_manager_param,
+    mock_metrics_factory,
+    mock_episodic_memory_conf,
+    mock_episodic_memory_instance,
+):
+    """Test that warm-up caches the most recent sessions and reports metrics."""
+    mock_episodic_memory_cls.return_value = mock_episodic_memory_instance
+    manager = EpisodicMemoryManager(
+        mock_episodic_memory_manager_param.model_copy(
+            update={"instance_cache_size": 2, "metrics_factory": mock_metrics_factory},
+        ),
+    )
+    for session_key in ["s1", "s2", "s3"]:
+        async with manager.create_episodic_memory(
+            session_key,
+            mock_episodic_memory_conf,
+            "",
+            {},
+        ):
+            pass
+        await manager.close_session(session_key)
+
+    session_data_manager = manager._session_data_manager
+    session_data_manager.get_recent_session_keys = AsyncMock(
+        return_value=["s3", "s2"],
+    )
+
+    num_loaded = await manager.warm_up(max_sessions=5, max_concurrency=2)
+
+    assert num_loaded == 2
+    # Warm-up never loads more sessions than the cache can hold.
+    session_data_manager.get_recent_session_keys.assert_awaited_once_with(2)
+    assert sorted(manager._instance_cache.keys()) == ["s2", "s3"]
+    assert manager._instance_cache.get_ref_count("s2") == 0
+    assert manager._instance_cache.get_ref_count("s3") == 0
+    mock_metrics_factory.summaries.observe.assert_called_once()
+    mock_metrics_factory.counters.increment.assert_called_once_with(value=2)
+
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_skips_sessions_that_fail_to_load(
+    manager: EpisodicMemoryManager,
+):
+    """Test that warm-up skips sessions whose info cannot be loaded."""
+    session_data_manager = manager._session_data_manager
+    session_data_manager.get_recent_session_keys = AsyncMock(
+        return_value=["missing"],
+    )
+
+    assert await manager.warm_up(max_sessions=5, max_concurrency=2) == 0
+    assert manager._instance_cache.keys() == []
+
+
+@pytest.mark.asyncio
+@patch(
+    "memmachine.episodic_memory.episodic_memory_manager.episodic_memory_params_from_config",
+    new_callable=AsyncMock,
+)
+@patch("memmachine.episodic_memory.episodic_memory_manager.EpisodicMemory")
+async def test_open_concurrent_distinct_sessions_benchmark(
+    mock_episodic_memory_cls,
+    mock_params_from_config,
+    mock_resource_manager,
+    mock_episodic_memory_conf,
+    mock_episodic_memory_instance,
+):
+    """Benchmark opening 1k distinct sessions concurrently with slow session reads."""
+    num_sessions = 1000
+    read_latency = 0.01
+
+    async def slow_get_session_info(session_key):
+        await asyncio.sleep(read_latency)
+        return SessionDataManager.SessionInfo(
+            configuration={},
+            description="",
+            user_metadata={},
+            episode_memory_conf=mock_episodic_memory_conf,
+        )
+
+    session_data_manager = MagicMock(spec=SessionDataManager)
+    session_data_manager.get_session_info = AsyncMock(
+        side_effect=slow_get_session_info,
+    )
+    session_data_manager.close = AsyncMock()
+    mock_episodic_memory_cls.return_value = mock_episodic_memory_instance
+
+    manager = EpisodicMemoryManager(
+        EpisodicMemoryManagerParams(
+            instance_cache_size=num_sessions,
+            resource_manager=mock_resource_manager,
+            session_data_manager=session_data_manager,
+        ),
+    )
+
+    async def open_session(session_key: str) -> float:
+        start = time.perf_counter()
+        async with manager.open_episodic_memory(session_key):
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *[open_session(f"session_{i}") for i in range(num_sessions)],
+    )
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    logging.getLogger(__name__).info(
+        "opened %d sessions in %.3fs (p50=%.1fms, p99=%.1fms)",
+        num_sessions,
+        elapsed,
+        quantiles[49] * 1000,
+        quantiles[98] * 1000,
+    )
+
+    # Serialized loads would take num_sessions * read_latency (10s).
+    assert elapsed < num_sessions * read_latency / 10
+    assert session_data_manager.get_session_info.await_count == num_sessions
+
+    await manager.close()
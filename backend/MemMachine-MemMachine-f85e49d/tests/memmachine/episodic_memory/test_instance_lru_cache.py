@@ -254,3 +254,93 @@ async def test_clean_old_instance(mock_episodic_memory):
     # Should remove key1 now
     await cache.clean_old_instance()
     assert sorted(cache.keys()) == ["key2"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_shares_one_load_per_key(mock_episodic_memory):
+    """Test that concurrent misses on the same key run the loader once."""
+    cache = MemoryInstanceCache(capacity=4, max_lifetime=60)
+    mem1 = mock_episodic_memory("mem1")
+    loader_calls = 0
+
+    async def loader():
+        nonlocal loader_calls
+        loader_calls += 1
+        await asyncio.sleep(0.01)
+        return mem1
+
+    results = await asyncio.gather(
+        *[cache.get_or_load("key1", loader) for _ in range(5)],
+    )
+
+    assert results == [mem1] * 5
+    assert loader_calls == 1
+    assert cache.get_ref_count("key1") == 5
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_loads_distinct_keys_concurrently(mock_episodic_memory):
+    """Test that loads for different keys do not wait for each other."""
+    cache = MemoryInstanceCache(capacity=4, max_lifetime=60)
+    in_flight = 0
+    max_in_flight = 0
+
+    def make_loader(name: str):
+        async def loader():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_episodic_memory(name)
+
+        return loader
+
+    await asyncio.gather(
+        *[cache.get_or_load(f"key{i}", make_loader(f"mem{i}")) for i in range(3)],
+    )
+
+    assert max_in_flight == 3
+    assert sorted(cache.keys()) == ["key0", "key1", "key2"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_propagates_failure_to_waiters():
+    """Test that a failed load is reported to every waiting caller."""
+    cache = MemoryInstanceCache(capacity=4, max_lifetime=60)
+    loader_calls = 0
+
+    async def loader():
+        nonlocal loader_calls
+        loader_calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("load failed")
+
+    results = await asyncio.gather(
+        *[cache.get_or_load("key1", loader) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert loader_calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.keys() == []
+
+
+@pytest.mark.asyncio
+async def test_exclusive_holds_off_loads(mock_episodic_memory):
+    """Test that loads of a key wait until its exclusive section ends."""
+    cache = MemoryInstanceCache(capacity=4, max_lifetime=60)
+    mem1 = mock_episodic_memory("mem1")
+    events = []
+
+    async def loader():
+        events.append("load")
+        return mem1
+
+    async with cache.exclusive("key1"):
+        load_task = asyncio.create_task(cache.get_or_load("key1", loader))
+        await asyncio.sleep(0.01)
+        events.append("exclusive done")
+
+    assert await load_task is mem1
+    assert events == ["exclusive done", "load"]
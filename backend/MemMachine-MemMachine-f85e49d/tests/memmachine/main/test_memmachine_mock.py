@@ -11,12 +11,15 @@ import pytest
 from memmachine.common.configuration import (
     Configuration,
     EpisodicMemoryConfPartial,
+    LongTermMemoryIngestionConf,
+    SessionManagerConf,
 )
 from memmachine.common.configuration.episodic_config import (
     LongTermMemoryConfPartial,
     ShortTermMemoryConfPartial,
 )
-from memmachine.common.episode_store import Episode, EpisodeEntry
+from memmachine.common.episode_store import Episode, EpisodeCursor, EpisodeEntry
+from memmachine.common.errors import InvalidArgumentError
 from memmachine.common.filter.filter_parser import And as FilterAnd
 from memmachine.common.filter.filter_parser import Comparison as FilterComparison
 from memmachine.episodic_memory import EpisodicMemory
@@ -66,6 +69,7 @@ def minimal_conf() -> Configuration:
             reranker="default-reranker",
         ),
     )
+    ret.long_term_memory_ingestion = LongTermMemoryIngestionConf()
     ret.default_long_term_memory_embedder = "default-embedder"
     ret.default_long_term_memory_reranker = "default-reranker"
     return ret
@@ -302,6 +306,84 @@ async def test_add_episodes_dispatches_to_all_memories(
     )
 
 
+@pytest.mark.asyncio
+async def test_add_episodes_defers_long_term_memory_with_write_behind(
+    minimal_conf, patched_resource_manager
+):
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+    memmachine._long_term_memory_outbox_worker = MagicMock()
+    session = DummySessionData("write-behind")
+
+    entries = [
+        EpisodeEntry(content="hello", producer_id="user", producer_role="assistant"),
+    ]
+    stored_episodes = [_make_episode("e1", session.session_key)]
+
+    episode_storage = MagicMock()
+    episode_storage.add_episodes = AsyncMock(return_value=stored_episodes)
+    patched_resource_manager.get_episode_storage = AsyncMock(
+        return_value=episode_storage
+    )
+
+    outbox = MagicMock()
+    outbox.add = AsyncMock()
+    patched_resource_manager.get_long_term_memory_outbox = AsyncMock(
+        return_value=outbox
+    )
+
+    episodic_session = AsyncMock()
+    episodic_manager = MagicMock()
+    episodic_manager.open_or_create_episodic_memory.return_value = _async_cm(
+        episodic_session
+    )
+    patched_resource_manager.get_episodic_memory_manager = AsyncMock(
+        return_value=episodic_manager
+    )
+
+    await memmachine.add_episodes(
+        session,
+        entries,
+        target_memories=[MemoryType.Episodic],
+    )
+
+    episodic_session.add_memory_episodes.assert_awaited_once_with(
+        stored_episodes,
+        add_to_long_term_memory=False,
+    )
+    outbox.add.assert_awaited_once_with(session.session_key, ["e1"])
+    memmachine._long_term_memory_outbox_worker.notify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_unindexed_episodes_are_bounded(minimal_conf, patched_resource_manager):
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+    memmachine._long_term_memory_outbox_worker = MagicMock()
+    session = DummySessionData("write-behind")
+
+    outbox = MagicMock()
+    outbox.pending_episode_ids = AsyncMock(return_value=["1"])
+    patched_resource_manager.get_long_term_memory_outbox = AsyncMock(
+        return_value=outbox
+    )
+    episodes = [_make_episode("1", session.session_key)]
+    episode_storage = MagicMock()
+    episode_storage.get_episode_messages = AsyncMock(return_value=episodes)
+    patched_resource_manager.get_episode_storage = AsyncMock(
+        return_value=episode_storage
+    )
+
+    assert await memmachine._get_unindexed_episodes(session.session_key, None, 5) == (
+        episodes
+    )
+
+    # Dead letters are left out, and no more episodes than the search limit
+    outbox.pending_episode_ids.assert_awaited_once_with(
+        session.session_key,
+        max_attempts=minimal_conf.long_term_memory_ingestion.max_attempts,
+        limit=5,
+    )
+
+
 @pytest.mark.asyncio
 async def test_add_episodes_skips_memories_not_requested(
     minimal_conf, patched_resource_manager
@@ -367,6 +449,54 @@ async def test_list_search_fetches_episode_history(
     assert result.semantic_memory is None
 
 
+@pytest.mark.asyncio
+async def test_list_search_returns_next_episodic_cursor(
+    minimal_conf, patched_resource_manager
+):
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+    session = DummySessionData("session-list")
+
+    episode_storage = MagicMock()
+    episodes = [
+        _make_episode("e1", session.session_key),
+        _make_episode("e2", session.session_key),
+    ]
+    episode_storage.get_episode_messages = AsyncMock(return_value=episodes)
+    patched_resource_manager.get_episode_storage = AsyncMock(
+        return_value=episode_storage
+    )
+
+    with pytest.raises(InvalidArgumentError):
+        await memmachine.list_search(
+            session,
+            target_memories=[MemoryType.Episodic],
+            page_size=2,
+            page_num=3,
+            cursor="cursor",
+        )
+    episode_storage.get_episode_messages.assert_not_awaited()
+
+    result = await memmachine.list_search(
+        session,
+        target_memories=[MemoryType.Episodic],
+        page_size=2,
+        cursor="cursor",
+    )
+
+    call_kwargs = episode_storage.get_episode_messages.await_args.kwargs
+    assert call_kwargs["cursor"] == "cursor"
+    assert call_kwargs["page_num"] is None
+    assert result.next_episodic_cursor == EpisodeCursor.after(episodes[-1]).encode()
+
+    # A page that is not full is the last one
+    result = await memmachine.list_search(
+        session,
+        target_memories=[MemoryType.Episodic],
+        page_size=3,
+    )
+    assert result.next_episodic_cursor is None
+
+
 @pytest.mark.asyncio
 async def test_count_episodes_filters_by_session_only(
     minimal_conf, patched_resource_manager
@@ -496,3 +626,47 @@ async def test_delete_features_forwards_to_semantic_manager(
     await memmachine.delete_features(["feat1", "feat2"])
 
     semantic_manager.delete_features.assert_awaited_once_with(["feat1", "feat2"])
+
+
+@pytest.mark.asyncio
+async def test_start_warms_up_recent_sessions(minimal_conf, patched_resource_manager):
+    minimal_conf.session_manager = SessionManagerConf(
+        warm_up_sessions=5,
+        warm_up_concurrency=2,
+    )
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+
+    semantic_service = MagicMock()
+    semantic_service.start = AsyncMock()
+    patched_resource_manager.get_semantic_service = AsyncMock(
+        return_value=semantic_service
+    )
+    episodic_manager = MagicMock()
+    episodic_manager.warm_up = AsyncMock(return_value=5)
+    patched_resource_manager.get_episodic_memory_manager = AsyncMock(
+        return_value=episodic_manager
+    )
+
+    await memmachine.start()
+
+    semantic_service.start.assert_awaited_once()
+    episodic_manager.warm_up.assert_awaited_once_with(
+        max_sessions=5,
+        max_concurrency=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_skips_warm_up_by_default(minimal_conf, patched_resource_manager):
+    minimal_conf.session_manager = SessionManagerConf()
+    memmachine = MemMachine(minimal_conf, patched_resource_manager)
+
+    semantic_service = MagicMock()
+    semantic_service.start = AsyncMock()
+    patched_resource_manager.get_semantic_service = AsyncMock(
+        return_value=semantic_service
+    )
+
+    await memmachine.start()
+
+    patched_resource_manager.get_episodic_memory_manager.assert_not_awaited()
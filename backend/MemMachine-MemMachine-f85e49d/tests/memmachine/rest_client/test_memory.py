@@ -642,6 +642,41 @@ class TestMemory:
         with pytest.raises(RuntimeError, match="client has been closed"):
             memory.search("query")
 
+    def test_list_episodic_with_cursor(self, mock_client):
+        """Test list_episodic sends the cursor and returns the next one."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "status": 0,
+            "content": {
+                "episodic_memory": [{"uid": "2", "content": "second"}],
+                "semantic_memory": [],
+                "next_cursor": "cursor-2",
+            },
+        }
+        mock_response.raise_for_status = Mock()
+        mock_client.request.return_value = mock_response
+
+        memory = Memory(
+            client=mock_client,
+            org_id="test_org",
+            project_id="test_project",
+            user_id="user1",
+        )
+
+        result = memory.list_episodic(page_size=1, cursor="cursor-1")
+
+        assert result == {
+            "episodic_memory": [{"uid": "2", "content": "second"}],
+            "next_cursor": "cursor-2",
+        }
+        call_args = mock_client.request.call_args
+        assert "/api/v2/memories/list" in call_args[0][1]
+        json_data = call_args[1]["json"]
+        assert json_data["page_size"] == 1
+        assert json_data["cursor"] == "cursor-1"
+        assert json_data["type"] == "episodic"
+        assert "metadata.user_id='user1'" in json_data["filter"]
+
     def test_get_context(self, mock_client):
         """Test getting memory context."""
         memory = Memory(
@@ -131,6 +131,25 @@ class InMemorySemanticStorage(SemanticStorage):
             self._feature_ids_by_set.setdefault(set_id, []).append(feature_id)
             return feature_id
 
+    async def add_features(
+        self,
+        features: list[SemanticStorage.NewFeature],
+    ) -> list[FeatureIdT]:
+        feature_ids = []
+        for f in features:
+            feature_id = await self.add_feature(
+                set_id=f.set_id,
+                category_name=f.category_name,
+                feature=f.feature,
+                value=f.value,
+                tag=f.tag,
+                embedding=f.embedding,
+                metadata=f.metadata,
+            )
+            await self.add_citations(feature_id, f.citations)
+            feature_ids.append(feature_id)
+        return feature_ids
+
     async def update_feature(
         self,
         feature_id: FeatureIdT,
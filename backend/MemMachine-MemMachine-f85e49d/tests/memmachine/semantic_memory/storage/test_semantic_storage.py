@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import numpy as np
 import pytest
 import pytest_asyncio
@@ -212,6 +214,54 @@ async def test_get_feature_set_with_page_offset(
         await semantic_storage.delete_features(feature_ids)
 
 
+@pytest.mark.asyncio
+async def test_get_feature_set_tag_threshold(
+    semantic_storage: SemanticStorage,
+):
+    tags = ["facts", "facts", "facts", "likes", "likes", "dislikes"]
+    feature_ids: list[FeatureIdT] = [
+        await semantic_storage.add_feature(
+            set_id="user",
+            category_name="default",
+            feature="topic",
+            value=f"value-{idx}",
+            tag=tag,
+            embedding=np.array([float(idx), 1.0], dtype=float),
+        )
+        for idx, tag in enumerate(tags)
+    ]
+    other_id = await semantic_storage.add_feature(
+        set_id="other_user",
+        category_name="default",
+        feature="topic",
+        value="other-value",
+        tag="dislikes",
+        embedding=np.array([1.0, 1.0], dtype=float),
+    )
+
+    try:
+        features = await semantic_storage.get_feature_set(
+            filter_expr=_expr("set_id IN (user)"),
+            tag_threshold=2,
+        )
+        assert sorted(feature.value for feature in features) == [
+            "value-0",
+            "value-1",
+            "value-2",
+            "value-3",
+            "value-4",
+        ]
+
+        # Tags are only counted among the features matching the filter
+        features = await semantic_storage.get_feature_set(
+            filter_expr=_expr("set_id IN (user)"),
+            tag_threshold=3,
+        )
+        assert {feature.tag for feature in features} == {"facts"}
+    finally:
+        await semantic_storage.delete_features([*feature_ids, other_id])
+
+
 @pytest.mark.asyncio
 async def test_get_feature_set_offset_without_limit_errors(
     semantic_storage: SemanticStorage,
@@ -281,6 +331,65 @@ async def test_get_feature_set_basic_vector_search(
     assert result_values == [value_a, value_b]
 
 
+@pytest.mark.asyncio
+async def test_get_feature_set_vector_search_with_index_tuning(
+    semantic_storage: SemanticStorage,
+    oposite_vector_features,
+):
+    if getattr(semantic_storage, "backend_name", None) == "neo4j":
+        pytest.skip("Neo4j aproximate kNN limitation")
+
+    embed_a, value_a = oposite_vector_features[0]
+    _embed_b, value_b = oposite_vector_features[1]
+
+    results = await semantic_storage.get_feature_set(
+        filter_expr=_expr("set_id IN (user)"),
+        page_size=10,
+        vector_search_opts=SemanticStorage.VectorSearchOpts(
+            query_embedding=embed_a,
+            ef_search=100,
+            probes=10,
+        ),
+    )
+
+    assert [f.value for f in results] == [value_a, value_b]
+
+
+@pytest.mark.asyncio
+async def test_vector_search_matches_query_embedding_dimension(
+    semantic_storage: SemanticStorage,
+):
+    if getattr(semantic_storage, "backend_name", None) != "postgres":
+        pytest.skip("Postgres-specific indexing")
+
+    for value, embedding in (
+        ("pizza", np.array([1.0, 0.0])),
+        ("sushi", np.array([1.0, 0.0, 0.0])),
+    ):
+        await semantic_storage.add_feature(
+            set_id="user",
+            category_name="default",
+            feature="likes",
+            value=value,
+            tag="food",
+            embedding=embedding,
+        )
+
+    results = await semantic_storage.get_feature_set(
+        filter_expr=_expr("set_id IN (user)"),
+        page_size=10,
+        vector_search_opts=SemanticStorage.VectorSearchOpts(
+            query_embedding=np.array([1.0, 0.0, 0.0]),
+        ),
+    )
+
+    assert [f.value for f in results] == ["sushi"]
+
+    # Indexes are created in the background, outside of the writes
+    await asyncio.gather(*semantic_storage._background_tasks)
+    assert {2, 3} <= semantic_storage._indexed_dimensions
+
+
 @pytest.mark.asyncio
 async def test_get_feature_set_min_cos_vector_search(
     semantic_storage: SemanticStorage,
@@ -438,6 +547,65 @@ async def test_add_feature_with_citations(
     )
 
 
+@pytest.mark.asyncio
+async def test_add_features_bulk(
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+):
+    history_id = await _add_episode(episode_storage, content="bulk source")
+
+    feature_ids = await semantic_storage.add_features(
+        [
+            SemanticStorage.NewFeature(
+                set_id="user",
+                category_name="default",
+                feature="topic",
+                value="ai",
+                tag="facts",
+                embedding=np.array([1.0, 0.0]),
+                citations=[history_id],
+            ),
+            SemanticStorage.NewFeature(
+                set_id="other-user",
+                category_name="default",
+                feature="topic",
+                value="music",
+                tag="facts",
+                embedding=np.array([0.0, 1.0]),
+                metadata={"source": "bulk"},
+            ),
+            SemanticStorage.NewFeature(
+                set_id="user",
+                category_name="default",
+                feature="food",
+                value="pizza",
+                tag="likes",
+                embedding=np.array([1.0, 1.0]),
+                citations=[history_id],
+            ),
+        ],
+    )
+
+    assert len(feature_ids) == 3
+    assert len(set(feature_ids)) == 3
+
+    features = [
+        await semantic_storage.get_feature(feature_id, load_citations=True)
+        for feature_id in feature_ids
+    ]
+    assert [f.value for f in features] == ["ai", "music", "pizza"]
+    assert [f.set_id for f in features] == ["user", "other-user", "user"]
+    assert list(features[0].metadata.citations) == [history_id]
+    assert features[1].metadata.citations == []
+    assert features[1].metadata.other == {"source": "bulk"}
+    assert list(features[2].metadata.citations) == [history_id]
+
+    assert await semantic_storage.add_features([]) == []
+
+    await semantic_storage.delete_features(feature_ids)
+    await episode_storage.delete_episodes([history_id])
+
+
 @pytest.mark.asyncio
 async def test_get_feature_without_citations(
     semantic_storage: SemanticStorage,
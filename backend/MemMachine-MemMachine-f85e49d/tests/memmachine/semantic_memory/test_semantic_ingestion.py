@@ -12,6 +12,7 @@ from memmachine.semantic_memory.semantic_ingestion import IngestionService
 from memmachine.semantic_memory.semantic_llm import (
     LLMReducedFeature,
     SemanticConsolidateMemoryRes,
+    SourcedSemanticCommand,
 )
 from memmachine.semantic_memory.semantic_model import (
     RawSemanticPrompt,
@@ -206,6 +207,133 @@ async def test_process_single_set_applies_commands(
     assert embedder_double.ingest_calls == [["blue"]]
 
 
+@pytest.mark.asyncio
+async def test_process_single_set_batches_messages(
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+    resource_retriever: MockResourceRetriever,
+    semantic_category: SemanticCategory,
+    monkeypatch,
+):
+    ingestion_service = IngestionService(
+        IngestionService.Params(
+            semantic_storage=semantic_storage,
+            history_store=episode_storage,
+            resource_retriever=resource_retriever,
+            consolidated_threshold=10,
+            message_batch_size=2,
+        ),
+    )
+
+    message_ids = [
+        await add_history(episode_storage, content=content)
+        for content in ["I love blue cars", "I live in Paris", "I play chess"]
+    ]
+    for message_id in message_ids:
+        await semantic_storage.add_history_to_set(
+            set_id="user-654",
+            history_id=message_id,
+        )
+
+    llm_batch_feature_update_mock = AsyncMock(
+        return_value=[
+            SourcedSemanticCommand(
+                command="add",
+                feature="city",
+                tag="home",
+                value="Paris",
+                message_indices=[1],
+            ),
+            SourcedSemanticCommand(
+                command="add",
+                feature="car",
+                tag="car",
+                value="blue",
+            ),
+        ],
+    )
+    llm_feature_update_mock = AsyncMock(
+        return_value=[
+            SemanticCommand(command="add", feature="game", tag="hobby", value="chess"),
+        ],
+    )
+    monkeypatch.setattr(
+        "memmachine.semantic_memory.semantic_ingestion.llm_batch_feature_update",
+        llm_batch_feature_update_mock,
+    )
+    monkeypatch.setattr(
+        "memmachine.semantic_memory.semantic_ingestion.llm_feature_update",
+        llm_feature_update_mock,
+    )
+    get_feature_set_spy = AsyncMock(wraps=semantic_storage.get_feature_set)
+    monkeypatch.setattr(semantic_storage, "get_feature_set", get_feature_set_spy)
+
+    await ingestion_service._process_single_set("user-654")
+
+    llm_batch_feature_update_mock.assert_awaited_once()
+    assert llm_batch_feature_update_mock.await_args.kwargs["message_contents"] == [
+        "I love blue cars",
+        "I live in Paris",
+    ]
+    llm_feature_update_mock.assert_awaited_once()
+    # One read per window, plus one for consolidation.
+    assert get_feature_set_spy.await_count == 3
+
+    features = await semantic_storage.get_feature_set(
+        filter_expr=parse_filter("set_id IN ('user-654')"),
+        load_citations=True,
+    )
+    citations = {f.value: sorted(f.metadata.citations) for f in features}
+    assert citations == {
+        "Paris": [message_ids[1]],
+        "blue": sorted(message_ids[:2]),
+        "chess": [message_ids[2]],
+    }
+
+    assert (
+        await semantic_storage.get_history_messages(
+            set_ids=["user-654"],
+            is_ingested=False,
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_apply_commands_embeds_additions_in_one_call(
+    ingestion_service: IngestionService,
+    semantic_storage: SemanticStorage,
+    episode_storage: EpisodeStorage,
+    embedder_double: MockEmbedder,
+    semantic_category: SemanticCategory,
+):
+    message_id = await add_history(episode_storage, content="I drive a red car")
+
+    commands = [
+        SemanticCommand(command="add", feature="car", tag="car", value="red"),
+        SemanticCommand(command="add", feature="bike", tag="bike", value="old"),
+        SemanticCommand(command="delete", feature="bike", tag="bike", value=""),
+        SemanticCommand(command="add", feature="city", tag="home", value="Paris"),
+    ]
+
+    await ingestion_service._apply_commands(
+        commands=commands,
+        set_id="user-321",
+        category_name=semantic_category.name,
+        citation_ids=[[message_id]] * len(commands),
+        embedder=embedder_double,
+    )
+
+    assert embedder_double.ingest_calls == [["red", "old", "Paris"]]
+
+    features = await semantic_storage.get_feature_set(
+        filter_expr=parse_filter("set_id IN ('user-321')"),
+        load_citations=True,
+    )
+    assert sorted(f.value for f in features) == ["Paris", "red"]
+    assert all(list(f.metadata.citations) == [message_id] for f in features)
+
+
 @pytest.mark.asyncio
 async def test_consolidation_groups_by_tag(
     ingestion_service: IngestionService,
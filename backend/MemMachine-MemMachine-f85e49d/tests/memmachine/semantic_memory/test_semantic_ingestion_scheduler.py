@@ -0,0 +1,216 @@
+"""Tests for the event-driven semantic ingestion scheduler."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+import pytest_asyncio
+
+from memmachine.semantic_memory.semantic_ingestion_scheduler import (
+    IngestionScheduler,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeBacklog:
+    """Tracks per-set backlogs and records how sets are processed."""
+
+    def __init__(self) -> None:
+        self.remaining: dict[str, int] = {}
+        self.processed: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.process_delay = 0.0
+        self.sweep_calls = 0
+        self.sweep_result: list[str] = []
+
+    def add(self, set_id: str, passes: int = 1) -> None:
+        self.remaining[set_id] = self.remaining.get(set_id, 0) + passes
+
+    async def process_set(self, set_id: str) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.process_delay)
+            self.processed.append(set_id)
+            self.remaining[set_id] = max(self.remaining.get(set_id, 0) - 1, 0)
+        finally:
+            self.in_flight -= 1
+
+    async def has_backlog(self, set_id: str) -> bool:
+        return self.remaining.get(set_id, 0) > 0
+
+    async def find_sets_with_backlog(self) -> list[str]:
+        self.sweep_calls += 1
+        return list(self.sweep_result)
+
+
+def _make_scheduler(
+    backlog: FakeBacklog,
+    *,
+    debounce_sec: float = 0.05,
+    sweep_interval_sec: float = 60.0,
+    max_concurrent_sets: int = 4,
+) -> IngestionScheduler:
+    return IngestionScheduler(
+        IngestionScheduler.Params(
+            process_set=backlog.process_set,
+            has_backlog=backlog.has_backlog,
+            find_sets_with_backlog=backlog.find_sets_with_backlog,
+            debounce_sec=debounce_sec,
+            sweep_interval_sec=sweep_interval_sec,
+            max_concurrent_sets=max_concurrent_sets,
+        ),
+    )
+
+
+async def _wait_for(condition) -> None:
+    async with asyncio.timeout(2.0):
+        while True:
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def running() -> AsyncIterator[
+    Callable[[IngestionScheduler], IngestionScheduler]
+]:
+    schedulers: list[IngestionScheduler] = []
+    tasks: list[asyncio.Task] = []
+
+    def _start(scheduler: IngestionScheduler) -> IngestionScheduler:
+        schedulers.append(scheduler)
+        tasks.append(asyncio.create_task(scheduler.run()))
+        return scheduler
+
+    yield _start
+
+    for scheduler in schedulers:
+        scheduler.stop()
+    await asyncio.gather(*tasks)
+
+
+async def test_notifications_are_debounced_into_one_pass(running):
+    backlog = FakeBacklog()
+    scheduler = running(_make_scheduler(backlog, debounce_sec=0.1))
+    await asyncio.sleep(0)
+
+    backlog.add("set-a")
+    for _ in range(5):
+        scheduler.notify(["set-a"])
+
+    await asyncio.sleep(0.05)
+    assert backlog.processed == []
+
+    await _wait_for(lambda: backlog.processed == ["set-a"])
+    await asyncio.sleep(0.15)
+    assert backlog.processed == ["set-a"]
+
+
+async def test_sets_without_backlog_are_not_processed(running):
+    backlog = FakeBacklog()
+    scheduler = running(_make_scheduler(backlog, debounce_sec=0.0))
+
+    scheduler.notify(["set-a"])
+    await asyncio.sleep(0.1)
+
+    assert backlog.processed == []
+
+
+async def test_concurrency_is_bounded(running):
+    backlog = FakeBacklog()
+    backlog.process_delay = 0.05
+    scheduler = running(
+        _make_scheduler(backlog, debounce_sec=0.0, max_concurrent_sets=2),
+    )
+
+    set_ids = [f"set-{i}" for i in range(6)]
+    for set_id in set_ids:
+        backlog.add(set_id)
+    scheduler.notify(set_ids)
+
+    await _wait_for(lambda: len(backlog.processed) == len(set_ids))
+    assert backlog.max_in_flight == 2
+    assert sorted(backlog.processed) == sorted(set_ids)
+
+
+async def test_large_backlog_does_not_starve_other_sets(running):
+    backlog = FakeBacklog()
+    backlog.process_delay = 0.01
+    scheduler = running(
+        _make_scheduler(backlog, debounce_sec=0.0, max_concurrent_sets=1),
+    )
+
+    backlog.add("big", passes=5)
+    scheduler.notify(["big"])
+    await _wait_for(lambda: backlog.processed == ["big"])
+
+    backlog.add("small")
+    scheduler.notify(["small"])
+
+    await _wait_for(lambda: backlog.remaining["big"] == 0)
+    assert backlog.processed.index("small") < len(backlog.processed) - 1
+
+
+async def test_notification_during_processing_requeues_set(running):
+    backlog = FakeBacklog()
+    backlog.process_delay = 0.05
+    scheduler = running(_make_scheduler(backlog, debounce_sec=0.0))
+
+    backlog.add("set-a")
+    scheduler.notify(["set-a"])
+    await _wait_for(lambda: backlog.in_flight == 1)
+
+    backlog.add("set-a")
+    scheduler.notify(["set-a"])
+
+    await _wait_for(lambda: backlog.processed == ["set-a", "set-a"])
+
+
+async def test_sweep_queues_sets_missed_by_notifications(running):
+    backlog = FakeBacklog()
+    backlog.add("restored")
+    backlog.sweep_result = ["restored"]
+    running(_make_scheduler(backlog, debounce_sec=10.0, sweep_interval_sec=0.05))
+
+    await _wait_for(lambda: backlog.processed == ["restored"])
+
+    backlog.sweep_result = []
+    await _wait_for(lambda: backlog.sweep_calls >= 3)
+    assert backlog.processed == ["restored"]
+
+
+async def test_stop_waits_for_in_flight_sets():
+    backlog = FakeBacklog()
+    backlog.process_delay = 0.05
+    scheduler = _make_scheduler(backlog, debounce_sec=0.0)
+    task = asyncio.create_task(scheduler.run())
+
+    backlog.add("set-a")
+    scheduler.notify(["set-a"])
+    await _wait_for(lambda: backlog.in_flight == 1)
+
+    scheduler.stop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    assert backlog.processed == ["set-a"]
+
+
+async def test_scheduler_can_be_restarted_after_stop():
+    backlog = FakeBacklog()
+    scheduler = _make_scheduler(backlog, debounce_sec=0.0)
+
+    # A stop requested before the loop starts is honored
+    task = asyncio.create_task(scheduler.run())
+    scheduler.stop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    task = asyncio.create_task(scheduler.run())
+    backlog.add("set-a")
+    scheduler.notify(["set-a"])
+    await _wait_for(lambda: backlog.processed == ["set-a"])
+
+    scheduler.stop()
+    await asyncio.wait_for(task, timeout=1.0)
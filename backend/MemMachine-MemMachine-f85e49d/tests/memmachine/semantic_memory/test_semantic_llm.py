@@ -4,6 +4,7 @@ import pytest
 
 from memmachine.common.language_model import LanguageModel
 from memmachine.semantic_memory.semantic_llm import (
+    llm_batch_feature_update,
     llm_consolidate_features,
     llm_feature_update,
 )
@@ -128,6 +129,47 @@ async def test_multiple_commands_update_response(
     assert commands[1].feature == "favorite_car"
 
 
+@pytest.mark.asyncio
+async def test_batch_update_response_keeps_message_indices(
+    magic_mock_llm_model: LanguageModel,
+    basic_features: list[SemanticFeature],
+):
+    magic_mock_llm_model.generate_parsed_response.return_value = {
+        "commands": [
+            {
+                "command": "add",
+                "tag": "car",
+                "feature": "favorite_car",
+                "value": "Tesla",
+                "message_indices": [1],
+            },
+            {
+                "command": "delete",
+                "tag": "food",
+                "feature": "favorite_bread",
+                "value": "",
+            },
+        ],
+    }
+
+    commands = await llm_batch_feature_update(
+        features=basic_features,
+        message_contents=["I stopped eating bread", "I drive a Tesla"],
+        model=magic_mock_llm_model,
+        update_prompt="Update features",
+    )
+
+    assert [c.feature for c in commands] == ["favorite_car", "favorite_bread"]
+    assert commands[0].message_indices == [1]
+    assert commands[1].message_indices == []
+
+    user_prompt = magic_mock_llm_model.generate_parsed_response.await_args.kwargs[
+        "user_prompt"
+    ]
+    assert '<MESSAGE index="0">\nI stopped eating bread\n</MESSAGE>' in user_prompt
+    assert '<MESSAGE index="1">\nI drive a Tesla\n</MESSAGE>' in user_prompt
+
+
 @pytest.mark.asyncio
 async def test_empty_consolidate_response(
     magic_mock_llm_model: LanguageModel,
@@ -111,6 +111,25 @@ async def test_service_starts_and_stops_cleanly(
     assert semantic_service._is_shutting_down
 
 
+async def test_service_restarts_after_stop(
+    semantic_service: SemanticService,
+):
+    # Given a service that was started and stopped
+    await semantic_service.start()
+    await semantic_service.stop()
+    assert semantic_service._ingestion_task is None
+
+    # When starting it again
+    await semantic_service.start()
+
+    # Then a new ingestion task keeps running
+    await asyncio.sleep(0.05)
+    assert semantic_service._ingestion_task is not None
+    assert not semantic_service._ingestion_task.done()
+
+    await semantic_service.stop()
+
+
 async def test_start_idempotent(
     semantic_service: SemanticService,
 ):
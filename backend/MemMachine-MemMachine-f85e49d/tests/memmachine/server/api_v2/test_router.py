@@ -281,6 +281,7 @@ def test_list_memories(client, mock_memmachine):
     mock_results = MagicMock()
     mock_results.episodic_memory = [{"id": "1", "content": "mem1"}]
     mock_results.semantic_memory = None
+    mock_results.next_episodic_cursor = None
     mock_memmachine.list_search.return_value = mock_results
 
     response = client.post("/api/v2/memories/list", json=payload)
@@ -288,10 +289,42 @@ def test_list_memories(client, mock_memmachine):
     data = response.json()
     assert data["content"]["episodic_memory"] == [{"id": "1", "content": "mem1"}]
     assert data["content"]["semantic_memory"] == []
+    assert data["content"]["next_cursor"] is None
 
     mock_memmachine.list_search.assert_awaited_once()
 
 
+def test_list_memories_with_cursor(client, mock_memmachine):
+    payload = {
+        "org_id": "test_org",
+        "project_id": "test_proj",
+        "type": "episodic",
+        "page_size": 1,
+        "cursor": "cursor-1",
+    }
+
+    mock_results = MagicMock()
+    mock_results.episodic_memory = [{"id": "2", "content": "mem2"}]
+    mock_results.semantic_memory = None
+    mock_results.next_episodic_cursor = "cursor-2"
+    mock_memmachine.list_search.return_value = mock_results
+
+    response = client.post("/api/v2/memories/list", json=payload)
+    assert response.status_code == 200
+    assert response.json()["content"]["next_cursor"] == "cursor-2"
+    assert mock_memmachine.list_search.await_args.kwargs["cursor"] == "cursor-1"
+    assert mock_memmachine.list_search.await_args.kwargs["page_num"] is None
+
+    response = client.post("/api/v2/memories/list", json={**payload, "page_num": 1})
+    assert response.status_code == 422
+
+    mock_memmachine.list_search.side_effect = InvalidArgumentError(
+        "Invalid episode cursor"
+    )
+    response = client.post("/api/v2/memories/list", json=payload)
+    assert response.status_code == 422
+
+
 def test_delete_episodic_memory(client, mock_memmachine):
     payload = {
         "org_id": "test_org",
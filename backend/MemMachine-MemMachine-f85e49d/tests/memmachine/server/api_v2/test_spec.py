@@ -197,6 +197,17 @@ def test_list_memories_spec():
     assert spec.type == MemoryType.Episodic
 
 
+def test_list_memories_spec_cursor():
+    spec = ListMemoriesSpec(cursor="cursor")
+    assert spec.cursor == "cursor"
+
+    spec = ListMemoriesSpec(cursor="cursor", page_num=None)
+    assert spec.page_num is None
+
+    with pytest.raises(ValidationError, match="both cursor and page_num"):
+        ListMemoriesSpec(cursor="cursor", page_num=1)
+
+
 def test_delete_episodic_memory_spec():
     with pytest.raises(ValidationError):
         DeleteEpisodicMemorySpec()
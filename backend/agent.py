@@ -27,9 +27,7 @@ model = OpenAIModel(
     }
 )
 
-# Create a docs assistant agent with Neo4j vector retrieval
-docs_agent = Agent(
-    system_prompt="""You are Docs Analyse AI that provides detailed analysis of document materials.
+DOCS_AGENT_SYSTEM_PROMPT = """You are Docs Analyse AI that provides detailed analysis of document materials.
 
 You have access to:
 1. A knowledge base with vector search capabilities through Neo4j
@@ -38,12 +36,27 @@ You have access to:
 
 When answering questions:
 - First search the knowledge base for relevant information
-- Use document chunks to provide specific details
+- Use document chunks to provide specific details, and mention the source documents you used
+- Set expand_graph when relationships between concepts matter to the question
 - Supplement with web search if needed
-- Provide comprehensive and accurate responses based on the available data""",
-    tools=[search_knowledge_base],
-    model=model
-)
+- Provide comprehensive and accurate responses based on the available data"""
+
+
+def create_docs_agent() -> Agent:
+    """Create a docs assistant agent with Neo4j vector retrieval.
+
+    Each agent keeps its own conversation history, so an agent must not
+    be used by more than one request at a time.
+    """
+    return Agent(
+        system_prompt=DOCS_AGENT_SYSTEM_PROMPT,
+        tools=[search_knowledge_base],
+        model=model
+    )
+
+
+# Create a docs assistant agent with Neo4j vector retrieval
+docs_agent = create_docs_agent()
 
 if __name__ == "__main__":
     # Run the agent in a loop for interactive conversation
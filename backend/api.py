@@ -3,18 +3,25 @@ FastAPI server for PDF processing and Neo4j vector retrieval
 """
 import os
 import asyncio
-from typing import List, Optional
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
 from datetime import datetime
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from uuid import uuid4
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import tempfile
 import shutil
 
 from dotenv import load_dotenv
-from structure.neo4j.setup import upload, Neo4jSetup
-from agent import docs_agent
-from tools.memory import clear_all_memories
+from structure.neo4j.setup import Neo4jSetup
+from structure.ingestion_queue import IngestionQueue, QueueFullError, QUEUED, INDEXED, ERROR, IN_PROGRESS_STAGES
+from structure.document_registry import create_document_registry
+from agent import docs_agent, create_docs_agent
+from tools.memory import clear_all_memories, close_memory_client
+from tools.neo4j import search_cache
 
 # Load environment variables
 load_dotenv()
@@ -28,11 +35,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
-# In-memory storage for demo (replace with database in production)
-documents_db = []
-stats_db = {"documents": 0, "entities": 0, "relationships": 0}
+# Uploaded documents and their status, kept across restarts
+document_registry = create_document_registry(
+    os.getenv("DOCUMENT_REGISTRY_URL", "sqlite+aiosqlite:///documents.db")
+)
+
+# Maximum number of chat requests running the agent at the same time.
+# Further requests wait for a free slot.
+CHAT_MAX_CONCURRENCY = max(int(os.getenv("CHAT_MAX_CONCURRENCY", "4")), 1)
+chat_semaphore = asyncio.Semaphore(CHAT_MAX_CONCURRENCY)
+
+# Seconds between recounts of the graph statistics from Neo4j's count store,
+# which correct drift in the counts updated at ingest time
+GRAPH_STATS_RECONCILE_SECONDS = float(os.getenv("GRAPH_STATS_RECONCILE_SECONDS", "300"))
+
+# Uploaded files wait here until they are ingested, so that queued
+# documents survive restarts together with the ingestion queue.
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+
+# Idle agents, most recently used last. A Strands agent keeps its own
+# conversation history and cannot serve two requests at once, so each
+# running chat borrows one. Sequential chats keep reusing the same agent
+# (and history); concurrent chats get extra agents, at most one per slot.
+idle_agents = [docs_agent]
 
 # Pydantic models
 class ChatRequest(BaseModel):
@@ -51,11 +79,24 @@ class DocumentResponse(BaseModel):
     type: str
     status: str
     uploadedAt: datetime
+    stage: Optional[str] = None
+
+class SearchCacheStats(BaseModel):
+    entries: int
+    corpusVersion: int
+    hits: int
+    similarHits: int
+    misses: int
+    hitRate: float
+    savedLatencyMs: int
 
 class StatsResponse(BaseModel):
     documents: int
     entities: int
     relationships: int
+    chunks: int = 0
+    labels: Dict[str, int] = {}
+    searchCache: Optional[SearchCacheStats] = None
 
 @app.get("/")
 async def root():
@@ -67,27 +108,101 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+def document_status(stage: str) -> str:
+    """Map an ingestion stage to the document status shown in the UI"""
+    if stage in (INDEXED, ERROR):
+        return stage
+    return "processing"
+
+# Registry updates scheduled by the ingestion queue, kept until they finish
+registry_updates = set()
+
+def on_document_stage_change(job: dict):
+    """Reflect ingestion progress in the document registry and search cache"""
+    print(f"🔄 Document {job['id']} stage updated to: {job['stage']}")
+    if job["stage"] == INDEXED:
+        search_cache.bump_corpus_version()
+    
+    # The queue calls this from the event loop; the registry applies
+    # updates in the order they are scheduled
+    task = asyncio.get_running_loop().create_task(
+        document_registry.update_status(job["id"], document_status(job["stage"]), job["stage"])
+    )
+    registry_updates.add(task)
+    task.add_done_callback(registry_updates.discard)
+
+ingestion_queue = IngestionQueue(
+    db_path=os.getenv("INGESTION_QUEUE_DB", "ingestion_queue.db"),
+    num_workers=int(os.getenv("INGESTION_WORKERS", "2")),
+    max_pending=int(os.getenv("INGESTION_QUEUE_MAX_PENDING", "1000")),
+    on_stage_change=on_document_stage_change,
+)
+
+@app.on_event("startup")
+async def start_ingestion_queue():
+    """Open the document registry and start the ingestion workers"""
+    await document_registry.startup()
+    
+    # Documents interrupted by a restart are queued again by the queue
+    for job in ingestion_queue.list_jobs():
+        if job["stage"] in IN_PROGRESS_STAGES:
+            await document_registry.update_status(job["id"], document_status(QUEUED), QUEUED)
+    await ingestion_queue.start()
+
+async def reconcile_graph_stats_periodically():
+    """Recount the graph statistics on startup and then periodically"""
+    while True:
+        try:
+            await asyncio.to_thread(Neo4jSetup().reconcile_graph_stats)
+        except Exception as e:
+            print(f"⚠️ Graph stats reconciliation failed: {e}")
+        await asyncio.sleep(GRAPH_STATS_RECONCILE_SECONDS)
+
+@app.on_event("startup")
+async def start_graph_stats_reconciliation():
+    app.state.graph_stats_task = asyncio.create_task(reconcile_graph_stats_periodically())
+
+@app.on_event("shutdown")
+async def stop_graph_stats_reconciliation():
+    app.state.graph_stats_task.cancel()
+
+@app.on_event("shutdown")
+async def stop_ingestion_queue():
+    await ingestion_queue.stop()
+    await asyncio.gather(*registry_updates, return_exceptions=True)
+    await document_registry.shutdown()
+
+@app.on_event("shutdown")
+async def close_memory():
+    await asyncio.to_thread(close_memory_client)
+
+@app.on_event("shutdown")
+async def close_neo4j_tool():
+    from tools.neo4j import get_neo4j_tool
+    await get_neo4j_tool().aclose()
+
 @app.post("/api/upload", response_model=List[DocumentResponse])
 async def upload_documents(files: List[UploadFile] = File(...)):
     """
-    Upload and process documents
+    Upload documents and queue them for processing
     """
     processed_docs = []
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
     
     for file in files:
+        file_path = None
         try:
             # Generate unique ID
-            doc_id = f"doc_{len(documents_db)}_{int(datetime.now().timestamp())}"
+            doc_id = f"doc_{int(datetime.now().timestamp())}_{uuid4().hex[:8]}"
             
-            # Save file temporarily
-            temp_dir = tempfile.mkdtemp()
-            temp_path = os.path.join(temp_dir, file.filename)
+            # Save file until it is processed
+            file_path = os.path.join(UPLOAD_DIR, f"{doc_id}_{os.path.basename(file.filename)}")
             
-            with open(temp_path, "wb") as buffer:
+            with open(file_path, "wb") as buffer:
                 shutil.copyfileobj(file.file, buffer)
             
             # Get file info
-            file_size = os.path.getsize(temp_path)
+            file_size = os.path.getsize(file_path)
             file_ext = file.filename.split('.')[-1].lower()
             
             # Create document record
@@ -98,79 +213,154 @@ async def upload_documents(files: List[UploadFile] = File(...)):
                 "type": file_ext,
                 "status": "processing",
                 "uploadedAt": datetime.now(),
-                "path": temp_path
+                "path": file_path
             }
             
-            documents_db.append(doc)
+            # Register the document before the workers can update it
+            doc["stage"] = QUEUED
+            await document_registry.add(doc)
             
-            # Process document asynchronously (in background)
-            asyncio.create_task(process_document(doc_id, temp_path))
+            # Queue document for the ingestion workers
+            try:
+                ingestion_queue.enqueue(doc)
+            except QueueFullError:
+                await document_registry.remove(doc_id)
+                raise
             
             processed_docs.append(DocumentResponse(**doc))
             
+        except QueueFullError as e:
+            if file_path and os.path.exists(file_path):
+                os.remove(file_path)
+            raise HTTPException(status_code=429, detail=f"Error uploading {file.filename}: {str(e)}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error uploading {file.filename}: {str(e)}")
     
     return processed_docs
 
-async def process_document(doc_id: str, file_path: str):
+@app.get("/api/ingestion/status")
+async def get_ingestion_status():
     """
-    Process document in background and upload to Neo4j
+    Get ingestion queue status: workers, stage counts and per-document stages
     """
-    try:
-        print(f"📤 Starting processing for document {doc_id}: {file_path}")
-        
-        # Run Neo4j upload with the actual file path
-        success = await upload(file_path)
-        
-        # Update document status
-        for doc in documents_db:
-            if doc["id"] == doc_id:
-                doc["status"] = "indexed" if success else "error"
-                print(f"✅ Document {doc_id} status updated to: {doc['status']}")
-                break
-        
-        # Update stats if successful
-        if success:
-            stats_db["documents"] += 1
-            # TODO: Get actual entity and relationship counts from Neo4j
-            stats_db["entities"] += 12  # Mock value
-            stats_db["relationships"] += 8  # Mock value
-            print(f"📊 Stats updated: {stats_db}")
-        
-        # Clean up temp file after processing
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                temp_dir = os.path.dirname(file_path)
-                if os.path.exists(temp_dir):
-                    os.rmdir(temp_dir)
-                print(f"🗑️ Cleaned up temp file: {file_path}")
-        except Exception as cleanup_error:
-            print(f"⚠️ Cleanup warning: {cleanup_error}")
-            
-    except Exception as e:
-        print(f"❌ Error processing document {doc_id}: {e}")
-        import traceback
-        traceback.print_exc()
-        for doc in documents_db:
-            if doc["id"] == doc_id:
-                doc["status"] = "error"
-                break
+    status = ingestion_queue.status()
+    for job in status["documents"]:
+        job.pop("path", None)
+    return status
+
+@app.get("/api/documents/{doc_id}/status")
+async def get_document_status(doc_id: str):
+    """
+    Get the ingestion stage of a document
+    """
+    job = ingestion_queue.get_job(doc_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
+    job.pop("path", None)
+    return job
 
 @app.get("/api/documents", response_model=List[DocumentResponse])
-async def get_documents():
+async def get_documents(
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    status: Optional[str] = None
+):
     """
-    Get all uploaded documents
+    Get uploaded documents, in upload order
+    
+    The total number of matching documents is returned in the X-Total-Count header.
     """
-    return [DocumentResponse(**doc) for doc in documents_db]
+    documents, total = await document_registry.list(offset=offset, limit=limit, status=status)
+    response.headers["X-Total-Count"] = str(total)
+    return [DocumentResponse(**doc) for doc in documents]
 
 @app.get("/api/stats", response_model=StatsResponse)
 async def get_stats():
     """
     Get knowledge base statistics
     """
-    return StatsResponse(**stats_db)
+    try:
+        graph_stats = await asyncio.to_thread(Neo4jSetup().get_graph_stats)
+    except Exception as e:
+        print(f"⚠️ Could not read graph stats: {e}")
+        graph_stats = {"documents": 0, "entities": 0, "relationships": 0}
+    return StatsResponse(**graph_stats, searchCache=search_cache.stats())
+
+NO_DOCUMENTS_MESSAGE = "Please upload and index some documents first before asking questions."
+
+
+@asynccontextmanager
+async def borrow_agent():
+    """
+    Borrow an idle agent, waiting while all chat slots are busy.
+
+    An agent whose run did not complete is discarded instead of returned,
+    since its conversation history may end in the middle of a turn.
+    """
+    async with chat_semaphore:
+        agent = idle_agents.pop() if idle_agents else create_docs_agent()
+        completed = False
+        try:
+            yield agent
+            completed = True
+        finally:
+            if completed:
+                idle_agents.append(agent)
+
+
+def extract_response_text(agent_result) -> str:
+    """
+    Extract the text content from a Strands AgentResult
+    """
+    # Try different possible attributes
+    if hasattr(agent_result, 'data'):
+        response_text = agent_result.data
+    elif hasattr(agent_result, 'content'):
+        response_text = agent_result.content
+    elif hasattr(agent_result, 'output'):
+        response_text = agent_result.output
+    elif hasattr(agent_result, 'text'):
+        response_text = agent_result.text
+    else:
+        # Fallback: convert to string
+        response_text = str(agent_result)
+
+    # Ensure it's a string
+    if not isinstance(response_text, str):
+        response_text = str(response_text)
+    return response_text
+
+
+def has_indexed_documents() -> bool:
+    return document_registry.has_indexed_documents()
+
+
+def assistant_message(content: str) -> dict:
+    return {
+        "id": f"msg_{int(datetime.now().timestamp())}",
+        "role": "assistant",
+        "content": content,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+async def stream_agent_events(message: str):
+    """
+    Run the agent on the event loop through its async streaming interface.
+
+    Yields ("token", text) for every text chunk as it arrives and finally
+    ("result", response_text).
+    """
+    async with borrow_agent() as agent:
+        agent_result = None
+        async for event in agent.stream_async(message):
+            if "data" in event:
+                yield "token", event["data"]
+            elif "result" in event:
+                agent_result = event["result"]
+        yield "result", extract_response_text(agent_result)
+
 
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
@@ -180,74 +370,90 @@ async def chat(request: ChatRequest):
     try:
         print(f"\n=== Chat Request ===")
         print(f"Message: {request.message}")
-        
-        # Check if any documents are indexed
-        indexed_docs = [doc for doc in documents_db if doc["status"] == "indexed"]
-        print(f"Indexed documents: {len(indexed_docs)}")
-        
-        if not indexed_docs:
-            return {
-                "id": f"msg_{int(datetime.now().timestamp())}",
-                "role": "assistant",
-                "content": "Please upload and index some documents first before asking questions.",
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        # Get response from agent - Strands Agent returns an AgentResult object
-        print("Calling docs_agent...")
-        agent_result = docs_agent(request.message)
-        
-        print(f"Agent result type: {type(agent_result)}")
-        print(f"Agent result attributes: {dir(agent_result)}")
-        
-        # Extract the text content from AgentResult
-        response_text = None
-        
-        # Try different possible attributes
-        if hasattr(agent_result, 'data'):
-            response_text = agent_result.data
-            print(f"Using .data attribute")
-        elif hasattr(agent_result, 'content'):
-            response_text = agent_result.content
-            print(f"Using .content attribute")
-        elif hasattr(agent_result, 'output'):
-            response_text = agent_result.output
-            print(f"Using .output attribute")
-        elif hasattr(agent_result, 'text'):
-            response_text = agent_result.text
-            print(f"Using .text attribute")
-        else:
-            # Fallback: convert to string
-            response_text = str(agent_result)
-            print(f"Using str() conversion")
-        
-        # Ensure it's a string
-        if not isinstance(response_text, str):
-            response_text = str(response_text)
-        
+
+        if not has_indexed_documents():
+            return assistant_message(NO_DOCUMENTS_MESSAGE)
+
+        start_time = time.perf_counter()
+        response_text = ""
+        async for kind, value in stream_agent_events(request.message):
+            if kind == "result":
+                response_text = value
+
         print(f"Response text: {response_text[:200]}...")
+        print(f"Chat completed in {time.perf_counter() - start_time:.2f}s")
         print(f"=== End Chat Request ===\n")
-        
-        return {
-            "id": f"msg_{int(datetime.now().timestamp())}",
-            "role": "assistant",
-            "content": response_text,
-            "timestamp": datetime.now().isoformat()
-        }
-        
+
+        return assistant_message(response_text)
+
     except Exception as e:
         import traceback
         error_details = traceback.format_exc()
         print(f"Chat error: {error_details}")  # Log the full error
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Chat with the AI agent, streaming the response as Server-Sent Events.
+
+    Events:
+        token: {"content": <text chunk>} for every chunk as it arrives
+        done: the complete assistant message, plus timing in milliseconds
+        error: {"detail": <error message>}
+    """
+    async def event_stream():
+        if not has_indexed_documents():
+            yield sse_event("done", assistant_message(NO_DOCUMENTS_MESSAGE))
+            return
+
+        start_time = time.perf_counter()
+        first_token_time = None
+        try:
+            async for kind, value in stream_agent_events(request.message):
+                if kind == "token":
+                    if first_token_time is None:
+                        first_token_time = time.perf_counter()
+                    yield sse_event("token", {"content": value})
+                else:
+                    end_time = time.perf_counter()
+                    time_to_first_token_ms = (
+                        (first_token_time - start_time) * 1000
+                        if first_token_time is not None
+                        else None
+                    )
+                    print(
+                        f"Streamed chat completed in {end_time - start_time:.2f}s "
+                        f"(time to first token: {time_to_first_token_ms}ms)"
+                    )
+                    yield sse_event("done", {
+                        **assistant_message(value),
+                        "timeToFirstTokenMs": time_to_first_token_ms,
+                        "durationMs": (end_time - start_time) * 1000,
+                    })
+        except Exception as e:
+            import traceback
+            print(f"Chat stream error: {traceback.format_exc()}")
+            yield sse_event("error", {"detail": f"Error processing chat: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.delete("/api/documents/{doc_id}")
 async def delete_document(doc_id: str):
     """
     Delete a document
     """
-    global documents_db
-    documents_db = [doc for doc in documents_db if doc["id"] != doc_id]
+    await document_registry.remove(doc_id)
+    ingestion_queue.remove(doc_id)
     return {"status": "success", "message": f"Document {doc_id} deleted"}
 
 @app.post("/api/clear")
@@ -279,6 +485,7 @@ async def clear_all():
                     neo4j_tool = get_neo4j_tool()
                     neo4j_tool.reset_retriever()
                     print("✅ Neo4j retriever reset")
+                search_cache.bump_corpus_version()
             else:
                 errors.append("Failed to connect to Neo4j")
                 print("❌ Failed to connect to Neo4j")
@@ -304,26 +511,19 @@ async def clear_all():
             errors.append(f"Memory error: {str(e)}")
             print(f"❌ Memory error: {e}")
         
-        # Clear in-memory documents
+        # Clear documents
         try:
-            print("Clearing in-memory documents...")
-            global documents_db, stats_db
-            documents_db = []
+            print("Clearing documents...")
+            await document_registry.clear()
+            ingestion_queue.clear()
             results["documents_cleared"] = True
             print("✅ Documents cleared")
         except Exception as e:
             errors.append(f"Documents error: {str(e)}")
             print(f"❌ Documents error: {e}")
         
-        # Reset stats
-        try:
-            print("Resetting stats...")
-            stats_db = {"documents": 0, "entities": 0, "relationships": 0}
-            results["stats_reset"] = True
-            print("✅ Stats reset")
-        except Exception as e:
-            errors.append(f"Stats error: {str(e)}")
-            print(f"❌ Stats error: {e}")
+        # Graph stats are stored in the graph and were cleared with it
+        results["stats_reset"] = results["neo4j_cleared"]
         
         success = all(results.values())
         print(f"\n=== Clear All Complete ===")
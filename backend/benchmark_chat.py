@@ -0,0 +1,90 @@
+"""
+Load test for the streaming chat endpoint
+
+Sends chat requests to /api/chat/stream from several concurrent users and
+reports time-to-first-token, total latency and requests per second.
+
+Usage:
+    python benchmark_chat.py [--url URL] [--users N] [--requests N] [--message TEXT]
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_request(url: str, message: str) -> dict:
+    """Send one streaming chat request and time its events"""
+    request = urllib.request.Request(
+        f"{url}/api/chat/stream",
+        data=json.dumps({"message": message}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+
+    start_time = time.perf_counter()
+    first_token_time = None
+    ok = False
+    with urllib.request.urlopen(request) as response:
+        for raw_line in response:
+            line = raw_line.decode().strip()
+            if line == "event: token" and first_token_time is None:
+                first_token_time = time.perf_counter()
+            elif line == "event: done":
+                ok = True
+            elif line == "event: error":
+                ok = False
+    end_time = time.perf_counter()
+
+    return {
+        "ok": ok,
+        "ttft": first_token_time - start_time if first_token_time else None,
+        "latency": end_time - start_time,
+    }
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/chat/stream")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=4, help="Concurrent users")
+    parser.add_argument("--requests", type=int, default=20, help="Total requests")
+    parser.add_argument("--message", default="Summarize the uploaded documents.")
+    args = parser.parse_args()
+
+    print(f"🚀 Sending {args.requests} chat requests from {args.users} concurrent users...")
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as executor:
+        results = list(executor.map(
+            lambda _: run_request(args.url, args.message),
+            range(args.requests),
+        ))
+    elapsed = time.perf_counter() - start_time
+
+    succeeded = [result for result in results if result["ok"]]
+    ttfts = [result["ttft"] for result in succeeded if result["ttft"] is not None]
+    latencies = [result["latency"] for result in succeeded]
+
+    print(f"✅ {len(succeeded)}/{len(results)} requests succeeded in {elapsed:.2f}s")
+    print(f"📈 Throughput: {len(succeeded) / elapsed:.2f} requests/s")
+    if ttfts:
+        print(
+            f"⏱️ Time to first token: median {statistics.median(ttfts) * 1000:.0f}ms, "
+            f"p95 {percentile(ttfts, 0.95) * 1000:.0f}ms"
+        )
+    if latencies:
+        print(
+            f"⏱️ Total latency: median {statistics.median(latencies) * 1000:.0f}ms, "
+            f"p95 {percentile(latencies, 0.95) * 1000:.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
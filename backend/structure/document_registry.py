@@ -0,0 +1,157 @@
+"""
+Durable registry of uploaded documents
+Documents are stored with SQLAlchemy (sqlite by default), so the document
+list and statuses survive restarts, and whether any document is indexed is
+answered from memory.
+"""
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Integer, String, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, mapped_column
+
+INDEXED_STATUS = "indexed"
+
+
+class BaseDocumentRegistry(DeclarativeBase):
+    """Base class for the SQLAlchemy document registry"""
+
+
+class Document(BaseDocumentRegistry):
+    """SQLAlchemy mapping for uploaded documents"""
+
+    __tablename__ = "documents"
+    id = mapped_column(String, primary_key=True)
+    name = mapped_column(String, nullable=False)
+    size = mapped_column(Integer, nullable=False)
+    type = mapped_column(String, nullable=False)
+    status = mapped_column(String, nullable=False)
+    stage = mapped_column(String, nullable=True)
+    uploaded_at = mapped_column(DateTime, nullable=False)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("idx_documents_status", "status"),
+        Index("idx_documents_uploaded_at_id", "uploaded_at", "id"),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "size": self.size,
+            "type": self.type,
+            "status": self.status,
+            "stage": self.stage,
+            "uploadedAt": self.uploaded_at,
+        }
+
+
+class DocumentRegistry:
+    """Registry of uploaded documents and their ingestion status"""
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+        self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
+        # Writes are applied one at a time, in the order they were requested
+        self._write_lock = asyncio.Lock()
+        self._indexed_count = 0
+
+    async def startup(self):
+        async with self._engine.begin() as conn:
+            await conn.run_sync(BaseDocumentRegistry.metadata.create_all)
+        async with self._session_factory() as session:
+            self._indexed_count = await session.scalar(
+                select(func.count()).select_from(Document).where(Document.status == INDEXED_STATUS)
+            )
+
+    async def shutdown(self):
+        await self._engine.dispose()
+
+    def has_indexed_documents(self) -> bool:
+        """Whether any document is indexed, without a database query"""
+        return self._indexed_count > 0
+
+    async def add(self, doc: dict):
+        """Add a document record with id, name, size, type, status, stage and uploadedAt"""
+        async with self._write_lock, self._session_factory() as session:
+            session.add(Document(
+                id=doc["id"],
+                name=doc["name"],
+                size=doc["size"],
+                type=doc["type"],
+                status=doc["status"],
+                stage=doc.get("stage"),
+                uploaded_at=doc["uploadedAt"],
+                updated_at=datetime.now(),
+            ))
+            await session.commit()
+            if doc["status"] == INDEXED_STATUS:
+                self._indexed_count += 1
+
+    async def update_status(self, doc_id: str, status: str, stage: Optional[str] = None) -> bool:
+        """
+        Update the status and ingestion stage of a document
+
+        Returns:
+            bool: False if the document is not registered
+        """
+        async with self._write_lock, self._session_factory() as session:
+            document = await session.get(Document, doc_id)
+            if document is None:
+                return False
+            if document.status != status:
+                self._indexed_count += (status == INDEXED_STATUS) - (document.status == INDEXED_STATUS)
+            document.status = status
+            document.stage = stage
+            document.updated_at = datetime.now()
+            await session.commit()
+            return True
+
+    async def get(self, doc_id: str) -> Optional[dict]:
+        async with self._session_factory() as session:
+            document = await session.get(Document, doc_id)
+            return document.to_dict() if document else None
+
+    async def list(self, offset: int = 0, limit: int = 100, status: Optional[str] = None) -> tuple:
+        """
+        List documents in upload order
+
+        Returns:
+            tuple: (documents on this page, total number of documents)
+        """
+        query = select(Document)
+        count_query = select(func.count()).select_from(Document)
+        if status is not None:
+            query = query.where(Document.status == status)
+            count_query = count_query.where(Document.status == status)
+        query = query.order_by(Document.uploaded_at, Document.id).offset(offset).limit(limit)
+
+        async with self._session_factory() as session:
+            documents = (await session.scalars(query)).all()
+            total = await session.scalar(count_query)
+        return [document.to_dict() for document in documents], total
+
+    async def remove(self, doc_id: str) -> bool:
+        async with self._write_lock, self._session_factory() as session:
+            document = await session.get(Document, doc_id)
+            if document is None:
+                return False
+            await session.delete(document)
+            await session.commit()
+            if document.status == INDEXED_STATUS:
+                self._indexed_count -= 1
+            return True
+
+    async def clear(self):
+        async with self._write_lock, self._session_factory() as session:
+            await session.execute(delete(Document))
+            await session.commit()
+            self._indexed_count = 0
+
+
+def create_document_registry(url: str) -> DocumentRegistry:
+    """Create a registry stored in the database at a SQLAlchemy async URL"""
+    return DocumentRegistry(create_async_engine(url))
@@ -0,0 +1,310 @@
+"""
+Persistent document ingestion queue
+Uploaded documents are recorded in a local sqlite file and processed by a
+fixed pool of workers, so bulk uploads do not start one pipeline per file
+and queued documents survive restarts.
+"""
+import os
+import asyncio
+import sqlite3
+from datetime import datetime
+from typing import Callable, Optional
+
+from structure.neo4j.setup import (
+    create_embedder,
+    create_kg_builder,
+    create_llm,
+    upload,
+)
+
+# Ingestion stages, in the order documents go through them
+QUEUED = "queued"
+CHUNKING = "chunking"
+EMBEDDING = "embedding"
+EXTRACTING = "extracting"
+INDEXED = "indexed"
+ERROR = "error"
+
+IN_PROGRESS_STAGES = (CHUNKING, EMBEDDING, EXTRACTING)
+
+
+class QueueFullError(Exception):
+    """Raised when too many documents are waiting to be ingested"""
+
+
+class IngestionQueue:
+    """
+    Bounded, sqlite-backed queue of documents to ingest into Neo4j
+
+    Workers share one LLM and embedder, and each worker reuses its own
+    knowledge graph pipeline across documents.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        num_workers: int = 2,
+        max_pending: int = 1000,
+        on_stage_change: Optional[Callable[[dict], None]] = None,
+    ):
+        """
+        Args:
+            db_path: Path of the sqlite file holding the queue
+            num_workers: Number of documents processed at the same time
+            max_pending: Maximum number of documents waiting to be processed
+            on_stage_change: Optional callback called with the job record
+                whenever a document changes stage
+        """
+        self.db_path = db_path
+        self.num_workers = max(num_workers, 1)
+        self.max_pending = max_pending
+        self.on_stage_change = on_stage_change
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_jobs (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                type TEXT NOT NULL,
+                path TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                error TEXT,
+                uploaded_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ingestion_jobs_stage "
+            "ON ingestion_jobs (stage, uploaded_at)"
+        )
+        self._conn.commit()
+
+        self._llm = None
+        self._embedder = None
+        self._wakeup = asyncio.Event()
+        self._workers = []
+        self._stopping = False
+
+    async def start(self):
+        """Requeue documents interrupted by a restart and start the workers"""
+        placeholders = ", ".join("?" for _ in IN_PROGRESS_STAGES)
+        cursor = self._conn.execute(
+            f"UPDATE ingestion_jobs SET stage = ?, updated_at = ? "
+            f"WHERE stage IN ({placeholders})",
+            (QUEUED, datetime.now().isoformat(), *IN_PROGRESS_STAGES),
+        )
+        self._conn.commit()
+        if cursor.rowcount:
+            print(f"🔁 Requeued {cursor.rowcount} interrupted document(s)")
+
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(worker_id))
+            for worker_id in range(self.num_workers)
+        ]
+        self._wakeup.set()
+        print(f"👷 Started {self.num_workers} ingestion worker(s)")
+
+    async def stop(self):
+        """Stop the workers; documents being processed are requeued on start"""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def enqueue(self, doc: dict) -> dict:
+        """
+        Queue a document for ingestion
+
+        Args:
+            doc: Document record with id, name, size, type, path and uploadedAt
+
+        Raises:
+            QueueFullError: If max_pending documents are already queued
+        """
+        if self.count_pending() >= self.max_pending:
+            raise QueueFullError(
+                f"Ingestion queue is full ({self.max_pending} documents pending)"
+            )
+
+        now = datetime.now().isoformat()
+        self._conn.execute(
+            "INSERT INTO ingestion_jobs "
+            "(id, name, size, type, path, stage, error, uploaded_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, NULL, ?, ?)",
+            (
+                doc["id"],
+                doc["name"],
+                doc["size"],
+                doc["type"],
+                doc["path"],
+                QUEUED,
+                doc["uploadedAt"].isoformat(),
+                now,
+            ),
+        )
+        self._conn.commit()
+        self._wakeup.set()
+        return self.get_job(doc["id"])
+
+    def count_pending(self) -> int:
+        row = self._conn.execute(
+            "SELECT count(*) FROM ingestion_jobs WHERE stage = ?", (QUEUED,)
+        ).fetchone()
+        return row[0]
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        row = self._conn.execute(
+            "SELECT * FROM ingestion_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return _job_from_row(row) if row else None
+
+    def list_jobs(self) -> list:
+        rows = self._conn.execute(
+            "SELECT * FROM ingestion_jobs ORDER BY uploaded_at, id"
+        ).fetchall()
+        return [_job_from_row(row) for row in rows]
+
+    def status(self) -> dict:
+        """Summarize the queue: stage counts and per-document stages"""
+        counts = {stage: 0 for stage in (QUEUED, *IN_PROGRESS_STAGES, INDEXED, ERROR)}
+        for row in self._conn.execute(
+            "SELECT stage, count(*) FROM ingestion_jobs GROUP BY stage"
+        ):
+            counts[row[0]] = row[1]
+        return {
+            "workers": self.num_workers,
+            "maxPending": self.max_pending,
+            "counts": counts,
+            "documents": self.list_jobs(),
+        }
+
+    def remove(self, job_id: str) -> bool:
+        """Remove a document that is not being processed"""
+        return self._remove_jobs("id = ?", (job_id,)) > 0
+
+    def clear(self):
+        """Remove all documents that are not being processed"""
+        self._remove_jobs("1 = 1", ())
+
+    def _remove_jobs(self, condition: str, params: tuple) -> int:
+        placeholders = ", ".join("?" for _ in IN_PROGRESS_STAGES)
+        where = f"{condition} AND stage NOT IN ({placeholders})"
+        rows = self._conn.execute(
+            f"SELECT id, path, stage FROM ingestion_jobs WHERE {where}",
+            (*params, *IN_PROGRESS_STAGES),
+        ).fetchall()
+        self._conn.execute(
+            f"DELETE FROM ingestion_jobs WHERE {where}",
+            (*params, *IN_PROGRESS_STAGES),
+        )
+        self._conn.commit()
+
+        # Queued documents still have their uploaded file
+        for row in rows:
+            if row["stage"] == QUEUED:
+                _remove_file(row["path"])
+        return len(rows)
+
+    def _claim_next_job(self) -> Optional[dict]:
+        # Workers run on one event loop, so select-then-update cannot race.
+        row = self._conn.execute(
+            "SELECT * FROM ingestion_jobs WHERE stage = ? "
+            "ORDER BY uploaded_at, id LIMIT 1",
+            (QUEUED,),
+        ).fetchone()
+        if row is None:
+            return None
+        self._set_stage(row["id"], CHUNKING)
+        return self.get_job(row["id"])
+
+    def _set_stage(self, job_id: str, stage: str, error: Optional[str] = None):
+        self._conn.execute(
+            "UPDATE ingestion_jobs SET stage = ?, error = ?, updated_at = ? "
+            "WHERE id = ?",
+            (stage, error, datetime.now().isoformat(), job_id),
+        )
+        self._conn.commit()
+
+        job = self.get_job(job_id)
+        if job is not None and self.on_stage_change is not None:
+            try:
+                self.on_stage_change(job)
+            except Exception as e:
+                print(f"⚠️ Stage change callback failed for {job_id}: {e}")
+
+    async def _worker(self, worker_id: int):
+        current_job = {"id": None, "stage": None}
+        kg_builder = None
+
+        def on_stage(stage: str):
+            if current_job["id"] is not None and stage != current_job["stage"]:
+                current_job["stage"] = stage
+                self._set_stage(current_job["id"], stage)
+
+        while not self._stopping:
+            job = self._claim_next_job()
+            if job is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            current_job["id"] = job["id"]
+            current_job["stage"] = job["stage"]
+            try:
+                print(f"📤 Worker {worker_id} processing document {job['id']}: {job['path']}")
+                if kg_builder is None:
+                    if self._llm is None:
+                        self._llm = create_llm()
+                        self._embedder = create_embedder()
+                    kg_builder = create_kg_builder(
+                        self._llm, self._embedder, on_stage=on_stage
+                    )
+
+                success = await upload(
+                    job["path"], kg_builder=kg_builder, document_name=job["name"]
+                )
+                current_job["id"] = None
+                if success:
+                    self._set_stage(job["id"], INDEXED)
+                else:
+                    self._set_stage(job["id"], ERROR, "Document processing failed")
+                _remove_file(job["path"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                current_job["id"] = None
+                print(f"❌ Error processing document {job['id']}: {e}")
+                self._set_stage(job["id"], ERROR, str(e))
+                _remove_file(job["path"])
+            finally:
+                current_job["id"] = None
+
+
+def _job_from_row(row) -> dict:
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "size": row["size"],
+        "type": row["type"],
+        "path": row["path"],
+        "stage": row["stage"],
+        "error": row["error"],
+        "uploadedAt": datetime.fromisoformat(row["uploaded_at"]),
+        "updatedAt": datetime.fromisoformat(row["updated_at"]),
+    }
+
+
+def _remove_file(file_path: str):
+    """Clean up an uploaded file after processing"""
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            print(f"🗑️ Cleaned up uploaded file: {file_path}")
+    except Exception as cleanup_error:
+        print(f"⚠️ Cleanup warning: {cleanup_error}")
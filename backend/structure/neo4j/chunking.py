@@ -0,0 +1,87 @@
+"""
+Document fingerprinting and content-defined chunking
+Chunk boundaries depend on the text around them rather than on fixed
+offsets, so an edit only changes the chunks it touches and later chunks
+keep their hashes.
+"""
+import hashlib
+import zlib
+
+# Separators used to pass precomputed chunks through the pipeline as text
+CHUNK_SEPARATOR = "\x1e"
+INDEX_SEPARATOR = "\x1f"
+
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a chunk of text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def split_into_chunks(text: str, chunk_size: int = 4000, boundary_modulus: int = 16) -> list:
+    """
+    Split text into chunks of at most chunk_size characters at line breaks
+
+    Once a chunk holds at least half of chunk_size, it ends after any line
+    whose checksum is divisible by boundary_modulus, so boundaries move with
+    the content instead of with character offsets.
+    """
+    text = text.replace(CHUNK_SEPARATOR, " ").replace(INDEX_SEPARATOR, " ")
+    min_size = chunk_size // 2
+
+    lines = []
+    for line in text.split("\n"):
+        # Hard-split lines that do not fit in a chunk
+        while len(line) > chunk_size:
+            lines.append(line[:chunk_size])
+            line = line[chunk_size:]
+        lines.append(line)
+
+    chunks = []
+    current = []
+    current_size = 0
+    for line in lines:
+        if current and current_size + len(line) + 1 > chunk_size:
+            chunks.append("\n".join(current))
+            current, current_size = [], 0
+
+        current.append(line)
+        current_size += len(line) + 1
+
+        stripped = line.strip()
+        if (
+            current_size >= min_size
+            and stripped
+            and zlib.crc32(stripped.encode("utf-8")) % boundary_modulus == 0
+        ):
+            chunks.append("\n".join(current))
+            current, current_size = [], 0
+
+    if current:
+        chunks.append("\n".join(current))
+
+    return [chunk for chunk in (chunk.strip() for chunk in chunks) if chunk]
+
+
+def encode_chunks(indexed_chunks: list) -> str:
+    """Encode (index, text) chunks as one text for PrecomputedChunkSplitter"""
+    return CHUNK_SEPARATOR.join(
+        f"{index}{INDEX_SEPARATOR}{text}" for index, text in indexed_chunks
+    )
+
+
+def decode_chunks(text: str) -> list:
+    """Decode text produced by encode_chunks into (index, text) chunks"""
+    indexed_chunks = []
+    for encoded_chunk in text.split(CHUNK_SEPARATOR):
+        index, _, chunk_text = encoded_chunk.partition(INDEX_SEPARATOR)
+        indexed_chunks.append((int(index), chunk_text))
+    return indexed_chunks
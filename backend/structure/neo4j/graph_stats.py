@@ -0,0 +1,182 @@
+"""
+Knowledge graph statistics kept in a metadata node
+Counts are updated incrementally from pipeline results as documents are
+ingested, and periodically reconciled with Neo4j's count store, so reading
+them never scans the graph.
+"""
+import json
+from typing import Optional
+
+import neo4j
+
+STATS_LABEL = "__GraphStats__"
+
+# Lexical graph written by SimpleKGPipeline, counted apart from entities
+CHUNK_LABEL = "Chunk"
+DOCUMENT_LABEL = "Document"
+LEXICAL_RELATIONSHIP_TYPES = ("FROM_CHUNK", "FROM_DOCUMENT", "NEXT_CHUNK")
+
+COUNTERS = ("documents", "chunks", "entities", "relationships")
+
+
+def empty_stats() -> dict:
+    return {**{counter: 0 for counter in COUNTERS}, "labels": {}}
+
+
+def is_entity_label(label: str) -> bool:
+    """Whether nodes with this label are counted as entities"""
+    return not label.startswith("__") and label not in (CHUNK_LABEL, DOCUMENT_LABEL)
+
+
+def read_graph_stats(driver: neo4j.Driver) -> dict:
+    """Read the stored statistics (all zero before the first update)"""
+    records, _, _ = driver.execute_query(
+        f"MATCH (s:{STATS_LABEL} {{id: 'graph'}}) RETURN s",
+        routing_=neo4j.RoutingControl.READ,
+    )
+    if not records:
+        return empty_stats()
+    node = records[0]["s"]
+    return {
+        **{counter: node.get(counter, 0) for counter in COUNTERS},
+        "labels": json.loads(node.get("labels") or "{}"),
+    }
+
+
+def apply_graph_stats_delta(driver: neo4j.Driver, delta: dict):
+    """
+    Add a delta to the stored statistics
+
+    Args:
+        driver: Neo4j driver
+        delta: Changes to the counters, and per label changes under "labels"
+    """
+    def update(tx):
+        # Writing first locks the node, so concurrent updates cannot be lost
+        record = tx.run(
+            f"MERGE (s:{STATS_LABEL} {{id: 'graph'}}) SET s.locked = true RETURN s"
+        ).single()
+        node = record["s"]
+        labels = json.loads(node.get("labels") or "{}")
+        for label, count in delta.get("labels", {}).items():
+            labels[label] = max(labels.get(label, 0) + count, 0)
+        tx.run(
+            f"""
+            MATCH (s:{STATS_LABEL} {{id: 'graph'}})
+            SET s += $counters, s.labels = $labels
+            REMOVE s.locked
+            """,
+            counters={
+                counter: max(node.get(counter, 0) + delta.get(counter, 0), 0)
+                for counter in COUNTERS
+            },
+            labels=json.dumps({label: count for label, count in labels.items() if count}),
+        ).consume()
+
+    with driver.session() as session:
+        session.execute_write(update)
+
+
+def reconcile_graph_stats(driver: neo4j.Driver) -> dict:
+    """
+    Recount the statistics from Neo4j's count store and store them
+
+    Only single-label node counts and single-type relationship counts are
+    used, which Neo4j answers from its count store without a scan.
+    """
+    stats = empty_stats()
+    with driver.session() as session:
+        labels = [record["label"] for record in session.run("CALL db.labels() YIELD label")]
+        for label in labels:
+            if label == STATS_LABEL:
+                continue
+            count = session.run(
+                f"MATCH (n:`{label}`) RETURN count(n) AS count"
+            ).single()["count"]
+            if label == CHUNK_LABEL:
+                stats["chunks"] = count
+            elif label == DOCUMENT_LABEL:
+                stats["documents"] = count
+            elif label == "__Entity__":
+                stats["entities"] = count
+            elif is_entity_label(label) and count:
+                stats["labels"][label] = count
+
+        relationship_types = [
+            record["relationshipType"]
+            for record in session.run("CALL db.relationshipTypes() YIELD relationshipType")
+        ]
+        for relationship_type in relationship_types:
+            if relationship_type in LEXICAL_RELATIONSHIP_TYPES:
+                continue
+            stats["relationships"] += session.run(
+                f"MATCH ()-[r:`{relationship_type}`]->() RETURN count(r) AS count"
+            ).single()["count"]
+
+        session.run(
+            f"""
+            MERGE (s:{STATS_LABEL} {{id: 'graph'}})
+            SET s += $counters, s.labels = $labels
+            """,
+            counters={counter: stats[counter] for counter in COUNTERS},
+            labels=json.dumps(stats["labels"]),
+        ).consume()
+    return stats
+
+
+class PipelineRunStats:
+    """
+    Collects the graph changes reported by a knowledge graph pipeline run
+
+    Register on_event as a pipeline event callback, then call delta() once
+    the run finished.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._writer_metadata: Optional[dict] = None
+        self._resolved_nodes = 0
+
+    async def on_event(self, event):
+        if getattr(event.event_type, "value", None) != "TASK_FINISHED":
+            return
+        payload = getattr(event, "payload", None) or {}
+        task_name = getattr(event, "task_name", None)
+        if task_name == "writer" and payload.get("status") == "SUCCESS":
+            self._writer_metadata = payload.get("metadata") or {}
+        elif task_name == "resolver" and payload.get("number_of_created_nodes") is not None:
+            # Nodes merged into other nodes by entity resolution
+            self._resolved_nodes += max(
+                payload.get("number_of_nodes_to_resolve", 0)
+                - payload["number_of_created_nodes"],
+                0,
+            )
+
+    def delta(self) -> Optional[dict]:
+        """
+        Graph statistics delta of the run, or None if the pipeline did not
+        report per label and per type counts (older neo4j-graphrag versions)
+        """
+        statistics = (self._writer_metadata or {}).get("statistics")
+        if not statistics:
+            return None
+
+        delta = empty_stats()
+        for label, count in statistics.get("nodes_per_label", {}).items():
+            if label == CHUNK_LABEL:
+                delta["chunks"] += count
+            elif label == DOCUMENT_LABEL:
+                delta["documents"] += count
+            elif is_entity_label(label):
+                delta["entities"] += count
+                delta["labels"][label] = count
+        delta["relationships"] = sum(
+            count
+            for relationship_type, count in statistics.get("rel_per_type", {}).items()
+            if relationship_type not in LEXICAL_RELATIONSHIP_TYPES
+        )
+        # Per label counts of merged nodes are unknown until the next reconciliation
+        delta["entities"] -= self._resolved_nodes
+        return delta
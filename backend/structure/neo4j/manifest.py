@@ -0,0 +1,66 @@
+"""
+Local manifest of ingested documents
+Records the file hash and chunk hashes of every ingested document, so that
+re-uploads of unchanged documents are skipped and changed documents only
+re-process the chunks that differ.
+"""
+import os
+import json
+import threading
+from typing import Optional
+
+
+class DocumentManifest:
+    """
+    JSON file mapping document keys to their file and chunk hashes
+
+    Safe to use from several threads: uploads save it from worker threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._documents = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._documents = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not read document manifest {path}: {e}")
+
+    def find_by_file_hash(self, file_hash: str) -> Optional[str]:
+        """Return the key of a document with this file hash, if any"""
+        with self._lock:
+            for document_key, entry in self._documents.items():
+                if entry.get("file_hash") == file_hash:
+                    return document_key
+        return None
+
+    def get_chunk_hashes(self, document_key: str) -> list:
+        with self._lock:
+            return list(self._documents.get(document_key, {}).get("chunk_hashes", []))
+
+    def record(self, document_key: str, file_hash: str, chunk_hashes: list):
+        with self._lock:
+            self._documents[document_key] = {
+                "file_hash": file_hash,
+                "chunk_hashes": list(chunk_hashes),
+            }
+            self._save()
+
+    def remove(self, document_key: str):
+        with self._lock:
+            if self._documents.pop(document_key, None) is not None:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._documents = {}
+            self._save()
+
+    def _save(self):
+        # Write to a temporary file first so a crash never leaves a partial manifest
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._documents, f)
+        os.replace(temp_path, self.path)
@@ -4,12 +4,37 @@ This module handles Neo4j database setup, schema creation, and initial configura
 """
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional
 from dotenv import load_dotenv
 import neo4j
 from neo4j_graphrag.llm import OpenAILLM as LLM
 from neo4j_graphrag.embeddings.openai import OpenAIEmbeddings as Embeddings
 from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+from neo4j_graphrag.experimental.components.pdf_loader import PdfLoader
+from neo4j_graphrag.experimental.components.text_splitters.base import TextSplitter
+from neo4j_graphrag.experimental.components.types import TextChunk, TextChunks
+
+try:
+    from structure.neo4j.chunking import (
+        decode_chunks,
+        encode_chunks,
+        hash_file,
+        hash_text,
+        split_into_chunks,
+    )
+    from structure.neo4j.graph_stats import (
+        PipelineRunStats,
+        apply_graph_stats_delta,
+        read_graph_stats,
+        reconcile_graph_stats,
+    )
+    from structure.neo4j.manifest import DocumentManifest
+except ImportError:
+    # Running this file directly as a script
+    from chunking import decode_chunks, encode_chunks, hash_file, hash_text, split_into_chunks
+    from graph_stats import PipelineRunStats, apply_graph_stats_delta, read_graph_stats, reconcile_graph_stats
+    from manifest import DocumentManifest
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +42,7 @@ load_dotenv()
 class Neo4jSetup:
     _instance: Optional['Neo4jSetup'] = None
     _driver: Optional[neo4j.Driver] = None
+    _manifest: Optional[DocumentManifest] = None
     
     def __new__(cls):
         """Singleton pattern to reuse driver connection"""
@@ -41,6 +67,15 @@ class Neo4jSetup:
                 connection_acquisition_timeout=60
             )
         return Neo4jSetup._driver
+    
+    @property
+    def manifest(self) -> DocumentManifest:
+        """Get or load the manifest of ingested documents"""
+        if Neo4jSetup._manifest is None:
+            Neo4jSetup._manifest = DocumentManifest(
+                os.getenv("DOCUMENT_MANIFEST_PATH", "document_manifest.json")
+            )
+        return Neo4jSetup._manifest
         
     def connect(self):
         """Establish connection to Neo4j database"""
@@ -74,6 +109,7 @@ class Neo4jSetup:
                 count = count_result.single()["count"]
                 
                 if count == 0:
+                    self.manifest.clear()
                     print("✅ Database cleared successfully")
                     return True
                 else:
@@ -85,6 +121,85 @@ class Neo4jSetup:
             traceback.print_exc()
             return False
     
+    def tag_document_chunks(self, document_key: str, chunk_texts: list):
+        """Store content hashes on the chunks of a document, matched by text"""
+        with self.driver.session() as session:
+            session.run(
+                """
+                UNWIND $chunks AS chunk
+                MATCH (c:Chunk {text: chunk.text})-[:FROM_DOCUMENT]->(:Document {path: $document_key})
+                SET c.content_hash = chunk.hash
+                """,
+                chunks=[{"text": text, "hash": hash_text(text)} for text in chunk_texts],
+                document_key=document_key,
+            ).consume()
+    
+    def delete_document_chunks(self, document_key: str, chunk_hashes: list):
+        """
+        Delete chunks of a document by content hash, together with the
+        entities and document nodes that no longer have any chunk
+        """
+        with self.driver.session() as session:
+            # Collect the entities of the deleted chunks, so only those are
+            # checked for remaining chunks instead of scanning every entity
+            result = session.run(
+                """
+                MATCH (c:Chunk)-[:FROM_DOCUMENT]->(:Document {path: $document_key})
+                WHERE c.content_hash IN $chunk_hashes
+                OPTIONAL MATCH (e:__Entity__)-[:FROM_CHUNK]->(c)
+                WITH collect(DISTINCT c) AS chunks, collect(DISTINCT elementId(e)) AS entity_ids
+                FOREACH (c IN chunks | DETACH DELETE c)
+                RETURN entity_ids
+                """,
+                chunk_hashes=list(chunk_hashes),
+                document_key=document_key,
+            )
+            entity_ids = result.single()["entity_ids"]
+            deleted = result.consume().counters.nodes_deleted
+            entity_counters = session.run(
+                """
+                UNWIND $entity_ids AS entity_id
+                MATCH (e:__Entity__)
+                WHERE elementId(e) = entity_id AND NOT (e)-[:FROM_CHUNK]->(:Chunk)
+                DETACH DELETE e
+                """,
+                entity_ids=entity_ids,
+            ).consume().counters
+            document_counters = session.run(
+                """
+                MATCH (d:Document {path: $document_key})
+                WHERE NOT ()-[:FROM_DOCUMENT]->(d)
+                DELETE d
+                """,
+                document_key=document_key,
+            ).consume().counters
+            print(f"🗑️ Deleted {deleted} changed chunk(s) of {document_key}")
+        
+        # Per label counts of deleted entities are fixed by the next reconciliation
+        self.record_graph_stats({
+            "documents": -document_counters.nodes_deleted,
+            "chunks": -deleted,
+            "entities": -entity_counters.nodes_deleted,
+            "relationships": -entity_counters.relationships_deleted,
+        })
+    
+    def get_graph_stats(self) -> dict:
+        """Get document, chunk, entity and relationship counts without scanning the graph"""
+        return read_graph_stats(self.driver)
+    
+    def record_graph_stats(self, delta: dict):
+        """Add a change to the graph statistics"""
+        try:
+            apply_graph_stats_delta(self.driver, delta)
+        except Exception as e:
+            print(f"⚠️ Could not update graph stats: {e}")
+    
+    def reconcile_graph_stats(self) -> dict:
+        """Recount the graph statistics from Neo4j's count store"""
+        stats = reconcile_graph_stats(self.driver)
+        print(f"📊 Graph stats reconciled: {stats}")
+        return stats
+    
     def close(self):
         """Close database connection (only call when shutting down)"""
         if Neo4jSetup._driver:
@@ -92,12 +207,129 @@ class Neo4jSetup:
             Neo4jSetup._driver = None
             print("✅ Neo4j connection closed")
 
-async def upload(file_path: str = None):
+# Pipeline task names mapped to document ingestion stages
+PIPELINE_TASK_STAGES = {
+    "file_loader": "chunking",
+    "pdf_loader": "chunking",
+    "splitter": "chunking",
+    "chunk_embedder": "embedding",
+    "extractor": "extracting",
+    "writer": "extracting",
+    "resolver": "extracting",
+}
+
+def create_llm():
+    """Create the LLM used for entity and relation extraction"""
+    return LLM(
+        model_name="gpt-4o-mini",
+        model_params={
+            "response_format": {"type": "json_object"},
+            "temperature": 0
+        }
+    )
+
+def create_embedder():
+    """Create the embedder used for chunk embeddings"""
+    return Embeddings()
+
+class PrecomputedChunkSplitter(TextSplitter):
+    """
+    Text splitter for chunks already split by upload()
+
+    upload() chunks documents itself to fingerprint every chunk, and passes
+    only new chunks to the pipeline, encoded by encode_chunks.
+    """
+
+    def iter_chunks(self, text: str):
+        for index, chunk_text in decode_chunks(text):
+            yield TextChunk(text=chunk_text, index=index)
+
+    async def run(self, text: str) -> TextChunks:
+        return TextChunks(chunks=list(self.iter_chunks(text)))
+
+def create_kg_builder(llm, embedder, on_stage=None):
+    """
+    Create a knowledge graph pipeline for chunks prepared by upload()
+
+    The pipeline can be reused for many documents, but runs on one document
+    at a time when on_stage is given, since stages are not tagged by document.
+
+    Args:
+        llm: LLM for entity and relation extraction
+        embedder: Embedder for chunk embeddings
+        on_stage: Optional callback called with the stage name
+            ("chunking", "embedding" or "extracting") as the pipeline progresses
+    """
+    setup = Neo4jSetup()
+    kg_builder = SimpleKGPipeline(
+        llm=llm,
+        driver=setup.driver,
+        embedder=embedder,
+        from_file=False,
+        text_splitter=PrecomputedChunkSplitter()
+    )
+    # Graph changes of the current run, read by upload()
+    kg_builder.run_stats = PipelineRunStats()
+    _watch_pipeline_progress(kg_builder, kg_builder.run_stats, on_stage)
+    return kg_builder
+
+def _watch_pipeline_progress(kg_builder, run_stats, on_stage=None):
+    """Collect graph changes, and report pipeline task starts as ingestion stages"""
+    async def callback(event):
+        await run_stats.on_event(event)
+        stage = PIPELINE_TASK_STAGES.get(getattr(event, "task_name", None))
+        if on_stage and stage and getattr(event.event_type, "value", None) == "TASK_STARTED":
+            on_stage(stage)
+
+    pipeline = getattr(getattr(kg_builder, "runner", None), "pipeline", None)
+    event_notifier = getattr(pipeline, "event_notifier", None)
+    if event_notifier is not None:
+        event_notifier.add_callback(callback)
+    elif pipeline is not None and hasattr(pipeline, "callback"):
+        # Older neo4j-graphrag versions take a single pipeline callback
+        pipeline.callback = callback
+    else:
+        print("⚠️ Pipeline progress events are not available")
+
+async def load_document_text(file_path: str) -> str:
+    """Extract the text of a PDF or plain text document"""
+    if file_path.lower().endswith('.pdf'):
+        document = await PdfLoader().run(filepath=file_path)
+        return document.text
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+# Locks held by running uploads, with the number of uploads using each
+_upload_locks: dict = {}
+
+@asynccontextmanager
+async def _upload_lock(key: str):
+    """Serialize uploads sharing a document key or file hash"""
+    entry = _upload_locks.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _upload_locks[key]
+
+async def upload(file_path: str = None, kg_builder=None, document_name: str = None):
     """
     Upload and process document into Neo4j knowledge graph
     
+    Documents are fingerprinted in the local manifest. An unchanged document
+    is skipped, and a changed one only processes the chunks that differ.
+    Concurrent uploads of the same document or the same content run one
+    after the other, so the second one sees the manifest of the first.
+    
     Args:
         file_path: Path to the document file to process
+        kg_builder: Optional pipeline from create_kg_builder to reuse.
+            A new LLM, embedder and pipeline are created if not given.
+        document_name: Name identifying the document across uploads
+            (default: the file name)
     
     Returns:
         bool: True if successful, False otherwise
@@ -116,31 +348,61 @@ async def upload(file_path: str = None):
         return False
     
     try:
-        # Initialize LLM and embedder
-        llm = LLM(
-            model_name="gpt-4o-mini",
-            model_params={
-                "response_format": {"type": "json_object"},
-                "temperature": 0
-            }
-        )
+        document_key = document_name or os.path.basename(file_path)
+        manifest = setup.manifest
+        file_hash = await asyncio.to_thread(hash_file, file_path)
+        
+        # File hash locks are always taken before document key locks
+        async with _upload_lock(f"file:{file_hash}"), _upload_lock(f"document:{document_key}"):
+            # Skip documents whose exact content was already ingested
+            existing_key = manifest.find_by_file_hash(file_hash)
+            if existing_key is not None:
+                print(f"⏭️ Skipping {document_key}: unchanged content already indexed as {existing_key}")
+                return True
         
-        embedder = Embeddings()
+            print(f"📄 Processing document: {file_path}")
+            chunk_texts = split_into_chunks(await load_document_text(file_path))
+            chunk_hashes = [hash_text(text) for text in chunk_texts]
         
-        # Determine if it's a PDF
-        is_pdf = file_path.lower().endswith('.pdf')
+            previous_hashes = set(manifest.get_chunk_hashes(document_key))
+            current_hashes = set(chunk_hashes)
+            stale_hashes = previous_hashes - current_hashes
+            new_chunks = [
+                (index, text)
+                for index, (text, chunk_hash) in enumerate(zip(chunk_texts, chunk_hashes))
+                if chunk_hash not in previous_hashes
+            ]
+            print(
+                f"🧩 {len(chunk_texts)} chunk(s): {len(new_chunks)} new, "
+                f"{len(stale_hashes)} removed, {len(chunk_texts) - len(new_chunks)} unchanged"
+            )
         
-        # Build knowledge graph
-        kg_builder = SimpleKGPipeline(
-            llm=llm,
-            driver=setup.driver,
-            embedder=embedder,
-            from_pdf=is_pdf
-        )
+            if stale_hashes:
+                await asyncio.to_thread(setup.delete_document_chunks, document_key, stale_hashes)
+        
+            if new_chunks:
+                if kg_builder is None:
+                    kg_builder = create_kg_builder(create_llm(), create_embedder())
+            
+                # Build knowledge graph from the new chunks only
+                kg_builder.run_stats.reset()
+                await kg_builder.run_async(file_path=document_key, text=encode_chunks(new_chunks))
+                await asyncio.to_thread(
+                    setup.tag_document_chunks, document_key, [text for _, text in new_chunks]
+                )
+                print("✅ Knowledge graph built successfully")
+            
+                delta = kg_builder.run_stats.delta()
+                if delta is not None:
+                    await asyncio.to_thread(setup.record_graph_stats, delta)
+                else:
+                    # The pipeline did not report what it wrote
+                    try:
+                        await asyncio.to_thread(setup.reconcile_graph_stats)
+                    except Exception as e:
+                        print(f"⚠️ Could not reconcile graph stats: {e}")
         
-        print(f"📄 Processing document: {file_path}")
-        await kg_builder.run_async(file_path=file_path)
-        print("✅ Knowledge graph built successfully")
+            await asyncio.to_thread(manifest.record, document_key, file_hash, chunk_hashes)
         
         # Ensure vector index exists
         _ensure_vector_index(setup.driver)
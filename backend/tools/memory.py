@@ -1,120 +1,213 @@
 """
 MemMachine Memory Tool for Strands Agent
+
+All requests go through one pooled MemMachine client. Server availability
+and the project are checked once instead of on every call, and stored
+memories are sent in batches.
 """
 import os
+import time
+import threading
 import requests
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from dotenv import load_dotenv
 from strands import tool
 
+if TYPE_CHECKING:
+    from memmachine.rest_client import MemMachineClient
+
 load_dotenv()
 
 MEMMACHINE_URL = os.getenv("MEMMACHINE_URL", "http://localhost:8080")
 MEMMACHINE_API_KEY = os.getenv("MEMMACHINE_API_KEY", "")
 
+# Messages sent in one /memories call, and seconds a message may wait for a batch
+MEMORY_BATCH_SIZE = max(int(os.getenv("MEMORY_BATCH_SIZE", "8")), 1)
+MEMORY_FLUSH_INTERVAL = float(os.getenv("MEMORY_FLUSH_INTERVAL", "2"))
+# Times a batch is sent before its messages are dropped
+MEMORY_MAX_ATTEMPTS = max(int(os.getenv("MEMORY_MAX_ATTEMPTS", "3")), 1)
+
+# Seconds before checking again whether an unavailable server came back
+HEALTH_RETRY_INTERVAL = 30
+
 DEFAULT_ORG_ID = "knowledgeforge"
 DEFAULT_PROJECT_ID = "default"
 
-# Check if MemMachine is available
-try:
-    response = requests.get(f"{MEMMACHINE_URL}/api/v2/health", timeout=5)
-    MEMMACHINE_AVAILABLE = response.status_code == 200
-    if MEMMACHINE_AVAILABLE:
-        print("✓ MemMachine server is available")
-except Exception as e:
-    MEMMACHINE_AVAILABLE = False
-    print(f"⚠️  MemMachine server not available: {e}")
+_client: Optional["MemMachineClient"] = None
+_available: Optional[bool] = None
+_checked_at = 0.0
+_project_ready = False
+# Messages not sent yet, with the number of failed attempts to send each
+_pending_messages: List[Tuple[Dict[str, Any], int]] = []
+_flush_timer: Optional[threading.Timer] = None
+_lock = threading.Lock()
 
-def _get_headers() -> Dict[str, str]:
-    """Get headers for API requests"""
-    headers = {"Content-Type": "application/json"}
-    if MEMMACHINE_API_KEY:
-        headers["Authorization"] = f"Bearer {MEMMACHINE_API_KEY}"
-    return headers
+def _get_client() -> "MemMachineClient":
+    """Get the shared client, whose session keeps connections alive"""
+    global _client
+    with _lock:
+        if _client is None:
+            # Imported on first use, since importing memmachine is slow
+            from memmachine.rest_client import MemMachineClient
+            _client = MemMachineClient(
+                api_key=MEMMACHINE_API_KEY or None,
+                base_url=MEMMACHINE_URL,
+                timeout=10,
+                max_retries=1
+            )
+        return _client
+
+def _is_available() -> bool:
+    """Check if MemMachine is available, probing the server only when needed"""
+    global _available, _checked_at
+    if _available or (
+        _available is False and time.monotonic() - _checked_at < HEALTH_RETRY_INTERVAL
+    ):
+        return _available
+    
+    try:
+        response = _get_client().request("GET", f"{MEMMACHINE_URL}/api/v2/health", timeout=5)
+        _available = response.status_code == 200
+        if _available:
+            print("✓ MemMachine server is available")
+    except Exception as e:
+        _available = False
+        print(f"⚠️  MemMachine server not available: {e}")
+    _checked_at = time.monotonic()
+    return _available
 
 def _ensure_project() -> bool:
-    """Ensure the project exists, create if it doesn't"""
-    if not MEMMACHINE_AVAILABLE:
+    """Ensure the project exists, create if it doesn't (checked once)"""
+    global _project_ready
+    if _project_ready:
+        return True
+    if not _is_available():
         return False
     
     try:
-        # Try to get the project
-        response = requests.post(
-            f"{MEMMACHINE_URL}/api/v2/projects/get",
-            json={"org_id": DEFAULT_ORG_ID, "project_id": DEFAULT_PROJECT_ID},
-            headers=_get_headers(),
-            timeout=10
+        _get_client().get_or_create_project(
+            org_id=DEFAULT_ORG_ID,
+            project_id=DEFAULT_PROJECT_ID,
+            description="KnowledgeForge document analysis project"
         )
-        if response.status_code == 200:
-            return True
-        
-        # Project doesn't exist, create it
-        response = requests.post(
-            f"{MEMMACHINE_URL}/api/v2/projects",
-            json={
-                "org_id": DEFAULT_ORG_ID,
-                "project_id": DEFAULT_PROJECT_ID,
-                "description": "KnowledgeForge document analysis project"
-            },
-            headers=_get_headers(),
-            timeout=10
-        )
-        return response.status_code in [200, 201]
+        _project_ready = True
+        return True
     except Exception as e:
         print(f"Warning: Could not ensure project: {e}")
         return False
 
-@tool
-def store_memory(content: str, user_id: str = "default_user", agent_id: str = "docs_agent") -> str:
-    """Store a memory in MemMachine for later retrieval"""
-    if not MEMMACHINE_AVAILABLE:
-        return "Memory storage unavailable: MemMachine server not available"
+def _post_memories(messages: List[Dict[str, Any]]) -> requests.Response:
+    return _get_client().request(
+        "POST",
+        f"{MEMMACHINE_URL}/api/v2/memories",
+        json={
+            "org_id": DEFAULT_ORG_ID,
+            "project_id": DEFAULT_PROJECT_ID,
+            "types": ["episodic", "semantic"],
+            "messages": messages
+        }
+    )
+
+def _schedule_flush():
+    """Start the flush timer if it is not running (call with _lock held)"""
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = threading.Timer(MEMORY_FLUSH_INTERVAL, flush_memories)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+def _requeue_memories(entries: List[Tuple[Dict[str, Any], int]]):
+    """Put back messages that failed to send, dropping those out of attempts"""
+    global _pending_messages
+    retry = [(message, attempts + 1) for message, attempts in entries if attempts + 1 < MEMORY_MAX_ATTEMPTS]
+    if len(retry) < len(entries):
+        print(f"⚠️ Dropped {len(entries) - len(retry)} memories after {MEMORY_MAX_ATTEMPTS} attempts")
+    if not retry:
+        return
+    with _lock:
+        # Failed messages go first to keep the order they were stored in
+        _pending_messages = retry + _pending_messages
+        _schedule_flush()
+
+def flush_memories() -> bool:
+    """
+    Send buffered memories to MemMachine in one request
+    
+    Messages that fail to send are queued again, up to MEMORY_MAX_ATTEMPTS
+    attempts, and retried by the flush timer.
+    
+    Returns:
+        bool: True if there was nothing to send or sending succeeded
+    """
+    global _pending_messages, _flush_timer
+    with _lock:
+        entries, _pending_messages = _pending_messages, []
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    if not entries:
+        return True
     
     if not _ensure_project():
-        return "Failed to ensure project exists"
+        print(f"⚠️ Could not send {len(entries)} memories: project unavailable")
+        _requeue_memories(entries)
+        return False
     
     try:
-        response = requests.post(
-            f"{MEMMACHINE_URL}/api/v2/memories",
-            json={
-                "org_id": DEFAULT_ORG_ID,
-                "project_id": DEFAULT_PROJECT_ID,
-                "types": ["episodic", "semantic"],
-                "messages": [{
-                    "content": content,
-                    "producer": user_id,
-                    "produced_for": agent_id,
-                    "role": "user",
-                    "metadata": {
-                        "user_id": user_id,
-                        "agent_id": agent_id
-                    }
-                }]
-            },
-            headers=_get_headers(),
-            timeout=10
-        )
-        
+        response = _post_memories([message for message, _ in entries])
         if response.status_code in [200, 201]:
-            return f"✓ Memory stored for user: {user_id}"
-        else:
-            return f"Failed to store memory: {response.status_code} - {response.text}"
+            print(f"✓ Stored {len(entries)} memories")
+            return True
+        print(f"Failed to store memories: {response.status_code} - {response.text}")
     except Exception as e:
-        return f"Failed to store memory: {str(e)}"
+        print(f"Failed to store memories: {str(e)}")
+    _requeue_memories(entries)
+    return False
+
+@tool
+def store_memory(content: str, user_id: str = "default_user", agent_id: str = "docs_agent") -> str:
+    """Store a memory in MemMachine for later retrieval"""
+    if not _is_available():
+        return "Memory storage unavailable: MemMachine server not available"
+    
+    message = {
+        "content": content,
+        "producer": user_id,
+        "produced_for": agent_id,
+        "role": "user",
+        "metadata": {
+            "user_id": user_id,
+            "agent_id": agent_id
+        }
+    }
+    with _lock:
+        _pending_messages.append((message, 0))
+        batch_full = len(_pending_messages) >= MEMORY_BATCH_SIZE
+        if not batch_full:
+            _schedule_flush()
+    
+    # Memories are sent in batches, so the memory is only queued here
+    if batch_full and not flush_memories():
+        return f"Memory queued for user: {user_id} (MemMachine did not accept it yet, retrying)"
+    return f"✓ Memory queued for user: {user_id}"
 
 @tool
 def retrieve_memories(query: str, user_id: str = "default_user", agent_id: str = "docs_agent", limit: int = 5) -> str:
     """Search and retrieve relevant memories based on a query"""
-    if not MEMMACHINE_AVAILABLE:
+    if not _is_available():
         return "Memory retrieval unavailable: MemMachine server not available"
     
+    # Make memories stored so far searchable
+    flush_memories()
+    
     if not _ensure_project():
         return "Failed to ensure project exists"
     
     try:
         filter_str = f"metadata.user_id={user_id}"
         
-        response = requests.post(
+        response = _get_client().request(
+            "POST",
             f"{MEMMACHINE_URL}/api/v2/memories/search",
             json={
                 "org_id": DEFAULT_ORG_ID,
@@ -123,9 +216,7 @@ def retrieve_memories(query: str, user_id: str = "default_user", agent_id: str =
                 "filter": filter_str,
                 "top_k": limit,
                 "types": ["episodic", "semantic"]
-            },
-            headers=_get_headers(),
-            timeout=10
+            }
         )
         
         if response.status_code == 200:
@@ -170,7 +261,12 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
     Returns:
         Dictionary with success status and message
     """
-    if not MEMMACHINE_AVAILABLE:
+    global _pending_messages, _project_ready
+    with _lock:
+        # Memories not sent yet are cleared too
+        _pending_messages = []
+    
+    if not _is_available():
         print("⚠️ MemMachine server not available - skipping memory clear")
         return {
             "success": True,
@@ -181,11 +277,11 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
     try:
         # First check if project exists
         print(f"Checking if project exists: {DEFAULT_ORG_ID}/{DEFAULT_PROJECT_ID}")
-        project_response = requests.post(
+        client = _get_client()
+        project_response = client.request(
+            "POST",
             f"{MEMMACHINE_URL}/api/v2/projects/get",
-            json={"org_id": DEFAULT_ORG_ID, "project_id": DEFAULT_PROJECT_ID},
-            headers=_get_headers(),
-            timeout=10
+            json={"org_id": DEFAULT_ORG_ID, "project_id": DEFAULT_PROJECT_ID}
         )
         
         if project_response.status_code != 200:
@@ -199,14 +295,13 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
         # Try to delete the entire project to clear all memories
         print(f"Attempting to delete project: {DEFAULT_ORG_ID}/{DEFAULT_PROJECT_ID}")
         
-        response = requests.delete(
+        response = client.request(
+            "DELETE",
             f"{MEMMACHINE_URL}/api/v2/projects",
             json={
                 "org_id": DEFAULT_ORG_ID,
                 "project_id": DEFAULT_PROJECT_ID
-            },
-            headers=_get_headers(),
-            timeout=10
+            }
         )
         
         print(f"Delete project response: {response.status_code}")
@@ -216,6 +311,7 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
         if response.status_code in [200, 204]:
             # Recreate the project for future use
             print("✅ Project deleted, recreating for future use...")
+            _project_ready = False
             _ensure_project()
             return {
                 "success": True,
@@ -224,16 +320,15 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
         else:
             # If delete doesn't work, try the episodic delete endpoint
             print("Trying episodic delete endpoint as fallback...")
-            response = requests.delete(
+            response = client.request(
+                "DELETE",
                 f"{MEMMACHINE_URL}/api/v2/memories/episodic",
                 json={
                     "org_id": DEFAULT_ORG_ID,
                     "project_id": DEFAULT_PROJECT_ID,
                     "user_id": user_id,
                     "agent_id": agent_id
-                },
-                headers=_get_headers(),
-                timeout=10
+                }
             )
             
             print(f"Episodic delete response: {response.status_code}")
@@ -266,3 +361,18 @@ def clear_all_memories(user_id: str = "default_user", agent_id: str = "docs_agen
             "success": False,
             "message": f"Failed to clear memories: {str(e)}"
         }
+
+def close_memory_client():
+    """Send buffered memories and close the client's connections"""
+    global _client, _pending_messages, _flush_timer
+    flush_memories()
+    with _lock:
+        if _pending_messages:
+            print(f"⚠️ Dropped {len(_pending_messages)} memories not sent before shutdown")
+            _pending_messages = []
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if _client is not None:
+            _client.close()
+            _client = None
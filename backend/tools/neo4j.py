@@ -1,10 +1,20 @@
 """
 Neo4j Vector Retrieval Tool for Strands Agent
 Provides vector search capabilities using Neo4j GraphRAG
+
+The agent tool retrieves the top matching chunks with the async Neo4j
+driver and returns them as is, so the agent's own model writes the answer
+instead of a second LLM call per lookup.
 """
 import os
-from typing import Dict, Any, Optional
+import re
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
+import numpy as np
 import neo4j
 from neo4j_graphrag.llm import OpenAILLM as LLM
 from neo4j_graphrag.embeddings.openai import OpenAIEmbeddings as Embeddings
@@ -15,6 +25,159 @@ from strands import tool
 # Load environment variables
 load_dotenv()
 
+VECTOR_INDEX_NAME = "text_embeddings"
+
+# Top chunks with the document they come from
+CHUNK_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes($index_name, $top_k, $embedding)
+YIELD node, score
+OPTIONAL MATCH (node)-[:FROM_DOCUMENT]->(document:Document)
+RETURN elementId(node) AS chunk_id, node.text AS text, score, document.path AS source
+ORDER BY score DESC
+"""
+
+# Relationships between the entities extracted from each chunk
+GRAPH_EXPANSION_QUERY = """
+UNWIND $chunk_ids AS chunk_id
+MATCH (chunk:Chunk)<-[:FROM_CHUNK]-(entity:__Entity__)
+WHERE elementId(chunk) = chunk_id
+MATCH (entity)-[relation]-(neighbor:__Entity__)
+WITH chunk_id, startNode(relation) AS source, relation, endNode(relation) AS target
+WITH chunk_id, collect(DISTINCT
+    coalesce(source.name, source.id) + " -[" + type(relation) + "]-> " + coalesce(target.name, target.id)
+) AS relations
+RETURN chunk_id, relations[..$max_relations] AS relations
+"""
+
+def normalize_query(query: str) -> str:
+    """Normalize case, whitespace and trailing punctuation of a query"""
+    return re.sub(r"\s+", " ", query).strip().rstrip("?!.").strip().lower()
+
+class SearchResultCache:
+    """
+    LRU cache of knowledge base search results
+    
+    Results are found by normalized query, or by a previous query whose
+    embedding is similar enough. All entries belong to one corpus version,
+    and bumping the version (after an upload or clear) drops them.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600, similarity_threshold: float = 0.95):
+        """
+        Args:
+            max_entries: Maximum number of cached results (0 disables the cache)
+            ttl_seconds: Seconds a result stays valid
+            similarity_threshold: Minimum cosine similarity between query
+                embeddings to reuse a result (above 1 disables similarity lookup)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.corpus_version = 0
+        
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._exact_hits = 0
+        self._similar_hits = 0
+        self._misses = 0
+        self._saved_seconds = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+    
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached result by normalized query and search options"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                return None
+            self._entries.move_to_end(key)
+            self._exact_hits += 1
+            self._saved_seconds += entry["embed_seconds"] + entry["search_seconds"]
+            return entry["result"]
+    
+    def get_similar(self, key: tuple, embedding: list) -> Optional[Dict[str, Any]]:
+        """Get the cached result of the most similar query with the same search options"""
+        if self.similarity_threshold > 1:
+            return None
+        query_vector = _unit_vector(embedding)
+        with self._lock:
+            best_key, best_similarity = None, self.similarity_threshold
+            for entry_key, entry in self._entries.items():
+                if entry_key[1:] != key[1:] or self._is_expired(entry):
+                    continue
+                similarity = float(np.dot(query_vector, entry["embedding"]))
+                if similarity >= best_similarity:
+                    best_key, best_similarity = entry_key, similarity
+            if best_key is None:
+                return None
+            entry = self._entries[best_key]
+            self._entries.move_to_end(best_key)
+            self._similar_hits += 1
+            self._saved_seconds += entry["search_seconds"]
+            return entry["result"]
+    
+    def put(
+        self,
+        key: tuple,
+        embedding: list,
+        result: Dict[str, Any],
+        corpus_version: int,
+        embed_seconds: float,
+        search_seconds: float
+    ):
+        """Cache a result, unless the corpus changed while it was computed"""
+        with self._lock:
+            self._misses += 1
+            if not self.enabled or corpus_version != self.corpus_version:
+                return
+            self._entries[key] = {
+                "result": result,
+                "embedding": _unit_vector(embedding),
+                "created_at": time.monotonic(),
+                "embed_seconds": embed_seconds,
+                "search_seconds": search_seconds
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def bump_corpus_version(self):
+        """Invalidate all cached results after the documents changed"""
+        with self._lock:
+            self.corpus_version += 1
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._exact_hits + self._similar_hits
+            lookups = hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "corpusVersion": self.corpus_version,
+                "hits": hits,
+                "similarHits": self._similar_hits,
+                "misses": self._misses,
+                "hitRate": hits / lookups if lookups else 0.0,
+                "savedLatencyMs": round(self._saved_seconds * 1000)
+            }
+    
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return time.monotonic() - entry["created_at"] > self.ttl_seconds
+
+def _unit_vector(embedding: list) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+# Shared by all searches; invalidated by the API on upload completion and clear
+search_cache = SearchResultCache(
+    max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "256")),
+    ttl_seconds=float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "600")),
+    similarity_threshold=float(os.getenv("SEARCH_CACHE_SIMILARITY", "0.95"))
+)
+
 class Neo4jVectorTool:
     _instance: Optional['Neo4jVectorTool'] = None
     
@@ -50,6 +213,11 @@ class Neo4jVectorTool:
         self.vector_retriever = None
         self.rag = None
         
+        # Async drivers for chunk retrieval, one per event loop since async
+        # drivers cannot be shared across loops, all closed by aclose()
+        self._async_drivers = {}
+        self._index_ready = False
+        
         self._initialized = True
         print("✅ Neo4j driver initialized")
     
@@ -126,10 +294,149 @@ class Neo4jVectorTool:
                 "success": False
             }
     
+    def _get_async_driver(self) -> neo4j.AsyncDriver:
+        """Get the async driver for the running event loop"""
+        loop = asyncio.get_running_loop()
+        driver = self._async_drivers.get(loop)
+        if driver is None:
+            # Drivers of closed loops can no longer be used or closed
+            for closed_loop in [old for old in self._async_drivers if old.is_closed()]:
+                del self._async_drivers[closed_loop]
+            driver = neo4j.AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                max_connection_lifetime=3600,
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=60
+            )
+            self._async_drivers[loop] = driver
+        return driver
+    
+    async def _ensure_vector_index(self, driver: neo4j.AsyncDriver) -> bool:
+        """Check once that the vector index exists (until the next reset)"""
+        if self._index_ready:
+            return True
+        records, _, _ = await driver.execute_query(
+            "SHOW INDEXES YIELD name WHERE name = $name RETURN name",
+            name=VECTOR_INDEX_NAME,
+            routing_=neo4j.RoutingControl.READ
+        )
+        self._index_ready = bool(records)
+        if not self._index_ready:
+            print(f"⚠️ Vector index '{VECTOR_INDEX_NAME}' not found. Please upload documents first.")
+        return self._index_ready
+    
+    async def search_chunks(
+        self,
+        query: str,
+        top_k: int = 5,
+        expand_graph: bool = False,
+        max_relations: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Retrieve the chunks most similar to a query, without generating an answer
+        
+        Args:
+            query: Search query string
+            top_k: Number of top chunks to return
+            expand_graph: Whether to add the relationships of the entities
+                extracted from each chunk
+            max_relations: Maximum number of relationships per chunk
+            
+        Returns:
+            Dictionary with the chunks (text, score, source and relations)
+        """
+        try:
+            driver = self._get_async_driver()
+            if not await self._ensure_vector_index(driver):
+                return {
+                    "error": "No documents indexed yet. Please upload documents first.",
+                    "query": query,
+                    "success": False
+                }
+            
+            cache_key = (normalize_query(query), top_k, expand_graph, max_relations)
+            if search_cache.enabled:
+                cached = search_cache.get(cache_key)
+                if cached is not None:
+                    print(f"⚡ Cache hit for: {query}")
+                    return {**cached, "query": query, "cached": True}
+            corpus_version = search_cache.corpus_version
+            
+            print(f"🔍 Searching Neo4j chunks for: {query} (top_k={top_k})")
+            
+            # The embedder client is synchronous, so keep it off the event loop
+            start_time = time.perf_counter()
+            embedding = await asyncio.to_thread(self.embedder.embed_query, query)
+            embed_seconds = time.perf_counter() - start_time
+            
+            if search_cache.enabled:
+                cached = search_cache.get_similar(cache_key, embedding)
+                if cached is not None:
+                    print(f"⚡ Similar query cache hit for: {query}")
+                    return {**cached, "query": query, "cached": True}
+            
+            start_time = time.perf_counter()
+            records, _, _ = await driver.execute_query(
+                CHUNK_SEARCH_QUERY,
+                index_name=VECTOR_INDEX_NAME,
+                top_k=top_k,
+                embedding=embedding,
+                routing_=neo4j.RoutingControl.READ
+            )
+            chunks = [
+                {
+                    "id": record["chunk_id"],
+                    "text": record["text"],
+                    "score": record["score"],
+                    "source": record["source"],
+                    "relations": []
+                }
+                for record in records
+            ]
+            
+            if expand_graph and chunks:
+                chunks_by_id = {chunk["id"]: chunk for chunk in chunks}
+                records, _, _ = await driver.execute_query(
+                    GRAPH_EXPANSION_QUERY,
+                    chunk_ids=list(chunks_by_id),
+                    max_relations=max_relations,
+                    routing_=neo4j.RoutingControl.READ
+                )
+                for record in records:
+                    chunks_by_id[record["chunk_id"]]["relations"] = record["relations"]
+            
+            print(f"✅ Retrieved {len(chunks)} chunk(s)")
+            
+            result = {
+                "chunks": chunks,
+                "query": query,
+                "success": True
+            }
+            if search_cache.enabled:
+                search_cache.put(
+                    cache_key,
+                    embedding,
+                    result,
+                    corpus_version,
+                    embed_seconds=embed_seconds,
+                    search_seconds=time.perf_counter() - start_time
+                )
+            return result
+            
+        except Exception as e:
+            print(f"❌ Chunk search failed: {str(e)}")
+            return {
+                "error": f"Search failed: {str(e)}",
+                "query": query,
+                "success": False
+            }
+    
     def reset_retriever(self):
         """Reset the retriever and RAG instances (call after clearing database)"""
         self.vector_retriever = None
         self.rag = None
+        self._index_ready = False
         print("🔄 Neo4j retriever reset")
     
     def close(self):
@@ -137,6 +444,21 @@ class Neo4jVectorTool:
         if self.driver:
             self.driver.close()
             print("🔌 Neo4j connection closed")
+    
+    async def aclose(self):
+        """Close the async Neo4j connections, each on the loop that used it"""
+        current_loop = asyncio.get_running_loop()
+        drivers, self._async_drivers = self._async_drivers, {}
+        for loop, driver in drivers.items():
+            try:
+                if loop is current_loop:
+                    await driver.close()
+                elif loop.is_running():
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(driver.close(), loop)
+                    )
+            except Exception as e:
+                print(f"⚠️ Could not close async Neo4j driver: {e}")
 
 # Global singleton instance - initialized once at module load
 _neo4j_tool_instance = None
@@ -148,22 +470,38 @@ def get_neo4j_tool() -> Neo4jVectorTool:
         _neo4j_tool_instance = Neo4jVectorTool()
     return _neo4j_tool_instance
 
+def format_chunks(chunks: List[Dict[str, Any]]) -> str:
+    """Format retrieved chunks as numbered, cited passages"""
+    passages = []
+    for number, chunk in enumerate(chunks, start=1):
+        passage = f"[{number}] Source: {chunk['source'] or 'unknown'} (score: {chunk['score']:.3f})\n{chunk['text']}"
+        if chunk["relations"]:
+            passage += "\nRelated facts:\n" + "\n".join(f"- {relation}" for relation in chunk["relations"])
+        passages.append(passage)
+    return "\n\n".join(passages)
+
 @tool
-def search_knowledge_base(query: str, top_k: int = 5) -> str:
+async def search_knowledge_base(query: str, top_k: int = 5, expand_graph: bool = False) -> str:
     """
     Search the knowledge base using vector similarity
     
+    Returns the most relevant passages of the uploaded documents with their
+    source document, to be used to answer the question.
+    
     Args:
         query: The search query
-        top_k: Number of top results to return (default: 5)
+        top_k: Number of top passages to return (default: 5)
+        expand_graph: Also return facts linking the entities mentioned in each
+            passage (default: False)
         
     Returns:
-        String containing the search results and answer
+        String containing the matching passages
     """
     neo4j_tool = get_neo4j_tool()
-    result = neo4j_tool.search_documents(query, top_k)
+    result = await neo4j_tool.search_chunks(query, top_k, expand_graph=expand_graph)
     
-    if result.get("success"):
-        return f"Query: {result['query']}\n\nAnswer: {result['answer']}"
-    else:
+    if not result.get("success"):
         return f"Search failed: {result.get('error', 'Unknown error')}"
+    if not result["chunks"]:
+        return f"Query: {result['query']}\n\nNo matching passages found."
+    return f"Query: {result['query']}\n\n{format_chunks(result['chunks'])}"